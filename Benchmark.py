@@ -0,0 +1,321 @@
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+
+import Board
+from Board import BoardLogic, BoardStorage, BoardStructure, DefaultEnumerationLimit, LineEncoding, TieBreak, VerboseLevel
+from PuzzleFiles import BuildPuzzle, LoadPuzzleFile, PuzzleCorpus
+from Puzzles import PUZZLES
+
+#
+# The benchmark runner. It replaces the hand written timing that used to be in the __main__ of Board.py.
+# Every puzzle in the registry is run with every chosen algorithm. The warmup runs are thrown away, and the timed repeats
+# record board construction and solving separately. The median and p95 of both are reported, and printing is kept
+# out of the timed area. One more run is made under tracemalloc to find the peak memory of building and solving the board,
+# since tracing slows everything down too much to do it while timing. The search statistics are gathered the same way, in a run
+# of their own, so the timed repeats never pay for them.
+# A run can be saved as JSON, and the compare mode diffs two saved runs and flags regressions.
+#
+
+# Each algorithm takes a fresh BoardLogic and solves it
+def RunBacktracking(solver):
+    solver.Solve(VerboseLevel.SILENT, None)
+
+def RunOurAlgorithm(solver):
+    solver.ourAlgorithm()
+    solver.Solve(VerboseLevel.SILENT, None)
+
+def RunInPlace(solver):
+    solver.SolveInPlace(VerboseLevel.SILENT, None)
+
+def RunFixpoint(solver):
+    solver.SolveFromFixpoint(VerboseLevel.SILENT)
+
+def RunProbing(solver):
+    solver.SolveFromFixpoint(VerboseLevel.SILENT, True)
+
+def RunNogoods(solver):
+    solver.EnableNogoods()
+    solver.SolveInPlace(VerboseLevel.SILENT, None)
+
+def RunSat(solver):
+    solver.SolveSat()
+
+ALGORITHMS = {
+    "backtracking": RunBacktracking,
+    "ourAlgorithm": RunOurAlgorithm,
+    "inplace": RunInPlace,
+    "fixpoint": RunFixpoint,
+    "probing": RunProbing,
+    "nogoods": RunNogoods,
+    "sat": RunSat,
+}
+
+# The algorithms whose node count is the number of SAT decisions instead of search nodes, which are not comparable
+DECISION_COUNTS = {"sat"}
+
+# Nearest rank percentile of a list of samples
+def Percentile(samples, percent):
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * percent // 100))
+    return ordered[int(rank) - 1]
+
+def Summarize(samples):
+    ordered = sorted(samples)
+    middle = len(ordered) // 2
+    median = ordered[middle]
+    if(len(ordered) % 2 == 0):
+        median = (ordered[middle - 1] + ordered[middle]) / 2
+    return {"median": median, "p95": Percentile(ordered, 95), "min": ordered[0], "max": ordered[-1], "mean": sum(ordered) / len(ordered)}
+
+# Builds and solves the puzzle once, returning the build time and solve time in nanoseconds along with the solver
+def TimeOnce(algorithm, puzzle, encoding, enumerationLimit, storage, tieBreak, clearCache):
+    if(clearCache and Board.SharedCandidateCache != None):
+        Board.SharedCandidateCache.Clear()
+    t0 = time.perf_counter_ns()
+    solver = BoardLogic(BoardStructure(puzzle, None, encoding, enumerationLimit, storage, tieBreak))
+    t1 = time.perf_counter_ns()
+    algorithm(solver)
+    t2 = time.perf_counter_ns()
+    return (t1 - t0, t2 - t1, solver)
+
+# Builds and solves the puzzle once under tracemalloc, returning the most memory it held at once in bytes
+def MeasurePeakMemory(algorithm, puzzle, encoding, enumerationLimit, storage, tieBreak, clearCache):
+    if(clearCache and Board.SharedCandidateCache != None):
+        Board.SharedCandidateCache.Clear()
+    tracemalloc.start()
+    algorithm(BoardLogic(BoardStructure(puzzle, None, encoding, enumerationLimit, storage, tieBreak)))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+# Builds and solves the puzzle once with a SolveStats attached, and returns it as a dict
+def CollectStats(algorithm, puzzle, encoding, enumerationLimit, storage, tieBreak, clearCache):
+    if(clearCache and Board.SharedCandidateCache != None):
+        Board.SharedCandidateCache.Clear()
+    solver = BoardLogic(BoardStructure(puzzle, None, encoding, enumerationLimit, storage, tieBreak))
+    stats = solver.EnableStats()
+    algorithm(solver)
+    return stats.ToDict()
+
+# puzzles is an iterable of (name, columnRules, rowRules), so a corpus can be streamed through without loading all of it
+def RunBenchmark(puzzles, algorithmNames, repeats, warmup, encoding, enumerationLimit, storage, clearCache, measureMemory, collectStats = False,
+                 tieBreak = TieBreak.LINE_ORDER):
+    results = {}
+    for puzzleName, columnRules, rowRules in puzzles:
+        puzzle = BuildPuzzle(columnRules, rowRules)
+        for algorithmName in algorithmNames:
+            algorithm = ALGORITHMS[algorithmName]
+            for i in range(warmup):
+                TimeOnce(algorithm, puzzle, encoding, enumerationLimit, storage, tieBreak, clearCache)
+
+            buildTimes = []
+            solveTimes = []
+            solver = None
+            for i in range(repeats):
+                buildTime, solveTime, solver = TimeOnce(algorithm, puzzle, encoding, enumerationLimit, storage, tieBreak, clearCache)
+                buildTimes.append(buildTime)
+                solveTimes.append(solveTime)
+
+            peakMemory = None
+            if(measureMemory):
+                peakMemory = MeasurePeakMemory(algorithm, puzzle, encoding, enumerationLimit, storage, tieBreak, clearCache)
+
+            stats = None
+            if(collectStats):
+                stats = CollectStats(algorithm, puzzle, encoding, enumerationLimit, storage, tieBreak, clearCache)
+
+            results[puzzleName + "/" + algorithmName] = {
+                "puzzle": puzzleName,
+                "algorithm": algorithmName,
+                "size": str(len(columnRules)) + "x" + str(len(rowRules)),
+                "build_ns": Summarize(buildTimes),
+                "solve_ns": Summarize(solveTimes),
+                "peak_bytes": peakMemory,
+                "nodes": solver.Nodes,
+                "nodes_per_second": NodesPerSecond(solver.Nodes, Summarize(solveTimes)["median"]),
+                "solved": solver.IsValid() and solver.IsSolved(),
+                "stats": stats,
+            }
+            yield results[puzzleName + "/" + algorithmName], solver
+
+# The search speed over the median solve time, which is None if the solve was too fast to time
+def NodesPerSecond(nodes, solveNanoseconds):
+    if(solveNanoseconds <= 0):
+        return None
+    return nodes / (solveNanoseconds / 1e9)
+
+def NodeLabel(algorithmName):
+    return "decisions" if algorithmName in DECISION_COUNTS else "nodes"
+
+def PrintResult(result):
+    print(result["puzzle"].ljust(10) + " " + result["algorithm"].ljust(13)
+          + " build " + str(round(result["build_ns"]["median"] / 1e6, 3)).rjust(9) + " ms"
+          + "   solve " + str(round(result["solve_ns"]["median"] / 1e6, 3)).rjust(9) + " ms"
+          + " (p95 " + str(round(result["solve_ns"]["p95"] / 1e6, 3)).rjust(9) + " ms)"
+          + ("" if result["peak_bytes"] == None else "   peak " + str(round(result["peak_bytes"] / 2**20, 2)).rjust(8) + " MB")
+          + "   " + NodeLabel(result["algorithm"]) + " " + str(result["nodes"]).rjust(5)
+          + "   " + NodeLabel(result["algorithm"]) + "/s " + ("-" if result["nodes_per_second"] == None else str(round(result["nodes_per_second"]))).rjust(8)
+          + "   solved " + str(result["solved"]))
+    stats = result["stats"]
+    if(stats != None):
+        print(" " * 11 + "depth " + str(stats["max_depth"]).rjust(3)
+              + "   branching " + " ".join(str(round(i, 2)) for i in stats["branching"][:8])
+              + "   pruned " + str(stats["candidates_pruned"])
+              + "   deduced " + str(sum(stats["cells_deduced"].values()))
+              + ("" if stats["nogoods"] == None else "   nogood hits " + str(stats["nogoods"]["hits"]) + "/" + str(stats["nogoods"]["checks"]))
+              + ("" if stats["sat"] == None else "   sat conflicts " + str(stats["sat"]["conflicts"]) + " learned " + str(stats["sat"]["learned"]))
+              + "   " + "  ".join(phase + " " + str(round(seconds * 1e3, 2)) + " ms" for phase, seconds in stats["phase_seconds"].items()))
+
+# Prints the average median solve time and search speed of every algorithm for each board size, and how many puzzles it solved
+# without search. The SAT backend counts decisions instead of nodes, so its numbers are labelled as decisions.
+def PrintSummary(results, algorithmNames):
+    sizes = []
+    for result in results.values():
+        size = result["size"]
+        if(size not in sizes):
+            sizes.append(size)
+
+    for algorithmName in algorithmNames:
+        for size in sizes:
+            sizeResults = [r for r in results.values() if r["algorithm"] == algorithmName and r["size"] == size]
+            if(len(sizeResults) == 0):
+                continue
+            average = sum(r["solve_ns"]["median"] for r in sizeResults) / len(sizeResults)
+            speed = NodesPerSecond(sum(r["nodes"] for r in sizeResults), sum(r["solve_ns"]["median"] for r in sizeResults))
+            print("The average of " + algorithmName + " on " + size + " was: " + str(round(average / 1e6, 3)) + " ms"
+                  + ("" if speed == None else ", at " + str(round(speed)) + " " + NodeLabel(algorithmName) + "/s"))
+        if(algorithmName in DECISION_COUNTS):
+            noDecisions = len([r for r in results.values() if r["algorithm"] == algorithmName and r["nodes"] == 0])
+            if(noDecisions > 0):
+                print(algorithmName + ": " + str(noDecisions) + " puzzles needed no decisions")
+        else:
+            zeroSearch = len([r for r in results.values() if r["algorithm"] == algorithmName and r["nodes"] <= 1])
+            if(zeroSearch > 0):
+                print(algorithmName + ": " + str(zeroSearch) + " puzzles needed no search")
+        PrintStatsSummary(algorithmName, [r["stats"] for r in results.values() if r["algorithm"] == algorithmName and r["stats"] != None])
+
+# Adds up the search statistics of every puzzle run with one algorithm
+def PrintStatsSummary(algorithmName, statsList):
+    if(len(statsList) == 0):
+        return
+    phaseTimes = {}
+    cellsDeduced = {}
+    for stats in statsList:
+        for phase, seconds in stats["phase_seconds"].items():
+            phaseTimes[phase] = phaseTimes.get(phase, 0) + seconds
+        for source, count in stats["cells_deduced"].items():
+            cellsDeduced[source] = cellsDeduced.get(source, 0) + count
+    print(algorithmName + ": " + str(sum(s["nodes"] for s in statsList)) + " nodes, deepest " + str(max(s["max_depth"] for s in statsList))
+          + ", " + str(sum(s["candidates_pruned"] for s in statsList)) + " candidates pruned, cells deduced "
+          + ", ".join(source + " " + str(count) for source, count in cellsDeduced.items()))
+    nogoodStats = [s["nogoods"] for s in statsList if s["nogoods"] != None]
+    if(len(nogoodStats) > 0):
+        print(algorithmName + ": " + str(sum(s["hits"] for s in nogoodStats)) + " nogood hits in " + str(sum(s["checks"] for s in nogoodStats))
+              + " checks, " + str(sum(s["stored"] for s in nogoodStats)) + " stored, " + str(sum(s["evicted"] for s in nogoodStats)) + " evicted")
+    print(algorithmName + ": time in " + ", ".join(phase + " " + str(round(seconds * 1e3, 2)) + " ms" for phase, seconds in phaseTimes.items()))
+
+# Compares the median times of two saved runs. A puzzle/algorithm pair whose median is slower by more than the threshold
+# (0.10 is 10%) is flagged as a regression. Returns the number of regressions.
+def Compare(oldRun, newRun, threshold):
+    regressions = 0
+    for key in oldRun["results"]:
+        if(key not in newRun["results"]):
+            continue
+        for timing in ["build_ns", "solve_ns"]:
+            oldMedian = oldRun["results"][key][timing]["median"]
+            newMedian = newRun["results"][key][timing]["median"]
+            change = (newMedian - oldMedian) / oldMedian if oldMedian > 0 else 0
+            flag = ""
+            if(change > threshold):
+                flag = "  REGRESSION"
+                regressions += 1
+            elif(change < -threshold):
+                flag = "  improved"
+            print(key.ljust(26) + " " + timing.ljust(8) + " " + str(round(oldMedian / 1e6, 3)).rjust(9) + " ms -> "
+                  + str(round(newMedian / 1e6, 3)).rjust(9) + " ms  " + ("+" if change >= 0 else "") + str(round(change * 100, 1)) + "%" + flag)
+    print(str(regressions) + " regressions beyond " + str(round(threshold * 100, 1)) + "%")
+    return regressions
+
+def main(arguments = None):
+    parser = argparse.ArgumentParser(description = "Benchmark the nonogram solvers on the registered puzzles")
+    subparsers = parser.add_subparsers(dest = "command")
+
+    runParser = subparsers.add_parser("run", help = "time the solvers (the default)")
+    runParser.add_argument("--puzzles", nargs = "*", default = None, help = "puzzle names or size prefixes such as 10x10, or ids in the corpus (default: all)")
+    runParser.add_argument("--corpus", default = None, help = "a JSON lines corpus to run instead of the built in puzzles")
+    runParser.add_argument("--files", nargs = "*", default = None, help = ".non or .cwd puzzle files to run instead of the built in puzzles")
+    runParser.add_argument("--algorithms", nargs = "*", default = ["backtracking", "ourAlgorithm"], choices = list(ALGORITHMS))
+    runParser.add_argument("--repeats", type = int, default = 5)
+    runParser.add_argument("--warmup", type = int, default = 1)
+    runParser.add_argument("--encoding", default = "CELLS", choices = [e.name for e in LineEncoding])
+    runParser.add_argument("--storage", default = "CELLS", choices = [e.name for e in BoardStorage])
+    runParser.add_argument("--tie-break", default = "LINE_ORDER", choices = [e.name for e in TieBreak],
+                           help = "how the speculation target is chosen between lines with the same number of candidates")
+    runParser.add_argument("--enumeration-limit", type = int, default = DefaultEnumerationLimit,
+                           help = "lines with more consistent candidates than this are left to the placement solver (0 for no limit)")
+    runParser.add_argument("--no-memory", action = "store_true", help = "skip the extra run that measures peak memory")
+    runParser.add_argument("--stats", action = "store_true", help = "make one more run that records the search statistics")
+    runParser.add_argument("--clear-cache", action = "store_true", help = "empty the shared candidate cache before every run")
+    runParser.add_argument("--print-boards", action = "store_true")
+    runParser.add_argument("--json", default = None, help = "write the results to this file")
+
+    compareParser = subparsers.add_parser("compare", help = "diff two JSON runs")
+    compareParser.add_argument("old")
+    compareParser.add_argument("new")
+    compareParser.add_argument("--threshold", type = float, default = 0.10)
+
+    if(arguments == None):
+        arguments = sys.argv[1:]
+    if(len(arguments) == 0 or arguments[0] not in ["run", "compare", "-h", "--help"]):
+        arguments = ["run"] + list(arguments)
+    options = parser.parse_args(arguments)
+
+    if(options.command == "compare"):
+        with open(options.old) as oldFile, open(options.new) as newFile:
+            regressions = Compare(json.load(oldFile), json.load(newFile), options.threshold)
+        return 1 if regressions > 0 else 0
+
+    corpus = None
+    if(options.corpus != None):
+        corpus = PuzzleCorpus(options.corpus)
+        if(options.puzzles):
+            puzzles = ((i,) + corpus.Get(i) for i in options.puzzles)
+        else:
+            puzzles = corpus.Iterate()
+    elif(options.files != None):
+        puzzles = ((i,) + LoadPuzzleFile(i) for i in options.files)
+    else:
+        puzzles = [(name,) + PUZZLES[name] for name in PUZZLES
+                   if not options.puzzles or name in options.puzzles or name.split("-")[0] in options.puzzles]
+
+    enumerationLimit = options.enumeration_limit
+    if(enumerationLimit == 0):
+        enumerationLimit = None
+
+    results = {}
+    for result, solver in RunBenchmark(puzzles, options.algorithms, options.repeats, options.warmup,
+                                       LineEncoding[options.encoding], enumerationLimit, BoardStorage[options.storage], options.clear_cache, not options.no_memory,
+                                       options.stats, TieBreak[options.tie_break]):
+        results[result["puzzle"] + "/" + result["algorithm"]] = result
+        PrintResult(result)
+        if(options.print_boards):
+            solver.Print()
+    if(corpus != None):
+        corpus.Close()
+    PrintSummary(results, options.algorithms)
+
+    if(options.json != None):
+        run = {
+            "meta": {"repeats": options.repeats, "warmup": options.warmup, "encoding": options.encoding, "storage": options.storage, "tie_break": options.tie_break,
+                     "enumeration_limit": enumerationLimit, "python": sys.version.split()[0], "time": time.time()},
+            "results": results,
+        }
+        with open(options.json, "w") as jsonFile:
+            json.dump(run, jsonFile, indent = 1)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,22 @@
+import asyncio
+import heapq
+import math
+import multiprocessing
+import random
+import sys
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from enum import Enum
 
+import SatSolver
+
+# NumPy is optional. Without it the LineEncoding.NUMPY boards fall back to the Cell based code.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 #
 # Here we create the state of each cell. Cells will initialize in an unknown state.
 # Void Cells are ones where we know there will not be anything there
@@ -11,6 +27,28 @@ class CellState(Enum):
     VOID = 0
     FILLED = 1
 
+#
+# LineEncoding picks how the candidate solutions of each line are stored. CELLS keeps every candidate as a list of Cell objects,
+# while BITMASK keeps each candidate as a pair of integers (filled mask, void mask) where bit i stands for the cell at index i.
+# With BITMASK, checking a candidate against an ActiveLine is a single AND/XOR instead of a loop over the cells.
+# NUMPY keeps all of a line's candidates as one 2-D uint8 array (one row per candidate, holding CellState values),
+# so filtering and deduction are done on the whole array at once.
+#
+class LineEncoding(Enum):
+    CELLS = 0
+    BITMASK = 1
+    NUMPY = 2
+
+#
+# BoardStorage picks how a BoardStructure keeps its cells. CELLS gives every cell its own Cell object, and each row and column
+# is a list of references to them. BYTES keeps the whole board as one bytearray holding the CellState value of each cell, row by row.
+# Each row is a memoryview slice of it and each column a strided memoryview slice, so copying a board for a search node is
+# one bytearray copy and R + C views instead of R * C new Cell objects.
+#
+class BoardStorage(Enum):
+    CELLS = 0
+    BYTES = 1
+
 #
 # Here we create the Cell objects. Each one contains its own CellState, as well as where it is in the board
 # by giving it a row and column index. We then also make a getter and setter for later parts of the code
@@ -30,6 +68,49 @@ class Cell:
     def getState(self):
         return self.state
 
+# NumPy arrays compare element by element, so a value that can be an array is checked against None with this instead of ==
+def isNone(value):
+    return value is None
+
+# The CellState of each byte value of a BYTES board, and the tables that turn a line's bytes into the digits of its masks
+StateOfValue = [CellState.VOID, CellState.FILLED, CellState.UNKNOWN]
+FilledDigits = bytes.maketrans(b"\x00\x01\x02", b"010")
+VoidDigits = bytes.maketrans(b"\x00\x01\x02", b"100")
+
+#
+# CellView and StateView let the code written for Cell objects work on a BYTES board. A StateView wraps the memoryview of
+# a row or column and hands out a CellView for an index, which reads and writes that cell's byte. The busy parts of
+# ActiveLine read the memoryview directly, so these are only made for the rest, such as Print() and ourAlgorithm().
+#
+class CellView:
+    __slots__ = ("View", "Index")
+
+    def __init__(self, view, index):
+        self.View = view
+        self.Index = index
+
+    def setState(self, value):
+        self.View[self.Index] = value.value
+
+    def getState(self):
+        return StateOfValue[self.View[self.Index]]
+
+class StateView:
+    __slots__ = ("View",)
+
+    def __init__(self, view):
+        self.View = view
+
+    def __len__(self):
+        return len(self.View)
+
+    def __getitem__(self, index):
+        return CellView(self.View, index)
+
+    def __iter__(self):
+        for i in range(len(self.View)):
+            yield CellView(self.View, i)
+
 #
 # Here we create the LineRule class. This creates objects which house the rules for each column and row.
 # In this class we make multiple different methods which give us vital information about the lines.
@@ -132,8 +213,8 @@ class LineRule:
     
     def checkSolution(self, line):
         if(self.isEmpty()):
-            for i in range(len(line.Cells)):
-                if(line.Cells[i].getState() != CellState.VOID):
+            for state in line.GetStates():
+                if(state != CellState.VOID):
                     return False
             return True
         
@@ -153,13 +234,60 @@ class LineRule:
     # GenerateCandidates(), GetGapRules(), GenerateGapStructures(), and GenerateLineFromGapStructures() is how we get our candidate solutions.
     # These are all the lines which will be considered when being put into the backtracking algorithm for each line.
 
-    def GenerateCandidates(self):
+    def GenerateCandidates(self, encoding = LineEncoding.CELLS):
+        return self.CollectCandidates(self.IterateCandidates(encoding), encoding)
+
+    # Generator version of GenerateCandidates(). Each candidate is only built when it is asked for.
+    def IterateCandidates(self, encoding = LineEncoding.CELLS):
         if(self.isTrivial()):
-            temp = [self.getTrivialSolution()]
-            return temp
+            trivialSolution = self.getTrivialSolution()
+            if(encoding == LineEncoding.BITMASK):
+                yield Line(7, self.LineLength, trivialSolution.getMasks())
+            elif(encoding == LineEncoding.NUMPY):
+                yield numpy.array([cell.getState().value for cell in trivialSolution.Cells], dtype = numpy.uint8)
+            else:
+                yield trivialSolution
+            return
         gapRules = self.GetGapRules()
-        generatedGaps = self.GenerateGapStructures(gapRules, self.voidCells())
-        return self.GenerateLinesFromGapStructures(generatedGaps)
+        for gapStructure in self.IterateGapStructures(gapRules, self.voidCells()):
+            yield self.CandidateFromGapStructure(gapStructure, encoding)
+
+    # The number of candidate solutions, worked out in closed form without building any of them.
+    # Once every block and the VOID between each pair of blocks is placed, the free VOIDs left over are shared out
+    # among the len(Rules) + 1 gaps, which is a stars-and-bars count.
+    def CandidateCount(self):
+        if(self.isEmpty()):
+            return 1
+        freeVoids = self.LineLength - self.filledCells() - (len(self.Rules) - 1)
+        if(freeVoids < 0):
+            return 0
+        return math.comb(freeVoids + len(self.Rules), len(self.Rules))
+
+    # Builds a single candidate solution from a gap structure in the given LineEncoding.
+    # BITMASK candidates are mask-only Lines and NUMPY candidates are rows of CellState values, so no Cell objects are created for either.
+    def CandidateFromGapStructure(self, gapStructure, encoding):
+        if(encoding == LineEncoding.CELLS):
+            return Line(6, self.Rules, gapStructure)
+
+        filledMask = 0
+        position = 0
+        for i in range(0, len(self.Rules)):
+            position += gapStructure[i]
+            filledMask |= ((1 << self.Rules[i]) - 1) << position
+            position += self.Rules[i]
+
+        if(encoding == LineEncoding.NUMPY):
+            return numpy.array([filledMask >> i & 1 for i in range(self.LineLength)], dtype = numpy.uint8)
+        return Line(7, self.LineLength, (filledMask, ((1 << self.LineLength) - 1) ^ filledMask))
+
+    # Gathers generated candidates into the container used by the encoding: a list of Lines, or a 2-D array for NUMPY.
+    def CollectCandidates(self, candidates, encoding):
+        if(encoding == LineEncoding.NUMPY):
+            rows = list(candidates)
+            if(len(rows) == 0):
+                return numpy.zeros((0, self.LineLength), dtype = numpy.uint8)
+            return numpy.array(rows, dtype = numpy.uint8)
+        return list(candidates)
 
     def GetGapRules(self):
         voidsToAllocate = self.LineLength - self.filledCells() - self.innerGaps()
@@ -205,6 +333,34 @@ class LineRule:
                             gapStructure.extend(innerGap)
                             gapStructures.append(gapStructure)
         return gapStructures
+
+    # Generator version of GenerateGapStructures(). It yields the same gap structures in the same order without building the nested lists.
+    # It also stops as soon as the gaps left cannot get their minimum of VOIDs, which GenerateGapStructures() only finds out at
+    # the last gap. On long lines almost all of the branches end that way.
+    def IterateGapStructures(self, gapRules, gapsToBeAllocated):
+        sum = 0
+        for i in gapRules:
+            sum += i[1]
+        if sum < gapsToBeAllocated:
+            return
+
+        headRule = gapRules[0]
+        headValues = range(headRule[0], (headRule[1] - headRule[0]) + 2)
+        innerMinimum = 0
+        for i in gapRules[1:]:
+            innerMinimum += i[0]
+
+        for headValue in headValues:
+            innerGapRules = gapRules[1:]
+            nextGapsToBeAllocated = gapsToBeAllocated - headValue
+            if (nextGapsToBeAllocated < innerMinimum):
+                break
+            if (nextGapsToBeAllocated >= 0):
+                if (len(innerGapRules) == 1):
+                    yield [headValue, nextGapsToBeAllocated]
+                else:
+                    for innerGap in self.IterateGapStructures(innerGapRules, nextGapsToBeAllocated):
+                        yield [headValue] + innerGap
     
     def GenerateLinesFromGapStructures(self, gapStructures):
         lines = []
@@ -212,15 +368,166 @@ class LineRule:
             lines.append(Line(6, self.Rules, gapStructure))
         
         return lines
+
+    # PlacementTables(), CountCandidatesFor(), SolveLine() and IterateCandidatesFor() work on a partially known line without
+    # enumerating every candidate. They run a DP over (block, position): forward[j][i] counts the ways to place the first j blocks
+    # in the first i cells, and backward[j][i] counts the ways to place block j and every block after it in the cells from i on.
+    # Both tables take O(LineLength * blocks) time, so they stay cheap on lines far too long to enumerate.
+
+    def PlacementTables(self, states):
+        rules = []
+        if(not self.isEmpty()):
+            rules = self.Rules
+        length = self.LineLength
+        blockCount = len(rules)
+
+        filledBefore = [0] * (length + 1)
+        voidBefore = [0] * (length + 1)
+        for i in range(length):
+            filledBefore[i + 1] = filledBefore[i] + (states[i] == CellState.FILLED)
+            voidBefore[i + 1] = voidBefore[i] + (states[i] == CellState.VOID)
+
+        # Every block but the last one takes the VOID cell that separates it from the next block along with it
+        spans = [rules[j] + (1 if j < blockCount - 1 else 0) for j in range(blockCount)]
+        notFilled = [state != CellState.FILLED for state in states]
+
+        # fits[j][start] says whether block j can start at that cell: none of its cells are VOID, and the separator after it is not FILLED.
+        # It is worked out once per block so the table loops below only have to look it up.
+        fits = []
+        for j in range(blockCount):
+            rule = rules[j]
+            isLast = j == blockCount - 1
+            fits.append([voidBefore[start + rule] == voidBefore[start] and (isLast or notFilled[start + rule])
+                         for start in range(length - spans[j] + 1)])
+
+        forward = [[0] * (length + 1) for j in range(blockCount + 1)]
+        forward[0][0] = 1
+        for j in range(blockCount + 1):
+            row = forward[j]
+            if(j == 0):
+                for i in range(1, length + 1):
+                    row[i] = row[i - 1] if notFilled[i - 1] else 0
+                continue
+            previousRow = forward[j - 1]
+            span = spans[j - 1]
+            blockFits = fits[j - 1]
+            for i in range(span, length + 1):
+                ways = row[i - 1] if notFilled[i - 1] else 0
+                if(blockFits[i - span]):
+                    ways += previousRow[i - span]
+                row[i] = ways
+
+        backward = [[0] * (length + 1) for j in range(blockCount + 1)]
+        backward[blockCount][length] = 1
+        for j in range(blockCount, -1, -1):
+            row = backward[j]
+            if(j == blockCount):
+                for i in range(length - 1, -1, -1):
+                    row[i] = row[i + 1] if notFilled[i] else 0
+                continue
+            nextRow = backward[j + 1]
+            span = spans[j]
+            blockFits = fits[j]
+            lastStart = length - span
+            for i in range(length - 1, -1, -1):
+                ways = row[i + 1] if notFilled[i] else 0
+                if(i <= lastStart and blockFits[i]):
+                    ways += nextRow[i + span]
+                row[i] = ways
+
+        return (rules, spans, fits, filledBefore, forward, backward)
+
+    # Counts the candidate solutions that agree with every known cell of the line
+    def CountCandidatesFor(self, line):
+        states = line.GetStates()
+        tables = self.PlacementTables(states)
+        return tables[4][len(tables[0])][self.LineLength]
+
+    # Returns a mask Line holding every cell that is forced to be FILLED or VOID, or None if the line has no possible solution left.
+    def SolveLine(self, line):
+        states = line.GetStates()
+        rules, spans, fits, filledBefore, forward, backward = self.PlacementTables(states)
+        length = self.LineLength
+        blockCount = len(rules)
+        if(forward[blockCount][length] == 0):
+            return None
+
+        canBeVoid = [False] * length
+        fillCoverage = [0] * (length + 1)
+        for i in range(length):
+            if(states[i] != CellState.FILLED):
+                for j in range(blockCount + 1):
+                    if(forward[j][i] and backward[j][i + 1]):
+                        canBeVoid[i] = True
+                        break
+        for j in range(blockCount):
+            for start in range(length - spans[j] + 1):
+                if(forward[j][start] and fits[j][start] and backward[j + 1][start + spans[j]]):
+                    fillCoverage[start] += 1
+                    fillCoverage[start + rules[j]] -= 1
+                    if(j < blockCount - 1):
+                        canBeVoid[start + rules[j]] = True
+
+        filledMask = 0
+        voidMask = 0
+        covered = 0
+        for i in range(length):
+            covered += fillCoverage[i]
+            if(covered > 0 and not canBeVoid[i]):
+                filledMask |= 1 << i
+            elif(covered == 0 and canBeVoid[i]):
+                voidMask |= 1 << i
+        return Line(7, length, (filledMask, voidMask))
+
+    # Generates only the candidate solutions that agree with the known cells of the line. The backward table is used to skip
+    # any block position that cannot lead to a full solution, so the work done is proportional to the candidates returned.
+    def GenerateCandidatesFor(self, line, encoding = LineEncoding.CELLS):
+        return self.CollectCandidates(self.IterateCandidatesFor(line, encoding), encoding)
+
+    def IterateCandidatesFor(self, line, encoding = LineEncoding.CELLS):
+        states = line.GetStates()
+        rules, spans, fits, filledBefore, forward, backward = self.PlacementTables(states)
+        length = self.LineLength
+        blockCount = len(rules)
+        if(forward[blockCount][length] == 0):
+            return
+        if(self.isEmpty()):
+            yield from self.IterateCandidates(encoding)
+            return
+
+        def placeBlocks(j, position, starts):
+            if(j == blockCount):
+                if(filledBefore[length] == filledBefore[position]):
+                    gapStructure = [starts[0]]
+                    for k in range(1, blockCount):
+                        gapStructure.append(starts[k] - starts[k - 1] - rules[k - 1])
+                    gapStructure.append(length - starts[blockCount - 1] - rules[blockCount - 1])
+                    yield gapStructure
+                return
+            for start in range(position, length - spans[j] + 1):
+                if(filledBefore[start] != filledBefore[position]):
+                    break
+                if(fits[j][start] and backward[j + 1][start + spans[j]]):
+                    starts.append(start)
+                    yield from placeBlocks(j + 1, start + spans[j], starts)
+                    starts.pop()
+
+        for gapStructure in placeBlocks(0, 0, []):
+            yield self.CandidateFromGapStructure(gapStructure, encoding)
     
 #
 # Here is the Line class. This is where we create the Line objects that house each of the Cell objects for a specific Line.
 #
 class Line:
 
+    # Set by determiningNumber 7. Lines built from Cells compute their masks on demand in getMasks().
+    FilledMask = None
+    VoidMask = None
+
     def __init__(self, determiningNumber, inputOne, inputTwo):
 
-        self.Cells = []
+        if determiningNumber != 7:
+            self.Cells = []
 
         #If it is a list of cells
         if determiningNumber == 1:
@@ -256,9 +563,52 @@ class Line:
 
             self.Cells = cellList
 
+        #Length is input one, (filledMask, voidMask) is input two
+        #The Cells are only built if something asks for them, such as Print() or checkSolution()
+        elif determiningNumber == 7:
+            self.LineLength = inputOne
+            self.FilledMask = inputTwo[0]
+            self.VoidMask = inputTwo[1]
+
+    # Only called when Cells has not been set, which is the case for a mask Line until something reads its Cells.
+    def __getattr__(self, name):
+        if(name != "Cells" or self.FilledMask == None):
+            raise AttributeError(name)
+        cellList = []
+        for i in range(0, self.LineLength):
+            if(self.FilledMask >> i & 1):
+                cellList.append(Cell(CellState.FILLED))
+            elif(self.VoidMask >> i & 1):
+                cellList.append(Cell(CellState.VOID))
+            else:
+                cellList.append(Cell(CellState.UNKNOWN))
+        self.Cells = cellList
+        return cellList
+
     def Length(self):
+        if(self.FilledMask != None):
+            return self.LineLength
         return len(self.Cells)
 
+    # Returns the CellState of every cell in the line
+    def GetStates(self):
+        return [cell.getState() for cell in self.Cells]
+
+    # Returns the (filled mask, void mask) pair of the line. Bit i of each mask stands for the cell at index i.
+    def getMasks(self):
+        if(self.FilledMask != None):
+            return (self.FilledMask, self.VoidMask)
+
+        filledMask = 0
+        voidMask = 0
+        for i in range(0, len(self.Cells)):
+            state = self.Cells[i].getState()
+            if(state == CellState.FILLED):
+                filledMask |= 1 << i
+            elif(state == CellState.VOID):
+                voidMask |= 1 << i
+        return (filledMask, voidMask)
+
     # Creates a list of cells with VOID state with length equal to gapSize
     def fillGap(self, gapSize):
         cells = []
@@ -283,10 +633,11 @@ class Line:
 
         nextBlock = 0
         blockActive = False
+        states = self.GetStates()
 
-        for lineIndex in range(0, len(self.Cells)):
+        for lineIndex in range(0, len(states)):
 
-            if(self.Cells[lineIndex].getState() == CellState.FILLED):
+            if(states[lineIndex] == CellState.FILLED):
 
                 if blockActive:
                     lineBlocks[nextBlock - 1] += 1
@@ -306,10 +657,15 @@ class Line:
         if(activeLine.Length() != self.Length()):
             raise Exception("Bruh")
 
+        if(self.FilledMask != None):
+            activeFilled, activeVoid = activeLine.getMasks()
+            return ((self.FilledMask ^ activeFilled) & (activeFilled | activeVoid)) == 0
+
         temp = True
-        for i in range(0, activeLine.Length()):
-            if activeLine.Cells[i].getState() != CellState.UNKNOWN:
-                if activeLine.Cells[i].getState() == self.Cells[i].getState():
+        activeStates = activeLine.GetStates()
+        for i in range(0, len(activeStates)):
+            if activeStates[i] != CellState.UNKNOWN:
+                if activeStates[i] == self.Cells[i].getState():
                     temp = True
                 else:
                     temp = False
@@ -346,6 +702,83 @@ class Line:
         lineString + "\n"
         print(lineString)
 
+#
+# The CandidateCache keeps the full candidate set of every (Rules, LineLength, LineEncoding) it has been asked for, so boards and
+# recursion levels that meet the same rule again do not regenerate its candidates. The sets are stored as tuples (or read only
+# arrays for NUMPY) because every ActiveLine that uses one shares it. ReviewCandidates() always builds a new list when it filters.
+# The cache is bounded by entry count and by an estimate of the bytes held, and evicts the least recently used set first.
+#
+class CandidateCache:
+
+    def __init__(self, maxEntries, maxBytes, maxLineCandidates):
+        self.MaxEntries = maxEntries
+        self.MaxBytes = maxBytes
+        self.MaxLineCandidates = maxLineCandidates
+        self.Entries = OrderedDict()
+        self.Bytes = 0
+        self.Hits = 0
+        self.Misses = 0
+        self.Evictions = 0
+
+    # Whether a rule is small enough to be cached. Bigger rules go through LineRule.GenerateCandidatesFor() instead.
+    def accepts(self, lineRule):
+        return lineRule.CandidateCount() <= self.MaxLineCandidates
+
+    def Contains(self, lineRule, encoding):
+        return (tuple(lineRule.Rules), lineRule.LineLength, encoding) in self.Entries
+
+    def Get(self, lineRule, encoding):
+        key = (tuple(lineRule.Rules), lineRule.LineLength, encoding)
+        entry = self.Entries.get(key)
+        if(entry != None):
+            self.Entries.move_to_end(key)
+            self.Hits += 1
+            return entry[0]
+
+        self.Misses += 1
+        candidates = lineRule.GenerateCandidates(encoding)
+        if(encoding == LineEncoding.NUMPY):
+            candidates.setflags(write = False)
+        else:
+            candidates = tuple(candidates)
+        size = self.EstimateBytes(candidates, encoding)
+
+        self.Entries[key] = (candidates, size)
+        self.Bytes += size
+        while(len(self.Entries) > 1 and (len(self.Entries) > self.MaxEntries or self.Bytes > self.MaxBytes)):
+            evictedKey, evicted = self.Entries.popitem(last = False)
+            self.Bytes -= evicted[1]
+            self.Evictions += 1
+        return candidates
+
+    # Rough size of a candidate set: the array buffer for NUMPY, otherwise the size of one candidate times the number of candidates.
+    def EstimateBytes(self, candidates, encoding):
+        if(encoding == LineEncoding.NUMPY):
+            return candidates.nbytes
+        if(len(candidates) == 0):
+            return sys.getsizeof(candidates)
+        sample = candidates[0]
+        perCandidate = sys.getsizeof(sample) + sys.getsizeof(sample.__dict__)
+        if(encoding == LineEncoding.BITMASK):
+            perCandidate += sys.getsizeof(sample.FilledMask) + sys.getsizeof(sample.VoidMask)
+        else:
+            perCandidate += sys.getsizeof(sample.Cells) + len(sample.Cells) * (sys.getsizeof(sample.Cells[0]) + sys.getsizeof(sample.Cells[0].__dict__))
+        return sys.getsizeof(candidates) + len(candidates) * perCandidate
+
+    def Clear(self):
+        self.Entries.clear()
+        self.Bytes = 0
+
+    def Stats(self):
+        return {"entries": len(self.Entries), "bytes": self.Bytes, "hits": self.Hits, "misses": self.Misses, "evictions": self.Evictions}
+
+# Shared by every board in the process. Set it to None to have each line generate its own candidates.
+SharedCandidateCache = CandidateCache(4096, 64 * 1024 * 1024, 100000)
+
+# The enumerationLimit boards get unless they are given another one. Without a limit a line of a 100x100 board can have millions
+# of candidates, while with it such lines are left to the placement solver until they are narrowed down.
+DefaultEnumerationLimit = 1000
+
 #
 # LineType class to see if a line is a row or column
 #
@@ -359,14 +792,28 @@ class LineType(Enum):
 # Also takes in CopySource, if it is meant to be copying another ActiveLine into a new ActiveLine object.
 #
 class ActiveLine(Line):
-    def __init__(self, Cells, Rules, Type, Index, CopySource):
+    def __init__(self, Cells, Rules, Type, Index, CopySource, Encoding = LineEncoding.CELLS, EnumerationLimit = DefaultEnumerationLimit):
         if(CopySource == None):
             self.Type = Type
             self.Index = Index
             self.Rules = Rules
-            self.CandidateSolutions = Rules.GenerateCandidates()
+            if(Encoding == LineEncoding.NUMPY and numpy == None):
+                Encoding = LineEncoding.CELLS
+            self.Encoding = Encoding
+            self.EnumerationLimit = EnumerationLimit
+
+            # The candidates are only generated once the line is filtered or speculated on. Until then CandidateSolutions stays
+            # None, the count comes from LineRule.CandidateCount(), and deduction is done by the LineRule placement solver.
+            # Lines with more consistent candidates than the EnumerationLimit stay that way even after being filtered.
+            self.CandidateSolutions = None
+            self.PlacementCount = Rules.CandidateCount()
+            self.Trail = None
+            self.Stats = None
+            self.TargetQueue = None
+            self.ReviewedMasks = None
             self.skipReview = False
             self.Cells = Cells
+            self.View = Cells.View if isinstance(Cells, StateView) else None
             self.ReviewCandidates()
         
             if(not self.skipReview):
@@ -375,27 +822,83 @@ class ActiveLine(Line):
             self.Type = CopySource.Type
             self.Index = CopySource.Index
             self.Rules = CopySource.Rules
+            self.Encoding = CopySource.Encoding
+            self.EnumerationLimit = CopySource.EnumerationLimit
             self.CandidateSolutions = CopySource.CandidateSolutions
+            self.PlacementCount = CopySource.PlacementCount
+            self.Trail = None
+            self.Stats = CopySource.Stats
+            self.TargetQueue = None
+            self.ReviewedMasks = None
             self.skipReview = False
             self.Cells = Cells
+            self.View = Cells.View if isinstance(Cells, StateView) else None
 
             if(not self.skipReview):
                 self.ReviewCandidates()
     
     def Length(self):
         return len(self.Cells)
+
+    # A line of a BYTES board reads its states and masks straight from its memoryview
+    def GetStates(self):
+        if(self.View == None):
+            return Line.GetStates(self)
+        return [StateOfValue[i] for i in self.View]
+
+    def getMasks(self):
+        if(self.View == None):
+            return Line.getMasks(self)
+        digits = bytes(self.View)[::-1]
+        return (int(digits.translate(FilledDigits), 2), int(digits.translate(VoidDigits), 2))
     
     # As said earlier, the candidate solutions start as all possible solutions to a line based on its rules
     def CandidateCount(self):
+        if(isNone(self.CandidateSolutions)):
+            return self.PlacementCount
         return len(self.CandidateSolutions)
 
     def isValid(self):
-        if len(self.CandidateSolutions) > 0:
+        if self.CandidateCount() > 0:
             return True
         else:
             return False
 
+    def isEnumerated(self):
+        return not isNone(self.CandidateSolutions)
+
+    # Builds the candidate list of a line that was never enumerated. Only the candidates that agree with its current cells are built.
+    # Rules small enough for the SharedCandidateCache take the cached full set, which ReviewCandidates() then filters.
+    # The full set is only built for the cache if most of it would survive the filter, since on a large board a line that is
+    # already mostly solved can have a few consistent candidates out of a full set of tens of thousands.
+    def EnumerateCandidates(self):
+        if(isNone(self.CandidateSolutions)):
+            if(self.Trail != None):
+                self.Trail.RecordCandidates(self, None, self.PlacementCount, self.ReviewedMasks)
+            if(SharedCandidateCache != None and SharedCandidateCache.accepts(self.Rules)
+               and (SharedCandidateCache.Contains(self.Rules, self.Encoding) or self.Rules.CandidateCount() <= 4 * self.Rules.CountCandidatesFor(self))):
+                self.CandidateSolutions = SharedCandidateCache.Get(self.Rules, self.Encoding)
+                self.ReviewCandidates()
+            else:
+                self.CandidateSolutions = self.Rules.GenerateCandidatesFor(self, self.Encoding)
+            self.CountChanged()
+
+    # Returns the candidate solution at the given index as a Line, whatever encoding the candidates are stored in.
+    def GetCandidate(self, index):
+        self.EnumerateCandidates()
+        if(self.Encoding == LineEncoding.NUMPY):
+            return Line(1, [Cell(value) for value in self.CandidateSolutions[index].tolist()], None)
+        return self.CandidateSolutions[index]
+
+    # Returns the cell states of the line as a 1-D uint8 array for the NUMPY encoding.
+    def GetStateArray(self):
+        if(self.View != None):
+            return numpy.array(self.View, dtype = numpy.uint8)
+        return numpy.array([cell.getState().value for cell in self.Cells], dtype = numpy.uint8)
+
     def isSet(self):
+        if(self.View != None):
+            return CellState.UNKNOWN.value not in self.View
         for cell in self.Cells:
             if(cell.getState() == CellState.UNKNOWN):
                 return False
@@ -406,18 +909,88 @@ class ActiveLine(Line):
     
     # Reviews which candidates are potentially solutions for the given ActiveLine, and returns them while filtering out any that are not.
     def ReviewCandidates(self):
-        temp = []
-        for i in self.CandidateSolutions:
-            if(i.isCandidateSolutionFor(self) == True):
-                temp.append(i)
-        
-        self.CandidateSolutions = temp       
+        # While a Trail is attached the line remembers the cells it was last filtered for, and skips filtering again if they
+        # have not changed since
+        if(self.Trail != None):
+            masks = self.getMasks()
+            if(masks == self.ReviewedMasks):
+                return
+            self.Trail.RecordCandidates(self, self.CandidateSolutions, self.PlacementCount, self.ReviewedMasks)
+            self.FilterCandidates()
+            self.ReviewedMasks = masks
+        else:
+            self.FilterCandidates()
+        self.CountChanged()
+
+    # Tells the board's TargetQueue that CandidateCount() may have changed
+    def CountChanged(self):
+        if(self.TargetQueue != None):
+            self.TargetQueue.Update(self)
+
+    def FilterCandidates(self):
+        if(isNone(self.CandidateSolutions)):
+            filledMask, voidMask = self.getMasks()
+            if((filledMask | voidMask) == 0):
+                self.PlacementCount = self.Rules.CandidateCount()
+                return
+            if(self.EnumerationLimit != None):
+                self.PlacementCount = self.Rules.CountCandidatesFor(self)
+                if(self.PlacementCount > self.EnumerationLimit):
+                    return
+            self.EnumerateCandidates()
+            return
+
+        countBefore = len(self.CandidateSolutions)
+        if(self.Encoding == LineEncoding.BITMASK):
+            filledMask, voidMask = self.getMasks()
+            knownMask = filledMask | voidMask
+            self.CandidateSolutions = [i for i in self.CandidateSolutions if ((i.FilledMask ^ filledMask) & knownMask) == 0]
+
+        # Keep the rows of the candidate matrix that agree with every known cell
+        elif(self.Encoding == LineEncoding.NUMPY):
+            states = self.GetStateArray()
+            known = states != CellState.UNKNOWN.value
+            if(known.any()):
+                mismatch = (self.CandidateSolutions[:, known] != states[known]).any(axis = 1)
+                self.CandidateSolutions = self.CandidateSolutions[~mismatch]
+
+        else:
+            temp = []
+            for i in self.CandidateSolutions:
+                if(i.isCandidateSolutionFor(self) == True):
+                    temp.append(i)
+            
+            self.CandidateSolutions = temp       
+
+        if(self.Stats != None):
+            self.Stats.CandidatesPruned += countBefore - len(self.CandidateSolutions)
 
     # Returns a Line object that looks at each candidateSolution and sees which ones are determinable.
     def GetDeterminableCells(self):
+        if(isNone(self.CandidateSolutions)):
+            forcedCells = self.Rules.SolveLine(self)
+            if(forcedCells == None):
+                return Line(2, self.Length(), CellState.UNKNOWN)
+            return forcedCells
+
         if (not self.isValid()):
             return Line(2, self.Length(), CellState.UNKNOWN)
 
+        # A cell is determinable if it is FILLED in every candidate or VOID in every candidate
+        if(self.Encoding == LineEncoding.BITMASK):
+            filledMask = (1 << self.Length()) - 1
+            voidMask = filledMask
+            for candidateSolution in self.CandidateSolutions:
+                filledMask &= candidateSolution.FilledMask
+                voidMask &= candidateSolution.VoidMask
+            return Line(7, self.Length(), (filledMask, voidMask))
+
+        if(self.Encoding == LineEncoding.NUMPY):
+            first = self.CandidateSolutions[0]
+            allEqual = (self.CandidateSolutions == first).all(axis = 0)
+            states = numpy.where(allEqual, first, CellState.UNKNOWN.value)
+            return Line(1, [Cell(value) for value in states.tolist()], None)
+
         determinableCells = Line(5, self.CandidateSolutions[0], None)
         for candidateSolution in self.CandidateSolutions[1:]:
             determinableCells.And(candidateSolution)
@@ -430,30 +1003,87 @@ class ActiveLine(Line):
             raise ValueError("Lines must be of the same length")
 
         self.skipReview = True
-        for i in range(0, self.Length()):
-            newState = line.Cells[i].getState()
-            if(newState != CellState.UNKNOWN):
-                self.Cells[i].setState(newState)
+        if(line.FilledMask != None):
+            for i in range(0, self.Length()):
+                if(line.FilledMask >> i & 1):
+                    self.SetCell(i, CellState.FILLED)
+                elif(line.VoidMask >> i & 1):
+                    self.SetCell(i, CellState.VOID)
+        else:
+            for i in range(0, self.Length()):
+                newState = line.Cells[i].getState()
+                if(newState != CellState.UNKNOWN):
+                    self.SetCell(i, newState)
         self.skipReview = False
         self.ReviewCandidates()
 
+    # Runs the LineTechniques of its rules on the line and sets the cells they deduce, without enumerating any candidates.
+    # Returns the mask of the cells newly set, or None if the line contradicts its rules.
+    def ApplyTechniques(self):
+        if(self.View != None):
+            states = list(self.View)
+        else:
+            states = [cell.getState().value for cell in self.Cells]
+        if(CellState.UNKNOWN.value not in states):
+            return 0
+        deduced = LineTechniques(self.Rules.Rules).Solve(states)
+        if(deduced == None):
+            return None
+        newMask = 0
+        for i in range(len(states)):
+            if(deduced[i] != states[i]):
+                self.SetCell(i, CellState(deduced[i]))
+                newMask |= 1 << i
+        return newMask
+
+    # Sets one cell of the line, writing its old state to the Trail first if the board has one.
+    def SetCell(self, index, state):
+        if(self.View != None):
+            oldValue = self.View[index]
+            if(self.Trail != None and oldValue != state.value):
+                self.Trail.RecordByte(self.View, index, oldValue)
+            self.View[index] = state.value
+            return
+        cell = self.Cells[index]
+        if(self.Trail != None and cell.state != state):
+            self.Trail.RecordCell(cell, cell.state)
+        cell.setState(state)
+
 #
 # Most basic form of the structure for the full board. When called it will create an empty 5x5 board.
 # We can then manually what is in the board using the set methods.
+# A board is square unless a columnCount is given, and setting the rules also sets the row or column count,
+# so a puzzle with R row rules and C column rules is an R x C board.
 #
 class BoardPuzzle:
 
-    def __init__(self, multiple):
-        self.ColumnCount = multiple
+    def __init__(self, multiple, columnCount = None):
+        if(columnCount == None):
+            columnCount = multiple
+        self.ColumnCount = columnCount
         self.RowCount = multiple        
-        self.ColumnRules = [[] for i in range(multiple)]
+        self.ColumnRules = [[] for i in range(columnCount)]
         self.RowRules = [[] for i in range(multiple)]
 
     def setColumns(self, list):
         self.ColumnRules = list
+        self.ColumnCount = len(list)
 
     def setRows(self, list):
         self.RowRules = list
+        self.RowCount = len(list)
+
+    # Raises a ValueError if a rule cannot fit in its line, or if the rows and columns do not fill the same number of cells.
+    # Either one means the puzzle has no solution.
+    def Validate(self):
+        for rules, lineLength, name in [(self.RowRules, self.ColumnCount, "row"), (self.ColumnRules, self.RowCount, "column")]:
+            for index in range(len(rules)):
+                if(sum(rules[index]) + len(rules[index]) - 1 > lineLength):
+                    raise ValueError(name + " " + str(index) + " rule " + str(rules[index]) + " does not fit in " + str(lineLength) + " cells")
+        rowTotal = sum(sum(i) for i in self.RowRules)
+        columnTotal = sum(sum(i) for i in self.ColumnRules)
+        if(rowTotal != columnTotal):
+            raise ValueError("the row rules fill " + str(rowTotal) + " cells but the column rules fill " + str(columnTotal))
 
     def getRows(self):
         return self.RowRules
@@ -465,22 +1095,38 @@ class BoardPuzzle:
 # The BoardStructure is where we pass in the BoardPuzzle object, and create the actual board.
 # The BoardStructure object contains the amount of columns and rows, a matrix which contains all of the cell objects,
 # and three different ActiveLine lists in order to properly manipulate each row and column individually.
-# It also takes in a copy source for the use of the backtracking Solve()
+# It also takes in a copy source for the use of the backtracking Solve(), and the LineEncoding used for the candidate solutions.
+# Lines with more consistent candidate solutions than the enumerationLimit are left to the LineRule placement solver instead of
+# having their candidates generated. It is DefaultEnumerationLimit unless given, and None generates every line's candidates.
+# The BoardStorage decides whether the cells are Cell objects or bytes in one bytearray. With BYTES the Matrix is a list of
+# StateView rows, so Matrix[row][column].getState() works the same way for both.
 #
 class BoardStructure:
 
-    def __init__(self, puzzle, copySource):
+    def __init__(self, puzzle, copySource, encoding = LineEncoding.CELLS, enumerationLimit = DefaultEnumerationLimit, storage = BoardStorage.CELLS, tieBreak = None):
+        if(encoding == LineEncoding.NUMPY and numpy == None):
+            encoding = LineEncoding.CELLS
+
         if(puzzle != None):
             self.Puzzle = puzzle
+            self.Encoding = encoding
+            self.EnumerationLimit = enumerationLimit
+            self.Storage = storage
+            self.Trail = None
+            self.Stats = None
             self.RowCount = self.Puzzle.RowCount
             self.ColumnCount = self.Puzzle.ColumnCount
 
-            self.Matrix = [[] for i in range(self.RowCount)]
-            for rowIndex in range(self.RowCount):
-                for columnIndex in range(self.ColumnCount):
-                    self.Matrix[rowIndex].append(Cell(CellState.UNKNOWN))
-                    self.Matrix[rowIndex][columnIndex].row = rowIndex
-                    self.Matrix[rowIndex][columnIndex].column = columnIndex
+            if(self.Storage == BoardStorage.BYTES):
+                self.States = bytearray([CellState.UNKNOWN.value]) * (self.RowCount * self.ColumnCount)
+                self.BuildViews()
+            else:
+                self.Matrix = [[] for i in range(self.RowCount)]
+                for rowIndex in range(self.RowCount):
+                    for columnIndex in range(self.ColumnCount):
+                        self.Matrix[rowIndex].append(Cell(CellState.UNKNOWN))
+                        self.Matrix[rowIndex][columnIndex].row = rowIndex
+                        self.Matrix[rowIndex][columnIndex].column = columnIndex
             self.Columns = self.GatherColumns()
             self.Rows = self.GatherRows()
             self.ActiveLines = []
@@ -489,18 +1135,28 @@ class BoardStructure:
                 self.ActiveLines.append(i)
             for i in self.Rows:
                 self.ActiveLines.append(i)
+            self.AttachTargetQueue(TargetQueue(self.ActiveLines, tieBreak if tieBreak != None else TieBreak.LINE_ORDER))
         
         if(copySource != None):
             self.Puzzle = copySource.Puzzle
+            self.Encoding = copySource.Encoding
+            self.EnumerationLimit = copySource.EnumerationLimit
+            self.Storage = copySource.Storage
+            self.Trail = None
+            self.Stats = copySource.Stats
             self.RowCount = self.Puzzle.RowCount
             self.ColumnCount = self.Puzzle.ColumnCount
-            self.Matrix = [[] for i in range(self.RowCount)]
-            for rowIndex in range(self.RowCount):
-                for columnIndex in range(self.ColumnCount):
-                    otherCell = copySource.Matrix[rowIndex][columnIndex]
-                    self.Matrix[rowIndex].append(Cell(otherCell.getState()))
-                    self.Matrix[rowIndex][columnIndex].row = rowIndex
-                    self.Matrix[rowIndex][columnIndex].column = columnIndex
+            if(self.Storage == BoardStorage.BYTES):
+                self.States = bytearray(copySource.States)
+                self.BuildViews()
+            else:
+                self.Matrix = [[] for i in range(self.RowCount)]
+                for rowIndex in range(self.RowCount):
+                    for columnIndex in range(self.ColumnCount):
+                        otherCell = copySource.Matrix[rowIndex][columnIndex]
+                        self.Matrix[rowIndex].append(Cell(otherCell.getState()))
+                        self.Matrix[rowIndex][columnIndex].row = rowIndex
+                        self.Matrix[rowIndex][columnIndex].column = columnIndex
             
             self.Columns = self.CopyColumns(copySource)
             self.Rows = self.CopyRows(copySource)
@@ -510,29 +1166,55 @@ class BoardStructure:
                 self.ActiveLines.append(i)
             for i in self.Rows:
                 self.ActiveLines.append(i)
+            self.AttachTargetQueue(copySource.TargetQueue.Copy(self.ActiveLines))
 
     def Copy(self, source):
         if(self.Puzzle != source.board.Puzzle):
             raise Exception("Oh Hell nah!")
 
+        if(self.Storage == BoardStorage.BYTES):
+            self.States[:] = source.board.States
+            return
         for rowIndex in range(self.RowCount):
             for columnIndex in range(self.ColumnCount):
                 otherCell = source.board.Matrix[rowIndex][columnIndex]
                 self.Matrix[rowIndex][columnIndex].setState(otherCell.getState())
 
+    # Makes the memoryview of the States of a BYTES board, and a StateView over it for every row
+    def BuildViews(self):
+        self.StatesView = memoryview(self.States)
+        self.Matrix = []
+        for rowIndex in range(self.RowCount):
+            self.Matrix.append(StateView(self.StatesView[rowIndex * self.ColumnCount:(rowIndex + 1) * self.ColumnCount]))
+
+    # The cells of a column or a row, as a list of Cells or, on a BYTES board, a StateView of that part of the States
+    def ColumnCells(self, columnIndex):
+        if(self.Storage == BoardStorage.BYTES):
+            return StateView(self.StatesView[columnIndex::self.ColumnCount])
+        columnCells = []
+        for rowIndex in range(self.RowCount):
+            columnCells.append(self.Matrix[rowIndex][columnIndex])
+        return columnCells
+
+    def RowCells(self, rowIndex):
+        if(self.Storage == BoardStorage.BYTES):
+            return self.Matrix[rowIndex]
+        rowCells = []
+        for columnIndex in range(self.ColumnCount):
+            rowCells.append(self.Matrix[rowIndex][columnIndex])
+        return rowCells
+
     # GatherColumns(), GatherRows(), CopyColumns(), and CopyRows() are all meant to create lists of their respective ActiveLine types.
 
     def GatherColumns(self):
         columns = []
 
         for columnIndex in range(self.ColumnCount):
-            columnCells = []
-            for rowIndex in range(self.RowCount):
-                columnCells.append(self.Matrix[rowIndex][columnIndex])
+            columnCells = self.ColumnCells(columnIndex)
             
             columnRule = LineRule(self.Puzzle.ColumnRules[columnIndex], self.RowCount)
             
-            columns.append(ActiveLine(columnCells, columnRule, LineType.COLUMN, columnIndex, None))
+            columns.append(ActiveLine(columnCells, columnRule, LineType.COLUMN, columnIndex, None, self.Encoding, self.EnumerationLimit))
         
         return columns
 
@@ -540,22 +1222,18 @@ class BoardStructure:
         rows = []
 
         for rowIndex in range(self.RowCount):
-            rowCells = []
-            for columnIndex in range(self.ColumnCount):
-                rowCells.append(self.Matrix[rowIndex][columnIndex])
+            rowCells = self.RowCells(rowIndex)
             
             rowRule = LineRule(self.Puzzle.RowRules[rowIndex], self.ColumnCount)
 
-            rows.append(ActiveLine(rowCells, rowRule, LineType.ROW, rowIndex, None))
+            rows.append(ActiveLine(rowCells, rowRule, LineType.ROW, rowIndex, None, self.Encoding, self.EnumerationLimit))
         
         return rows
 
     def CopyColumns(self, copySource):
         columns = []
         for columnIndex in range(self.ColumnCount):
-            columnCells = []
-            for rowIndex in range(self.RowCount):
-                columnCells.append(self.Matrix[rowIndex][columnIndex])
+            columnCells = self.ColumnCells(columnIndex)
             
             columns.append(ActiveLine(columnCells, None, None, None, copySource.Columns[columnIndex]))
         
@@ -564,14 +1242,55 @@ class BoardStructure:
     def CopyRows(self, copySource):
         rows = []
         for rowIndex in range(self.RowCount):
-            rowCells = []
-            for columnIndex in range(self.ColumnCount):
-                rowCells.append(self.Matrix[rowIndex][columnIndex])
+            rowCells = self.RowCells(rowIndex)
             
             rows.append(ActiveLine(rowCells, None, None, None, copySource.Rows[rowIndex]))
         
         return rows
 
+    # A compact copy of the board that can be sent to another process: the rules, the encoding settings, one byte per cell
+    # holding its CellState value, row by row, and the storage. A BYTES board already keeps its cells in that form.
+    def Serialize(self):
+        if(self.Storage == BoardStorage.BYTES):
+            states = self.States
+        else:
+            states = bytearray(self.RowCount * self.ColumnCount)
+            for rowIndex in range(self.RowCount):
+                for columnIndex in range(self.ColumnCount):
+                    states[rowIndex * self.ColumnCount + columnIndex] = self.Matrix[rowIndex][columnIndex].getState().value
+        return (self.Puzzle.ColumnRules, self.Puzzle.RowRules, self.Encoding.value, self.EnumerationLimit, bytes(states), self.Storage.value,
+                self.TargetQueue.TieBreak.value)
+
+    # Sets every cell from the bytes made by Serialize(), then reviews every line against its new cells
+    def LoadStates(self, states):
+        if(self.Storage == BoardStorage.BYTES):
+            self.States[:] = states
+        else:
+            for rowIndex in range(self.RowCount):
+                for columnIndex in range(self.ColumnCount):
+                    self.Matrix[rowIndex][columnIndex].setState(CellState(states[rowIndex * self.ColumnCount + columnIndex]))
+        for i in self.ActiveLines:
+            i.ReviewCandidates()
+
+    # Makes every ActiveLine of the board write its changes to the given Trail, or stop recording if it is None.
+    def AttachTrail(self, trail):
+        self.Trail = trail
+        for i in self.ActiveLines:
+            i.Trail = trail
+            i.ReviewedMasks = None
+
+    def AttachTargetQueue(self, queue):
+        self.TargetQueue = queue
+        for i in self.ActiveLines:
+            i.TargetQueue = queue
+
+    # Makes the board and every ActiveLine of it record to the given SolveStats, or stop recording if it is None.
+    # Boards copied from this one record to the same SolveStats.
+    def AttachStats(self, stats):
+        self.Stats = stats
+        for i in self.ActiveLines:
+            i.Stats = stats
+
     # This method sets the line's solution, once it has been properly figured out by the algorithms.
     def SetLineSolution(self, lineType, lineIndex, candidateToSet):
         targetSet = self.Columns
@@ -584,7 +1303,56 @@ class BoardStructure:
                 target = i
                 break
         
+        filledBefore, voidBefore = target.getMasks()
         target.ApplyLine(candidateToSet)
+        filledAfter, voidAfter = target.getMasks()
+
+        # Returns the line along with every crossing line that had one of its cells changed, as they need to be propagated again
+        changedMask = (filledAfter | voidAfter) & ~(filledBefore | voidBefore)
+        return [target] + self.CrossingLines(target, changedMask)
+
+    # Returns the lines that cross the given line at the cells set in the mask. Since the Matrix cells are shared,
+    # a change to cell i of a column is also a change to row i, and the other way around.
+    def CrossingLines(self, line, mask):
+        crossingSet = self.Rows
+        if(line.Type == LineType.ROW):
+            crossingSet = self.Columns
+
+        crossingLines = []
+        index = 0
+        while(mask):
+            if(mask & 1):
+                crossingLines.append(crossingSet[index])
+            mask >>= 1
+            index += 1
+        return crossingLines
+
+    # Board masks number the cells row by row, so bit rowIndex * ColumnCount + columnIndex stands for a cell.
+    # CellIndex() is the bit of cell i of a line, and BoardMask() turns a mask over the cells of a line into a board mask.
+    def CellIndex(self, line, i):
+        if(line.Type == LineType.ROW):
+            return line.Index * self.ColumnCount + i
+        return i * self.ColumnCount + line.Index
+
+    def BoardMask(self, line, mask):
+        if(line.Type == LineType.ROW):
+            return mask << (line.Index * self.ColumnCount)
+        boardMask = 0
+        while(mask):
+            lowest = mask & -mask
+            boardMask |= 1 << self.CellIndex(line, lowest.bit_length() - 1)
+            mask ^= lowest
+        return boardMask
+
+    # The (filled mask, void mask) of the whole board
+    def BoardMasks(self):
+        filledMask = 0
+        voidMask = 0
+        for row in self.Rows:
+            rowFilled, rowVoid = row.getMasks()
+            filledMask |= rowFilled << (row.Index * self.ColumnCount)
+            voidMask |= rowVoid << (row.Index * self.ColumnCount)
+        return (filledMask, voidMask)
 
 #
 # SpeculativeCallContext and VerboseLevel are both helper classes made for the backtracking algorithm.
@@ -596,11 +1364,826 @@ class SpeculativeCallContext:
     global optionIndex
     global optionsCount
 
+    # The lines the speculated line changed, which are the only ones the next call needs to propagate. None means every line.
+    dirtyLines = None
+
+    # The reasons PropagateWorklist() recorded for the cells it deduced at every node above this one, when nogoods are learned
+    reasons = None
+
+    # The (Zobrist hash, board masks) of the state the node starts from, when a TranspositionTable is attached
+    tableState = None
+
 class VerboseLevel(Enum):
     SILENT = 0
     STARTDECLARATION = 1
     STEPBYSTEP = 2
 
+#
+# SolveStatus is what the line logic fixpoint reports: the board is fully solved, partially solved and needs speculation,
+# or some line has no solution left.
+#
+class SolveStatus(Enum):
+    SOLVED = 0
+    PARTIAL = 1
+    CONTRADICTION = 2
+
+#
+# SolveStrategy picks which search solve_many() runs on each puzzle.
+#
+class SolveStrategy(Enum):
+    BACKTRACK = 0
+    INPLACE = 1
+    FIXPOINT = 2
+    PROBING = 3
+    SAT = 4
+    ANYTIME = 5
+
+#
+# The Trail is what lets SolveInPlace() search on a single board. Every cell assignment and every change to a line's candidates
+# is written to it with the old value, so a failed branch can be rolled back to a saved mark instead of being thrown away
+# with a copy of the whole board.
+#
+class Trail:
+
+    def __init__(self):
+        self.Entries = []
+
+    def Mark(self):
+        return len(self.Entries)
+
+    def RecordCell(self, cell, oldState):
+        self.Entries.append((cell, oldState))
+
+    # The BYTES board version of RecordCell(), which keeps the line's memoryview and the index in it
+    def RecordByte(self, view, index, oldValue):
+        self.Entries.append((view, index, oldValue))
+
+    def RecordCandidates(self, line, oldCandidates, oldCount, oldReviewedMasks):
+        self.Entries.append((line, oldCandidates, oldCount, oldReviewedMasks))
+
+    # A set line the TargetQueue dropped, which has to go back into the queue once its cells are undone
+    def RecordDropped(self, line):
+        self.Entries.append((line,))
+
+    # Restores everything recorded after the mark, newest first
+    def Undo(self, mark):
+        entries = self.Entries
+        while(len(entries) > mark):
+            entry = entries.pop()
+            if(len(entry) == 2):
+                entry[0].state = entry[1]
+            elif(len(entry) == 3):
+                entry[0][entry[1]] = entry[2]
+            elif(len(entry) == 1):
+                entry[0].CountChanged()
+            else:
+                entry[0].CandidateSolutions = entry[1]
+                entry[0].PlacementCount = entry[2]
+                entry[0].ReviewedMasks = entry[3]
+                entry[0].CountChanged()
+
+#
+# TieBreak picks which of the lines with the fewest candidates SelectSpeculationTarget() returns. LINE_ORDER takes the first
+# one in ActiveLines, columns before rows. MOST_UNKNOWN and FEWEST_UNKNOWN take the one with the most or fewest UNKNOWN cells,
+# and fall back to LINE_ORDER between those.
+#
+class TieBreak(Enum):
+    LINE_ORDER = 0
+    MOST_UNKNOWN = 1
+    FEWEST_UNKNOWN = 2
+
+#
+# TargetQueue keeps the ActiveLines of a board in a heap of (CandidateCount(), position in ActiveLines), so choosing the speculation
+# target does not scan every cell of every line at each search node. A line calls Update() whenever its count may have changed,
+# which pushes a new entry if it did. Entries that no longer hold their line's count are thrown away when they reach the top,
+# and so are lines found to be set, since cells only become known further down the search. On a board with a Trail the
+# dropped line is recorded, so undoing it puts the line back. A copied board gets a copy of the queue for its own lines.
+#
+class TargetQueue:
+
+    def __init__(self, lines, tieBreak, counts = None):
+        self.Lines = lines
+        self.TieBreak = tieBreak
+        self.Positions = {}
+        for position in range(len(lines)):
+            self.Positions[lines[position]] = position
+        # None marks a line that was dropped for being set
+        if(counts == None):
+            counts = [line.CandidateCount() for line in lines]
+        self.Counts = counts
+        self.Heap = [(counts[position], position) for position in range(len(lines)) if counts[position] != None]
+        heapq.heapify(self.Heap)
+
+    # The queue for the lines of a copy of the board. Lines dropped here stay dropped, and the others take the counts of the new lines.
+    def Copy(self, lines):
+        counts = list(self.Counts)
+        for position in range(len(lines)):
+            if(counts[position] != None):
+                counts[position] = lines[position].CandidateCount()
+        return TargetQueue(lines, self.TieBreak, counts)
+
+    def Update(self, line):
+        position = self.Positions[line]
+        count = line.CandidateCount()
+        if(self.Counts[position] != count):
+            self.Counts[position] = count
+            heapq.heappush(self.Heap, (count, position))
+            # Outdated entries are only removed when they reach the top, so rebuild the heap before they pile up
+            if(len(self.Heap) > 4 * len(self.Lines)):
+                self.Heap = [(self.Counts[i], i) for i in range(len(self.Lines)) if self.Counts[i] != None]
+                heapq.heapify(self.Heap)
+
+    # Pops the entry of the unset line with the fewest candidates, dropping outdated entries and set lines on the way.
+    # Returns None if every line is set.
+    def PopTarget(self, trail):
+        heap = self.Heap
+        while(len(heap) > 0):
+            count, position = heapq.heappop(heap)
+            if(self.Counts[position] != count):
+                continue
+            line = self.Lines[position]
+            if(line.isSet()):
+                self.Counts[position] = None
+                if(trail != None):
+                    trail.RecordDropped(line)
+                continue
+            return (count, position)
+        return None
+
+    # Returns the unset line with the fewest candidates, choosing between equal counts by the TieBreak, or None if every line is set
+    def Select(self, trail):
+        best = self.PopTarget(trail)
+        if(best == None):
+            return None
+        tied = [best]
+        if(self.TieBreak != TieBreak.LINE_ORDER):
+            while(True):
+                entry = self.PopTarget(trail)
+                if(entry == None):
+                    break
+                if(entry[0] != best[0]):
+                    heapq.heappush(self.Heap, entry)
+                    break
+                if(entry[1] != tied[-1][1]):
+                    tied.append(entry)
+        for entry in tied:
+            heapq.heappush(self.Heap, entry)
+
+        if(self.TieBreak == TieBreak.MOST_UNKNOWN):
+            best = max(tied, key = lambda entry: (self.UnknownCount(entry[1]), -entry[1]))
+        elif(self.TieBreak == TieBreak.FEWEST_UNKNOWN):
+            best = min(tied, key = lambda entry: (self.UnknownCount(entry[1]), entry[1]))
+        return self.Lines[best[1]]
+
+    def UnknownCount(self, position):
+        line = self.Lines[position]
+        filledMask, voidMask = line.getMasks()
+        return line.Length() - bin(filledMask | voidMask).count("1")
+
+#
+# SolveStats records what a search did, so we can see why a puzzle is slow. BoardLogic.EnableStats() attaches one to the board,
+# and every board copied from it during the search adds to the same one. While Stats is None each place that would record
+# something costs a single comparison.
+# LevelNodes[d] is the number of nodes expanded at depth d (the root is depth 0), so LevelNodes[d + 1] / LevelNodes[d] is the
+# branching factor at level d. PhaseTimes holds the seconds spent propagating, copying boards (or undoing the Trail for
+# SolveInPlace()), checking validity with IsValid()/IsSolved(), selecting the speculation target, probing cells, checking
+# branches against the NogoodStore, looking up and storing states in the TranspositionTable, and in the SAT backend. Nogoods
+# and Transpositions hold the NogoodStore and TranspositionTable while they are in use, so their counts are reported along
+# with the rest, and Sat holds the counts of the SAT solver.
+#
+class SolveStats:
+
+    def __init__(self):
+        self.Nodes = 0
+        self.MaxDepth = 0
+        self.LevelNodes = []
+        self.CandidatesPruned = 0
+        self.CellsDeduced = {"propagation": 0, "techniques": 0, "probing": 0}
+        self.PhaseTimes = {"propagation": 0.0, "copying": 0.0, "validity": 0.0, "selection": 0.0, "probing": 0.0, "nogoods": 0.0, "transpositions": 0.0, "sat": 0.0}
+        self.Nogoods = None
+        self.Transpositions = None
+        # The counts of the CdclSolver, for a board solved with SolveSat()
+        self.Sat = None
+
+    def CountNode(self, depth):
+        self.Nodes += 1
+        if(depth > self.MaxDepth):
+            self.MaxDepth = depth
+        while(len(self.LevelNodes) <= depth):
+            self.LevelNodes.append(0)
+        self.LevelNodes[depth] += 1
+
+    # Adds the time since start to the phase, and returns the current time so the next phase can start from it
+    def AddTime(self, phase, start):
+        now = time.perf_counter()
+        self.PhaseTimes[phase] += now - start
+        return now
+
+    def BranchingFactors(self):
+        return [self.LevelNodes[depth + 1] / self.LevelNodes[depth] for depth in range(len(self.LevelNodes) - 1)]
+
+    def ToDict(self):
+        return {
+            "nodes": self.Nodes,
+            "max_depth": self.MaxDepth,
+            "level_nodes": list(self.LevelNodes),
+            "branching": self.BranchingFactors(),
+            "candidates_pruned": self.CandidatesPruned,
+            "cells_deduced": dict(self.CellsDeduced),
+            "phase_seconds": dict(self.PhaseTimes),
+            "nogoods": self.Nogoods.ToDict() if self.Nogoods != None else None,
+            "transpositions": self.Transpositions.ToDict() if self.Transpositions != None else None,
+            "sat": self.Sat,
+        }
+
+#
+# AnytimeResult is what solve_anytime() returns. Status is SOLVED, CONTRADICTION if the puzzle has no solution, or PARTIAL if the
+# budget ran out first, in which case StoppedBy says which one: "deadline", "nodes", or "stop" for the board's own StopCheck.
+# States holds the cell states left on the board, and every known cell of a PARTIAL board is proven. RootCells counts the cells
+# newly deduced by the propagation at the root and BranchCells the ones set by the root branches the search exhausted, neither
+# counting cells that were known before the call. Nodes and Time are the work it did.
+#
+class AnytimeResult:
+
+    def __init__(self):
+        self.Status = SolveStatus.PARTIAL
+        self.StoppedBy = None
+        self.States = None
+        self.RootCells = 0
+        self.BranchCells = 0
+        self.ExhaustedBranches = 0
+        self.Nodes = 0
+        self.Time = 0.0
+
+    def isSolved(self):
+        return self.Status == SolveStatus.SOLVED
+
+    def KnownCells(self):
+        return len(self.States) - self.States.count(CellState.UNKNOWN.value)
+
+    def ToDict(self):
+        return {
+            "status": self.Status.name,
+            "stopped_by": self.StoppedBy,
+            "known_cells": self.KnownCells(),
+            "cells": len(self.States),
+            "root_cells": self.RootCells,
+            "branch_cells": self.BranchCells,
+            "exhausted_branches": self.ExhaustedBranches,
+            "nodes": self.Nodes,
+            "seconds": self.Time,
+        }
+
+#
+# ZobristKeys gives every cell of a board a random 64 bit key for FILLED and another for VOID. The hash of a (filled mask, void mask)
+# pair over the board is the XOR of the keys of its cells, so the hash of a board can be kept up to date by XORing in the hash
+# of the cells that were set since. The keys come from a fixed seed, so every process makes the same ones.
+#
+class ZobristKeys:
+
+    def __init__(self, cellCount, seed = 0):
+        generator = random.Random(seed)
+        self.Keys = [(generator.getrandbits(64), generator.getrandbits(64)) for i in range(cellCount)]
+
+    def Hash(self, masks):
+        value = 0
+        for side in range(2):
+            mask = masks[side]
+            while(mask):
+                lowest = mask & -mask
+                value ^= self.Keys[lowest.bit_length() - 1][side]
+                mask ^= lowest
+        return value
+
+#
+# NogoodStore keeps sets of cell assignments that no solution of the puzzle contains, so the search can skip a branch that holds
+# one instead of running into the same contradiction again. A nogood is a (filled mask, void mask) pair over the whole board,
+# where bit rowIndex * ColumnCount + columnIndex stands for a cell, and it is keyed by the Zobrist hash of its cells.
+# A board can only hold a nogood if it holds every one of its assignments, so each nogood is filed under one of them, its watch,
+# and a lookup only compares the nogoods whose watch the board holds. The store keeps the assignments every board it was asked
+# about held, which are the cells known before the search, and watches an assignment outside them when it can, since those are
+# held by every board and would not narrow anything down.
+# At most maxEntries nogoods are kept. A hit moves its nogood to the back, and once the store is full the nogood that went
+# unused the longest is evicted.
+#
+class NogoodStore:
+
+    def __init__(self, cellCount, maxEntries = 1024):
+        self.Keys = ZobristKeys(cellCount)
+        self.MaxEntries = maxEntries
+        self.Nogoods = OrderedDict()
+        # watch -> keys of the nogoods filed under it, where the watch of a cell is 2 * cell for FILLED and 2 * cell + 1 for VOID
+        self.Watches = {}
+        self.WatchOf = {}
+        # Nogoods added before the first lookup, when nothing is known yet about which assignments every board holds
+        self.Unwatched = []
+        self.Common = None
+        self.LastUsed = {}
+        self.Clock = 0
+        self.Checks = 0
+        self.Hits = 0
+        self.Stored = 0
+        self.Evicted = 0
+
+    def Touch(self, key):
+        self.Clock += 1
+        self.LastUsed[key] = self.Clock
+        self.Nogoods.move_to_end(key)
+
+    def Add(self, nogood):
+        key = self.Keys.Hash(nogood)
+        if(key in self.Nogoods):
+            self.Touch(key)
+            return
+        self.Nogoods[key] = nogood
+        self.Touch(key)
+        if(self.Common == None):
+            self.Unwatched.append(key)
+        else:
+            self.Watch(key)
+        self.Stored += 1
+        if(len(self.Nogoods) > self.MaxEntries):
+            evictedKey, evicted = self.Nogoods.popitem(last = False)
+            del self.LastUsed[evictedKey]
+            if(evictedKey in self.WatchOf):
+                self.Watches[self.WatchOf[evictedKey]].discard(evictedKey)
+                del self.WatchOf[evictedKey]
+            self.Evicted += 1
+
+    def Watch(self, key):
+        nogood = self.Nogoods[key]
+        sides = [nogood[side] & ~self.Common[side] for side in range(2)]
+        if(sides[0] | sides[1] == 0):
+            sides = [nogood[0], nogood[1]]
+        # An empty nogood is held by every board, so it gets the watch -1, which every lookup compares
+        watch = -1
+        if(sides[0] | sides[1] != 0):
+            side = 0 if sides[0] != 0 else 1
+            watch = 2 * ((sides[side] & -sides[side]).bit_length() - 1) + side
+        self.WatchOf[key] = watch
+        if(watch not in self.Watches):
+            self.Watches[watch] = set()
+        self.Watches[watch].add(key)
+
+    # Returns a nogood whose cells are all set the same way in the given masks, or None. Of those, the most recently used is returned.
+    def Find(self, filledMask, voidMask):
+        self.Checks += 1
+        if(self.Common == None):
+            self.Common = (filledMask, voidMask)
+        else:
+            self.Common = (self.Common[0] & filledMask, self.Common[1] & voidMask)
+        for key in self.Unwatched:
+            if(key in self.Nogoods):
+                self.Watch(key)
+        self.Unwatched = []
+
+        masks = (filledMask, voidMask)
+        found = None
+        for watch, keys in self.Watches.items():
+            if(watch >= 0 and not (masks[watch & 1] >> (watch >> 1)) & 1):
+                continue
+            for key in keys:
+                nogood = self.Nogoods[key]
+                if((nogood[0] & ~filledMask) == 0 and (nogood[1] & ~voidMask) == 0):
+                    if(found == None or self.LastUsed[key] > self.LastUsed[found]):
+                        found = key
+        if(found == None):
+            return None
+        self.Touch(found)
+        self.Hits += 1
+        return self.Nogoods[found]
+
+    def ToDict(self):
+        return {
+            "entries": len(self.Nogoods),
+            "max_entries": self.MaxEntries,
+            "checks": self.Checks,
+            "hits": self.Hits,
+            "stored": self.Stored,
+            "evicted": self.Evicted,
+        }
+
+#
+# Replacement picks which entry a full TranspositionTable gives up. LRU evicts the one that went unused the longest, FIFO the one
+# stored first, and DEPTH the deepest one, since the entries near the root stand for the biggest subtrees.
+#
+class Replacement(Enum):
+    LRU = 0
+    FIFO = 1
+    DEPTH = 2
+
+#
+# The TranspositionTable remembers how the search from a board state ended: SOLVED along with the solution, or CONTRADICTION when
+# no branch under it had a solution. States are keyed by the Zobrist hash of their cells, which Solve() and SolveInPlace() keep up
+# to date from node to node, and the cells are kept as well so a hash collision is never taken for a hit. A table belongs to
+# one puzzle and can be attached to any number of boards of it, so a search run again, or on a copy of the puzzle, starts from
+# what earlier searches found. It is bounded by entry count and by an estimate of the bytes held, and the Replacement decides
+# which entry goes once it is full.
+#
+class TranspositionTable:
+
+    def __init__(self, puzzle, maxEntries = 100000, maxBytes = 64 * 1024 * 1024, replacement = Replacement.LRU):
+        self.Rules = (tuple(tuple(i) for i in puzzle.ColumnRules), tuple(tuple(i) for i in puzzle.RowRules))
+        self.Keys = ZobristKeys(puzzle.RowCount * puzzle.ColumnCount)
+        self.MaxEntries = maxEntries
+        self.MaxBytes = maxBytes
+        self.Replacement = replacement
+        self.Entries = OrderedDict()
+        # Only used by DEPTH: a heap of (-depth, sequence, key), where entries replaced or evicted since are skipped
+        self.DepthHeap = []
+        self.Sequence = 0
+        self.Bytes = 0
+        self.Probes = 0
+        self.Hits = {SolveStatus.SOLVED: 0, SolveStatus.CONTRADICTION: 0}
+        self.Stored = 0
+        self.Evictions = 0
+
+    def accepts(self, puzzle):
+        return self.Rules == (tuple(tuple(i) for i in puzzle.ColumnRules), tuple(tuple(i) for i in puzzle.RowRules))
+
+    # Returns (status, solution states) for a state, or None
+    def Find(self, key, masks):
+        self.Probes += 1
+        entry = self.Entries.get(key)
+        if(entry == None or entry[0] != masks):
+            return None
+        if(self.Replacement == Replacement.LRU):
+            self.Entries.move_to_end(key)
+        self.Hits[entry[1]] += 1
+        return (entry[1], entry[2])
+
+    def Store(self, key, masks, status, states, depth):
+        if(key in self.Entries):
+            self.Bytes -= self.Entries.pop(key)[4]
+        size = sys.getsizeof(masks[0]) + sys.getsizeof(masks[1]) + (0 if states == None else sys.getsizeof(states)) + 128
+        self.Sequence += 1
+        self.Entries[key] = (masks, status, states, depth, size, self.Sequence)
+        self.Bytes += size
+        self.Stored += 1
+        if(self.Replacement == Replacement.DEPTH):
+            heapq.heappush(self.DepthHeap, (-depth, self.Sequence, key))
+            if(len(self.DepthHeap) > 2 * len(self.Entries) + 64):
+                self.DepthHeap = [(-i[3], i[5], k) for k, i in self.Entries.items()]
+                heapq.heapify(self.DepthHeap)
+        while(len(self.Entries) > 1 and (len(self.Entries) > self.MaxEntries or self.Bytes > self.MaxBytes)):
+            self.Evict()
+
+    def Evict(self):
+        if(self.Replacement == Replacement.DEPTH):
+            while(True):
+                negativeDepth, sequence, key = heapq.heappop(self.DepthHeap)
+                entry = self.Entries.get(key)
+                if(entry != None and entry[5] == sequence):
+                    del self.Entries[key]
+                    break
+        else:
+            key, entry = self.Entries.popitem(last = False)
+        self.Bytes -= entry[4]
+        self.Evictions += 1
+
+    def Clear(self):
+        self.Entries.clear()
+        self.DepthHeap = []
+        self.Bytes = 0
+
+    def ToDict(self):
+        hits = self.Hits[SolveStatus.SOLVED] + self.Hits[SolveStatus.CONTRADICTION]
+        return {
+            "entries": len(self.Entries),
+            "bytes": self.Bytes,
+            "replacement": self.Replacement.name,
+            "probes": self.Probes,
+            "solved_hits": self.Hits[SolveStatus.SOLVED],
+            "contradiction_hits": self.Hits[SolveStatus.CONTRADICTION],
+            "hit_rate": hits / self.Probes if self.Probes > 0 else 0.0,
+            "stored": self.Stored,
+            "evictions": self.Evictions,
+        }
+
+#
+# OverlapEngine runs the overlap rules of ourAlgorithm() on every row at once and then on every column at once with NumPy,
+# and repeats until a round changes nothing. Every block of a line keeps the earliest cell it can start at. Known voids push a
+# block past them, a filled cell right before or after a block pushes it one further, and a filled cell that no later block can
+# reach has to be covered by the block before it. The latest starts come from the same rules run on the reversed lines.
+# Cells between a block's latest start and its earliest end are FILLED, cells no block can reach are VOID, and so are the
+# UNKNOWN cells of a line that already has as many FILLED cells as its rules add up to.
+#
+class OverlapEngine:
+
+    def __init__(self, columnRules, rowRules):
+        self.RowBlocks = self.BlockArrays(rowRules)
+        self.ColumnBlocks = self.BlockArrays(columnRules)
+
+    # Pads the rules of every line to the same number of blocks, and keeps which blocks are real, the order of the blocks
+    # of each line reversed, and the sum of each line's rules. Zero length blocks, like the [0] of an empty line, are dropped.
+    @staticmethod
+    def BlockArrays(rules):
+        blocks = [[i for i in rule if i > 0] for rule in rules]
+        counts = numpy.array([len(i) for i in blocks], dtype = numpy.int64)
+        blockCount = max([1] + [len(i) for i in blocks])
+        lengths = numpy.zeros((len(blocks), blockCount), dtype = numpy.int64)
+        for i in range(len(blocks)):
+            lengths[i, :len(blocks[i])] = blocks[i]
+        positions = numpy.arange(blockCount)[None, :]
+        valid = positions < counts[:, None]
+        reverse = numpy.where(valid, counts[:, None] - 1 - positions, positions)
+        return (lengths, valid, reverse, lengths.sum(axis = 1))
+
+    # Runs the rows and the columns until nothing changes. states is a (rows, columns) uint8 array of CellState values
+    # and is changed in place. Returns False if some line cannot be placed.
+    def Run(self, states):
+        changed = True
+        while(changed):
+            changed = False
+            for lines, blocks in [(states, self.RowBlocks), (states.T, self.ColumnBlocks)]:
+                deduced = self.DeduceLines(lines, *blocks)
+                if(isNone(deduced)):
+                    return False
+                if(not numpy.array_equal(deduced, lines)):
+                    lines[...] = deduced
+                    changed = True
+        return True
+
+    # Returns the earliest start of every block of every line, or None if a block is pushed off the end of its line
+    @staticmethod
+    def EarliestStarts(states, lengths, valid):
+        lineCount, width = states.shape
+        lines = numpy.arange(lineCount)[:, None]
+        positions = numpy.arange(width)
+        lastVoid = numpy.maximum.accumulate(numpy.where(states == CellState.VOID.value, positions, -1), axis = 1)
+        lastFilled = numpy.maximum.accumulate(numpy.where(states == CellState.FILLED.value, positions, -1), axis = 1)
+        # Cell i is at index i + 1, so the cells just outside a block can be looked up without leaving the array
+        paddedFilled = numpy.pad(states == CellState.FILLED.value, ((0, 0), (1, 1)))
+        offsets = numpy.cumsum(lengths + 1, axis = 1) - (lengths + 1)
+        isLast = numpy.roll(valid, -1, axis = 1) == False
+        isLast[:, -1] = True
+
+        starts = offsets.copy()
+        while(True):
+            previous = starts
+            # Every block starts at least one cell after the end of the block before it
+            starts = numpy.maximum.accumulate(starts - offsets, axis = 1) + offsets
+            if(((starts + lengths > width) & valid).any()):
+                return None
+            ends = numpy.minimum(starts + lengths, width)
+            voidInside = lastVoid[lines, numpy.maximum(ends - 1, 0)]
+            starts = numpy.where(valid & (voidInside >= starts), voidInside + 1, starts)
+
+            ends = numpy.minimum(starts + lengths, width)
+            touching = paddedFilled[lines, ends + 1] | paddedFilled[lines, numpy.minimum(starts, width)]
+            starts = numpy.where(valid & touching, starts + 1, starts)
+
+            nextStarts = numpy.where(isLast, width, numpy.roll(starts, -1, axis = 1))
+            uncovered = lastFilled[lines, numpy.clip(nextStarts - 1, 0, width - 1)]
+            starts = numpy.where(valid & (uncovered >= starts + lengths), uncovered - lengths + 1, starts)
+            if(numpy.array_equal(starts, previous)):
+                return starts
+
+    # Marks the cells from each start up to (not including) each end on the given lines
+    @staticmethod
+    def Paint(lineCount, width, lines, starts, ends):
+        marks = numpy.zeros((lineCount, width + 1), dtype = numpy.int64)
+        keep = starts < ends
+        numpy.add.at(marks, (lines[keep], starts[keep]), 1)
+        numpy.add.at(marks, (lines[keep], ends[keep]), -1)
+        return numpy.cumsum(marks, axis = 1)[:, :width] > 0
+
+    # Returns the lines with every cell the rules can deduce set, or None if the lines contradict their rules
+    def DeduceLines(self, states, lengths, valid, reverse, totals):
+        lineCount, width = states.shape
+        if(lineCount == 0):
+            return states
+        earliest = self.EarliestStarts(states, lengths, valid)
+        reversedStarts = self.EarliestStarts(states[:, ::-1], numpy.take_along_axis(lengths, reverse, axis = 1), valid)
+        if(isNone(earliest) or isNone(reversedStarts)):
+            return None
+        latest = width - numpy.take_along_axis(reversedStarts, reverse, axis = 1) - lengths
+        if(((earliest > latest) & valid).any()):
+            return None
+
+        lines = numpy.broadcast_to(numpy.arange(lineCount)[:, None], lengths.shape)[valid]
+        filled = self.Paint(lineCount, width, lines, latest[valid], (earliest + lengths)[valid])
+        reached = self.Paint(lineCount, width, lines, earliest[valid], (latest + lengths)[valid])
+        unknown = states == CellState.UNKNOWN.value
+        complete = ((states == CellState.FILLED.value).sum(axis = 1) == totals)[:, None]
+        if((filled & (states == CellState.VOID.value)).any() or (~reached & (states == CellState.FILLED.value)).any()
+           or (filled & unknown & complete).any()):
+            return None
+
+        deduced = states.copy()
+        deduced[unknown & filled] = CellState.FILLED.value
+        deduced[unknown & ~filled & (~reached | complete)] = CellState.VOID.value
+        return deduced
+
+#
+# LineTechniques runs the techniques a person would use on a partly solved line, without listing any of its candidates.
+# Every block keeps the earliest and latest cell it can start at, and the techniques narrow those and set cells from them:
+#   simple boxes  - cells every placement of a block covers are FILLED
+#   simple spaces - cells no block can reach are VOID
+#   forcing       - a block cannot sit on a VOID cell or touch a FILLED cell at either end, so it skips gaps too short for it
+#   glue          - a FILLED run near a VOID cell or the edge is stretched away from it to the length of the shortest block that can cover it
+#   joining       - a FILLED run only one block can cover pins that block to it, which joins it to the other runs that block must cover
+#   mercury       - the block pinned to a run is also held inside the VOID cells around the run, so it pulls back from them
+#   splitting     - an UNKNOWN cell that would join FILLED runs into one longer than any block that can reach them is VOID
+# Cells are given and returned as lists of CellState values. Solve() runs the techniques until the line stops changing.
+#
+class LineTechniques:
+
+    def __init__(self, rules):
+        self.Lengths = [i for i in rules if i > 0]
+
+    # Returns the states with every cell the techniques deduce set, or None if the line contradicts its rules
+    def Solve(self, states):
+        states = list(states)
+        earliest = None
+        latest = None
+        while(True):
+            bounds = self.BlockBounds(states, earliest, latest)
+            if(bounds == None):
+                return None
+            earliest, latest = bounds
+            deduced = self.Deduce(states, earliest, latest)
+            if(deduced == None or deduced == states):
+                return deduced
+            states = deduced
+
+    # Returns the (earliest starts, latest starts) of the blocks, narrowed until no technique narrows them further,
+    # or None if some block has no place left
+    def BlockBounds(self, states, earliest, latest):
+        lengths = self.Lengths
+        width = len(states)
+        blockCount = len(lengths)
+        if(earliest == None):
+            earliest = [0] * blockCount
+            latest = [width - i for i in lengths]
+        while(True):
+            earliest = self.EarliestStarts(states, lengths, earliest)
+            # The latest starts are the earliest starts of the blocks on the reversed line
+            reversedStarts = self.EarliestStarts(states[::-1], lengths[::-1], [width - latest[i] - lengths[i] for i in reversed(range(blockCount))])
+            if(earliest == None or reversedStarts == None):
+                return None
+            latest = [width - reversedStarts[blockCount - 1 - i] - lengths[i] for i in range(blockCount)]
+            for i in range(blockCount):
+                if(earliest[i] > latest[i]):
+                    return None
+
+            changed = False
+            for runStart, runEnd, placements in self.Runs(states, earliest, latest):
+                if(len(placements) == 0):
+                    return None
+                if(len(placements) == 1):
+                    block, lowest, highest = placements[0]
+                    if(lowest > earliest[block] or highest < latest[block]):
+                        earliest[block] = max(earliest[block], lowest)
+                        latest[block] = min(latest[block], highest)
+                        changed = True
+            if(not changed):
+                return (earliest, latest)
+
+    # Pushes every block to its earliest start that sits on no VOID cell, touches no FILLED cell and leaves no FILLED cell
+    # between it and the next block. Returns None if a block is pushed off the line.
+    @staticmethod
+    def EarliestStarts(states, lengths, minimum):
+        voidValue = CellState.VOID.value
+        filledValue = CellState.FILLED.value
+        width = len(states)
+        starts = list(minimum)
+        changed = True
+        while(changed):
+            changed = False
+            position = 0
+            for i in range(len(lengths)):
+                start = max(starts[i], position)
+                while(True):
+                    end = start + lengths[i]
+                    if(end > width):
+                        return None
+                    if(voidValue in states[start:end]):
+                        start = end - states[start:end][::-1].index(voidValue)
+                    elif((end < width and states[end] == filledValue) or (start > 0 and states[start - 1] == filledValue)):
+                        start += 1
+                    else:
+                        break
+                if(start != starts[i]):
+                    starts[i] = start
+                    changed = True
+                position = start + lengths[i] + 1
+
+            # A FILLED cell after a block that the next block cannot reach has to be covered by this one
+            for i in reversed(range(len(lengths))):
+                limit = starts[i + 1] if i + 1 < len(lengths) else width
+                for cell in range(limit - 1, starts[i] + lengths[i] - 1, -1):
+                    if(states[cell] == filledValue):
+                        starts[i] = cell - lengths[i] + 1
+                        changed = True
+                        break
+        return starts
+
+    # Yields (run start, run end, placements) for every run of FILLED cells. placements lists (block, lowest start, highest start)
+    # for each block that can cover the whole run while staying inside its bounds and the VOID cells (or edges) around the run.
+    def Runs(self, states, earliest, latest):
+        voidValue = CellState.VOID.value
+        filledValue = CellState.FILLED.value
+        width = len(states)
+        cell = 0
+        while(cell < width):
+            if(states[cell] != filledValue):
+                cell += 1
+                continue
+            runStart = cell
+            while(cell < width and states[cell] == filledValue):
+                cell += 1
+            runEnd = cell - 1
+
+            wallLeft = runStart - 1
+            while(wallLeft >= 0 and states[wallLeft] != voidValue):
+                wallLeft -= 1
+            wallRight = runEnd + 1
+            while(wallRight < width and states[wallRight] != voidValue):
+                wallRight += 1
+
+            placements = []
+            for i in range(len(self.Lengths)):
+                lowest = max(earliest[i], wallLeft + 1, runEnd - self.Lengths[i] + 1)
+                highest = min(latest[i], runStart, wallRight - self.Lengths[i])
+                if(lowest <= highest):
+                    placements.append((i, lowest, highest))
+            yield (runStart, runEnd, placements)
+
+    # Returns the states with the cells set by simple boxes, simple spaces, forcing, glue and splitting, or None on a contradiction
+    def Deduce(self, states, earliest, latest):
+        unknownValue = CellState.UNKNOWN.value
+        voidValue = CellState.VOID.value
+        filledValue = CellState.FILLED.value
+        lengths = self.Lengths
+        width = len(states)
+        filled = [False] * width
+        void = [False] * width
+
+        # Simple boxes
+        for i in range(len(lengths)):
+            for cell in range(latest[i], earliest[i] + lengths[i]):
+                filled[cell] = True
+
+        # Simple spaces and forcing: only the cells of a start that fits, between the earliest and latest, can be reached
+        lastVoid = []
+        previous = -1
+        for cell in range(width):
+            if(states[cell] == voidValue):
+                previous = cell
+            lastVoid.append(previous)
+        reachMarks = [0] * (width + 1)
+        for i in range(len(lengths)):
+            for start in range(earliest[i], latest[i] + 1):
+                end = start + lengths[i]
+                if(lastVoid[end - 1] < start and (end == width or states[end] != filledValue)
+                   and (start == 0 or states[start - 1] != filledValue)):
+                    reachMarks[start] += 1
+                    reachMarks[end] -= 1
+        reach = 0
+        for cell in range(width):
+            reach += reachMarks[cell]
+            if(reach == 0):
+                void[cell] = True
+
+        # Glue: whichever block covers a run, the cells every one of its placements covers are FILLED
+        for runStart, runEnd, placements in self.Runs(states, earliest, latest):
+            if(len(placements) == 0):
+                return None
+            low = max(highest for block, lowest, highest in placements)
+            high = min(lowest + lengths[block] for block, lowest, highest in placements)
+            for cell in range(low, high):
+                filled[cell] = True
+
+        # Splitting: filling the cell would make a run no block can cover
+        for cell in range(width):
+            if(states[cell] != unknownValue):
+                continue
+            left = cell
+            while(left > 0 and states[left - 1] == filledValue):
+                left -= 1
+            right = cell
+            while(right < width - 1 and states[right + 1] == filledValue):
+                right += 1
+            if(left == cell and right == cell):
+                continue
+            if(not any(max(earliest[i], right - lengths[i] + 1) <= min(latest[i], left) for i in range(len(lengths)))):
+                void[cell] = True
+
+        deduced = list(states)
+        for cell in range(width):
+            if(filled[cell] and void[cell]):
+                return None
+            if(filled[cell]):
+                if(states[cell] == voidValue):
+                    return None
+                deduced[cell] = filledValue
+            elif(void[cell]):
+                if(states[cell] == filledValue):
+                    return None
+                deduced[cell] = voidValue
+        return deduced
+
 #
 # The BoardLogic object takes in a BoardStructure object, and now makes it possible for us to use various methods on it.
 # The big methods used on it are of course ourAlgorithm() and Solve() which represent our own method for solving, and
@@ -610,6 +2193,45 @@ class BoardLogic(BoardStructure):
 
     def __init__(self, board):
         self.board = board
+        self.Nodes = 0
+        # If set, Solve() calls it at every node and gives up on the search once it returns True
+        self.StopCheck = None
+        self.Stats = None
+        self.Nogoods = None
+        self.Transpositions = None
+        # The nogood that explains why the last search from this board failed, or None if it was not learned
+        self.Conflict = None
+
+    # Starts recording a SolveStats for every search run on this board, and returns it
+    def EnableStats(self):
+        self.Stats = SolveStats()
+        self.Stats.Nogoods = self.Nogoods
+        self.Stats.Transpositions = self.Transpositions
+        self.board.AttachStats(self.Stats)
+        return self.Stats
+
+    # Starts learning nogoods in Solve() and SolveInPlace(), kept in a NogoodStore of at most maxEntries, and returns the store.
+    # Boards copied during the search share it.
+    def EnableNogoods(self, maxEntries = 1024):
+        self.Nogoods = NogoodStore(self.board.RowCount * self.board.ColumnCount, maxEntries)
+        if(self.Stats != None):
+            self.Stats.Nogoods = self.Nogoods
+        return self.Nogoods
+
+    # Makes Solve() and SolveInPlace() look up and store board states in the TranspositionTable, or stop if it is None.
+    # Boards copied during the search share it.
+    def AttachTranspositionTable(self, table):
+        if(table != None and not table.accepts(self.board.Puzzle)):
+            raise ValueError("The transposition table was made for a different puzzle")
+        self.Transpositions = table
+        if(self.Stats != None):
+            self.Stats.Transpositions = table
+
+    # The depth of the node a context was made for. The root is called without one.
+    def ContextDepth(self, context):
+        if(context == None or context.depth == None):
+            return 0
+        return context.depth
 
     # IsValid(), IsSet(), and IsSolved() run through all the rows and columns of the board to make sure that everything is correct.
     # These are mostly used for the backtracking algorithm as it needs them in order to see when to stop.
@@ -633,931 +2255,1151 @@ class BoardLogic(BoardStructure):
 
     # This is the backtracking algorithm that we are using.  
     def Solve(self, verboseLevel, context):
+        if(self.StopCheck != None and self.StopCheck()):
+            return
+        self.Nodes += 1
+        self.Conflict = None
+        stats = self.Stats
+        depth = self.ContextDepth(context)
+        if(stats != None):
+            stats.CountNode(depth)
+            start = time.perf_counter()
         if(not self.IsValid()):
             if(verboseLevel != VerboseLevel.SILENT):
                 return
         
-        # On the first run around, the Context will be None, therefore it will set whatever cells are possible to be said are filled or void
-        if(context == None):
-            self.SetDeterminableCells()
-
-        # It will then see which lines only have 1 CandidateSolution, and set them equal to their CandidateSolution
-        self.CandidateExlclusionSolve(verboseLevel)
+        # On the first run around, the Context will be None, therefore every line is propagated. After that only the lines
+        # changed by the speculated line are, and the worklist takes care of the lines their deductions change in turn.
+        dirtyLines = self.board.ActiveLines
+        if(context != None and context.dirtyLines != None):
+            dirtyLines = context.dirtyLines
+        reasons = self.NodeReasons(context)
+        table = self.Transpositions
+        if(table != None):
+            entryState = self.EntryState(context)
+            if(self.isRoot(context) and self.LookUp(entryState) != None):
+                return
+        if(stats != None):
+            start = stats.AddTime("validity", start)
+        self.PropagateWorklist(dirtyLines, reasons)
+        if(stats != None):
+            start = stats.AddTime("propagation", start)
+        if(self.StopCheck != None and self.StopCheck()):
+            return
 
         # Board must be valid and not solved in order for the algorithm to process everything it needs to.
-        if(self.IsValid() and not self.IsSolved()):        
-
-            #Grab all lines that have at least one UNKNOWN CellState 
-            undeterminedLines = []
-            for i in self.board.ActiveLines:
-                if i.isSet() == False:
-                    undeterminedLines.append(i)
-            #Stops the solving if undeterminedLines doesn't have a length.
-            if(len(undeterminedLines) == 0):
+        searching = self.IsValid() and not self.IsSolved()
+        if(stats != None):
+            start = stats.AddTime("validity", start)
+        if(table != None and not searching):
+            self.StoreOutcome(entryState, depth)
+        if(searching):        
+
+            #Stops the solving if there is no line with an UNKNOWN CellState left.
+            speculationTarget = self.SelectSpeculationTarget()
+            if(speculationTarget == None):
                 return
 
-            #Grab the undeterminedLine with the least number of CandidateSolutions
-            speculationTarget = undeterminedLines[0]  
-            for i in undeterminedLines:
-                if speculationTarget.CandidateCount() >  i.CandidateCount():
-                    speculationTarget = i    
-
-            candidateSolutions = speculationTarget.CandidateSolutions
-            candidatesCount = len(candidateSolutions)
+            speculationTarget.EnumerateCandidates()
+            candidatesCount = speculationTarget.CandidateCount()
+            if(stats != None):
+                stats.AddTime("selection", start)
+            if(reasons != None or table != None):
+                boardMasks = self.board.BoardMasks()
+                conflicts = []
+            if(table != None):
+                nodeState = self.StateAfter(entryState, boardMasks)
 
             # Create a new board which will take in the old board and set the lines of the board based on the SpeculationTarget
             for i in range(candidatesCount):
+                childState = None
+                if(reasons != None or table != None):
+                    childMasks = self.CandidateMasks(boardMasks, speculationTarget, speculationTarget.GetCandidate(i))
+                if(table != None):
+                    childState = self.StateAfter(nodeState, childMasks)
+                    status = self.LookUp(childState)
+                    if(status == SolveStatus.SOLVED):
+                        self.StoreOutcome(entryState, depth)
+                        return
+                    if(status == SolveStatus.CONTRADICTION):
+                        conflicts.append(None)
+                        continue
+                if(reasons != None):
+                    nogood = self.FindNogood(childMasks)
+                    if(nogood != None):
+                        conflicts.append(nogood)
+                        continue
+                if(stats != None):
+                    start = time.perf_counter()
                 speculativeBoard = BoardLogic(BoardStructure(None, self.board))
-                speculativeBoard.board.SetLineSolution(speculationTarget.Type, speculationTarget.Index, candidateSolutions[i])
+                speculativeBoard.StopCheck = self.StopCheck
+                speculativeBoard.Stats = stats
+                speculativeBoard.Nogoods = self.Nogoods
+                speculativeBoard.Transpositions = table
+                if(stats != None):
+                    start = stats.AddTime("copying", start)
+                dirtyLines = speculativeBoard.board.SetLineSolution(speculationTarget.Type, speculationTarget.Index, speculationTarget.GetCandidate(i))
+                if(stats != None):
+                    stats.AddTime("propagation", start)
 
                 #Method to track how many times we have recursed through the board
                 speculativeContext = SpeculativeCallContext()
-                if(context == None):
-                    context = speculativeContext
-                    speculativeContext.depth = 1
-                elif(context.depth != None):
-                    speculativeContext.depth = context.depth + 1
+                speculativeContext.depth = depth + 1
                 speculativeContext.optionIndex = i
                 speculativeContext.optionsCount = candidatesCount
+                speculativeContext.dirtyLines = dirtyLines
+                speculativeContext.reasons = reasons
+                speculativeContext.tableState = childState
                 
                 #Recursive Call
                 speculativeBoard.Solve(verboseLevel, speculativeContext)
+                self.Nodes += speculativeBoard.Nodes
 
                 #Board is assumed to be correct if it can pass this if statement
-                if(speculativeBoard.IsValid() and speculativeBoard.IsSolved()):
+                if(stats != None):
+                    start = time.perf_counter()
+                solved = speculativeBoard.IsValid() and speculativeBoard.IsSolved()
+                if(stats != None):
+                    stats.AddTime("validity", start)
+                if(solved):
                     self.board.Copy(speculativeBoard)
+                    if(table != None):
+                        self.StoreOutcome(entryState, depth)
                     return
-        
-    def SetDeterminableCells(self):
-        for i in self.board.ActiveLines:
-            i.ApplyLine(i.GetDeterminableCells())
-
-    def CandidateExlclusionSolve(self, verboseLevel):
-        solvableLines = []
-        for i in self.board.ActiveLines:
-            if(not i.isSet() and len(i.CandidateSolutions) == 1):
-                solvableLines.append(i)
-        while(len(solvableLines) > 0 and self.IsValid()):
-            selectedLine = solvableLines[0]
-            selectedLine.ApplyLine(selectedLine.CandidateSolutions[0])
-            solvableLines.pop(0)
+                if(self.StopCheck != None and self.StopCheck()):
+                    return
+                if(reasons != None):
+                    conflicts.append(speculativeBoard.Conflict)
 
-    #Print out the board
-    def Print(self):
-        for row in self.board.Rows:
-            row.Print()
+            if(reasons != None):
+                self.LearnFromBranches(speculationTarget, conflicts, reasons)
+            if(table != None):
+                self.StoreOutcome(entryState, depth)
+        
+    # Opt in parallel version of Solve(). The branches of the first `levels` levels of the search are expanded here in the order
+    # Solve() would try them, and each one is sent as a serialized board to a ProcessPoolExecutor with `workers` processes as soon
+    # as it is expanded, so the workers start on the first branches while the later ones are still being propagated here.
+    # With deterministic set the solution kept is the one from the earliest branch in that order, so it is the same one Solve()
+    # finds, but a solution from a later branch then has to wait for every branch before it to fail. With deterministic off it is
+    # the first one any branch finds, and only whether there is a solution is sure to match Solve(). Once the solution is known,
+    # the expansion ends, the branches still waiting are cancelled and the running ones are told to stop.
+    def ParallelSolve(self, verboseLevel, workers, levels, deterministic = True):
+        self.Nodes += 1
+        self.PropagateWorklist(self.board.ActiveLines)
+        if(not self.IsValid() or self.IsSolved()):
+            return
+
+        results = []
+        answer = None
+        stopEvent = multiprocessing.Event()
+        with ProcessPoolExecutor(max_workers = workers, initializer = InitParallelWorker, initargs = (stopEvent,)) as executor:
+            futures = {}
+            pending = set()
+            for branch in self.GatherBranches(levels, 1):
+                if(branch[0] == "solved"):
+                    results.append((True, branch[1], 0))
+                else:
+                    future = executor.submit(SolveSerializedBoard, branch[1], branch[2])
+                    futures[future] = len(results)
+                    pending.add(future)
+                    results.append(None)
+                pending = self.CollectBranches(futures, pending, results, 0)
+                answer = self.SolvedBranch(results, deterministic)
+                if(answer != None):
+                    break
 
+            while(answer == None and len(pending) > 0):
+                pending = self.CollectBranches(futures, pending, results, None)
+                answer = self.SolvedBranch(results, deterministic)
+
+            stopEvent.set()
+            for future in pending:
+                future.cancel()
+
+        if(answer != None):
+            self.board.LoadStates(answer[1])
+
+    # Waits up to timeout seconds (None waits for the first one) for the pending branches, stores the results of the ones that
+    # finished, and returns the ones still pending
+    def CollectBranches(self, futures, pending, results, timeout):
+        if(len(pending) == 0):
+            return pending
+        done, pending = wait(pending, timeout = timeout, return_when = FIRST_COMPLETED)
+        for future in done:
+            results[futures[future]] = future.result()
+            self.Nodes += future.result()[2]
+        return pending
+
+    # Expands the search the way Solve() does for `levels` levels and yields every branch left at the bottom, in the order
+    # Solve() would reach them. Branches solved on the way down are yielded as already solved.
+    def GatherBranches(self, levels, depth):
+        speculationTarget = self.SelectSpeculationTarget()
+        if(speculationTarget == None):
+            return
+
+        speculationTarget.EnumerateCandidates()
+        for i in range(speculationTarget.CandidateCount()):
+            speculativeBoard = BoardLogic(BoardStructure(None, self.board))
+            dirtyLines = speculativeBoard.board.SetLineSolution(speculationTarget.Type, speculationTarget.Index, speculationTarget.GetCandidate(i))
+            if(levels == 1):
+                yield ("job", speculativeBoard.board.Serialize(), depth)
+                continue
+
+            self.Nodes += 1
+            speculativeBoard.PropagateWorklist(dirtyLines)
+            if(not speculativeBoard.IsValid()):
+                continue
+            if(speculativeBoard.IsSolved()):
+                yield ("solved", speculativeBoard.board.Serialize()[4])
+                continue
+            # The nodes are counted even when ParallelSolve() stops the expansion part way through
+            try:
+                yield from speculativeBoard.GatherBranches(levels - 1, depth + 1)
+            finally:
+                self.Nodes += speculativeBoard.Nodes
+
+    # Returns the result of a solved branch, or None. Which one depends on deterministic, as in ParallelSolve().
+    def SolvedBranch(self, results, deterministic):
+        if(deterministic):
+            return self.EarliestSolvedBranch(results)
+        for result in results:
+            if(result != None and result[0]):
+                return result
+        return None
+
+    # Returns the result of the earliest solved branch, but only once every branch before it is known to have failed
+    def EarliestSolvedBranch(self, results):
+        for result in results:
+            if(result == None):
+                return None
+            if(result[0]):
+                return result
+        return None
+
+    # Returns the line with the least number of CandidateSolutions out of the lines that have at least one UNKNOWN CellState,
+    # using the board's TargetQueue. Returns None if every line is set.
+    def SelectSpeculationTarget(self):
+        return self.board.TargetQueue.Select(self.board.Trail)
+
+    # Picks how SelectSpeculationTarget() chooses between lines with the same number of candidates. Boards copied from this one keep it.
+    def SetTieBreak(self, tieBreak):
+        self.board.TargetQueue.TieBreak = tieBreak
+
+    # Same search as Solve(), but done on this one board. Instead of copying the board for every branch, each branch saves a
+    # Trail mark, and if it fails the Trail is undone back to that mark. It tries the candidates in the same order as Solve(),
+    # so it finds the same solution.
+    def SolveInPlace(self, verboseLevel, context):
+        if(context == None):
+            self.board.AttachTrail(Trail())
+            self.SearchInPlace(verboseLevel, None)
+            self.board.AttachTrail(None)
+        else:
+            self.SearchInPlace(verboseLevel, context)
+
+    def SearchInPlace(self, verboseLevel, context):
+        if(self.StopCheck != None and self.StopCheck()):
+            return
+        self.Nodes += 1
+        self.Conflict = None
+        stats = self.Stats
+        depth = self.ContextDepth(context)
+        if(stats != None):
+            stats.CountNode(depth)
+            start = time.perf_counter()
+        if(not self.IsValid()):
+            if(verboseLevel != VerboseLevel.SILENT):
+                return
 
-    #Our Algorithm using the mathematical approach.
-    def ourAlgorithm(self):
-            for activeLines in self.board.Columns:
-                #Start with columns, see if the line is Trivial, and if it is then set it to its trivial solution
-                if(activeLines.Rules.isTrivial()):
-                    activeLines.Cells = activeLines.Rules.getTrivialSolution().Cells
-
-                #If not then run through the Mathematical Approach on the line
-                else:    
-                    rules = activeLines.Rules.Rules
-                    addedRule = 0
-
-                    for rule in rules:
-                        addedRule += rule + 1
-            
-                    addedRule -= 1
-                    difference = self.board.RowCount - addedRule
-
-                    candidateRules = []
-
-                    for rule in rules:
-                        if rule > difference:
-                            candidateRules.append(rule)
-
-                    cellIndex = -1
-
-                    for rule in rules:
-
-                        if rule in candidateRules:
-                            fillAmount = rule - difference
-                            cellIndex += rule
-                            cellIndexFilledTo = cellIndex - fillAmount
-                    
-                            for i in range(cellIndex, cellIndexFilledTo, -1):
-                                activeLines.Cells[i].setState(CellState.FILLED)
-                            cellIndex += 1
-                        else:
-                            cellIndex += rule + 1
-
-            for activeLines in self.board.Rows:
-                #See if lines in the rows are trivial, if they are then set their trivial solution
-                if(activeLines.Rules.isTrivial()):
-                    activeLines.Cells = activeLines.Rules.getTrivialSolution().Cells
-                #If not trivial then run through the mathemtaical approach on the line
-                else:    
-                    rules = activeLines.Rules.Rules
-                    addedRule = 0
-
-                    for rule in rules:
-                        addedRule += rule + 1
-            
-                    addedRule -= 1
+        dirtyLines = self.board.ActiveLines
+        if(context != None and context.dirtyLines != None):
+            dirtyLines = context.dirtyLines
+        reasons = self.NodeReasons(context)
+        table = self.Transpositions
+        if(table != None):
+            entryState = self.EntryState(context)
+            if(self.isRoot(context) and self.LookUp(entryState) != None):
+                return
+        if(stats != None):
+            start = stats.AddTime("validity", start)
+        self.PropagateWorklist(dirtyLines, reasons)
+        if(stats != None):
+            start = stats.AddTime("propagation", start)
+        if(self.StopCheck != None and self.StopCheck()):
+            return
+
+        searching = self.IsValid() and not self.IsSolved()
+        if(stats != None):
+            start = stats.AddTime("validity", start)
+        if(table != None and not searching):
+            self.StoreOutcome(entryState, depth)
+        if(searching):
+            speculationTarget = self.SelectSpeculationTarget()
+            if(speculationTarget == None):
+                return
 
-                    difference = self.board.ColumnCount - addedRule
+            speculationTarget.EnumerateCandidates()
+            candidatesCount = speculationTarget.CandidateCount()
+            trail = self.board.Trail
+            if(stats != None):
+                stats.AddTime("selection", start)
+            if(reasons != None or table != None):
+                boardMasks = self.board.BoardMasks()
+                conflicts = []
+            if(table != None):
+                nodeState = self.StateAfter(entryState, boardMasks)
 
-                    candidateRules = []
+            for i in range(candidatesCount):
+                candidate = speculationTarget.GetCandidate(i)
+                childState = None
+                if(reasons != None or table != None):
+                    childMasks = self.CandidateMasks(boardMasks, speculationTarget, candidate)
+                if(table != None):
+                    childState = self.StateAfter(nodeState, childMasks)
+                    status = self.LookUp(childState)
+                    if(status == SolveStatus.SOLVED):
+                        self.StoreOutcome(entryState, depth)
+                        return
+                    if(status == SolveStatus.CONTRADICTION):
+                        conflicts.append(None)
+                        continue
+                if(reasons != None):
+                    nogood = self.FindNogood(childMasks)
+                    if(nogood != None):
+                        conflicts.append(nogood)
+                        continue
+                if(stats != None):
+                    start = time.perf_counter()
+                mark = trail.Mark()
+
+                # Solve() reviews every line when it copies the board, so the same is done here before the line is set.
+                # It is timed as copying, since that is the work it stands in for.
+                for line in self.board.ActiveLines:
+                    line.ReviewCandidates()
+                if(stats != None):
+                    start = stats.AddTime("copying", start)
+                dirtyLines = self.board.SetLineSolution(speculationTarget.Type, speculationTarget.Index, candidate)
+                if(stats != None):
+                    stats.AddTime("propagation", start)
 
-                    for rule in rules:
-                        if rule > difference:
-                            candidateRules.append(rule)
+                speculativeContext = SpeculativeCallContext()
+                speculativeContext.depth = depth + 1
+                speculativeContext.optionIndex = i
+                speculativeContext.optionsCount = candidatesCount
+                speculativeContext.dirtyLines = dirtyLines
+                speculativeContext.reasons = reasons
+                speculativeContext.tableState = childState
+
+                self.SearchInPlace(verboseLevel, speculativeContext)
+
+                if(stats != None):
+                    start = time.perf_counter()
+                solved = self.IsValid() and self.IsSolved()
+                if(stats != None):
+                    start = stats.AddTime("validity", start)
+                if(solved):
+                    if(table != None):
+                        self.StoreOutcome(entryState, depth)
+                    return
+                if(self.StopCheck != None and self.StopCheck()):
+                    return
+                if(reasons != None):
+                    conflicts.append(self.Conflict)
+                trail.Undo(mark)
+                if(stats != None):
+                    stats.AddTime("copying", start)
+
+            if(reasons != None):
+                self.LearnFromBranches(speculationTarget, conflicts, reasons)
+            if(table != None):
+                self.StoreOutcome(entryState, depth)
+
+    # Anytime solving, for when there is a fixed latency budget. Runs the SolveInPlace() search, but stops once deadline seconds
+    # have passed or nodeBudget nodes have been searched, whichever comes first, and keeps any StopCheck the board already has.
+    # A search stopped halfway would leave speculated cells on the board, so instead the board is undone to the root and given
+    # only cells that are proven: the ones the root propagation fixed, and the ones every root branch that was not exhausted
+    # agrees on, since the solution has to be in one of them. The deadline is also checked between the lines of the root
+    # propagation, so a large board can stop before its root fixpoint. Returns an AnytimeResult.
+    def solve_anytime(self, deadline = None, nodeBudget = None):
+        result = AnytimeResult()
+        start = time.perf_counter()
+        nodesBefore = self.Nodes
+        stopCheck = self.StopCheck
+
+        def BudgetSpent():
+            if(nodeBudget != None and self.Nodes - nodesBefore >= nodeBudget):
+                return "nodes"
+            if(deadline != None and time.perf_counter() - start > deadline):
+                return "deadline"
+            if(stopCheck != None and stopCheck()):
+                return "stop"
+            return None
 
-                    filledCount = 0
+        ownTrail = self.board.Trail == None
+        if(ownTrail):
+            self.board.AttachTrail(Trail())
+        self.StopCheck = lambda: BudgetSpent() != None
+        try:
+            result.Status = self.AnytimeSearch(result)
+        finally:
+            self.StopCheck = stopCheck
+            if(ownTrail):
+                self.board.AttachTrail(None)
+
+        if(result.Status == SolveStatus.PARTIAL):
+            result.StoppedBy = BudgetSpent()
+        result.States = self.board.Serialize()[4]
+        result.Nodes = self.Nodes - nodesBefore
+        result.Time = time.perf_counter() - start
+        return result
+
+    # The search of solve_anytime(). The root is done here, so that the board can go back to it when the budget runs out and the
+    # root branches that were exhausted are known. Below the root it is SearchInPlace().
+    # The root node is only counted once its propagation is done, so a node budget never cuts the root propagation short.
+    def AnytimeSearch(self, result):
+        knownBefore = self.KnownCellCount()
+        if(self.Stats != None):
+            self.Stats.CountNode(0)
+            start = time.perf_counter()
+        consistent = self.PropagateWorklist(self.board.Rows + self.board.Columns)
+        self.Nodes += 1
+        if(self.Stats != None):
+            self.Stats.AddTime("propagation", start)
+        if(not consistent):
+            return SolveStatus.CONTRADICTION
+        result.RootCells = self.KnownCellCount() - knownBefore
+        status = self.BoardStatus()
+        if(status != SolveStatus.PARTIAL or self.StopCheck()):
+            return status
+
+        speculationTarget = self.SelectSpeculationTarget()
+        if(speculationTarget == None):
+            return status
+        speculationTarget.EnumerateCandidates()
+        candidatesCount = speculationTarget.CandidateCount()
+        trail = self.board.Trail
+        for i in range(candidatesCount):
+            mark = trail.Mark()
+            for line in self.board.ActiveLines:
+                line.ReviewCandidates()
+            speculativeContext = SpeculativeCallContext()
+            speculativeContext.depth = 1
+            speculativeContext.optionIndex = i
+            speculativeContext.optionsCount = candidatesCount
+            speculativeContext.dirtyLines = self.board.SetLineSolution(speculationTarget.Type, speculationTarget.Index, speculationTarget.GetCandidate(i))
+            self.SearchInPlace(VerboseLevel.SILENT, speculativeContext)
+            if(self.IsValid() and self.IsSolved()):
+                return SolveStatus.SOLVED
+            trail.Undo(mark)
+            if(self.StopCheck()):
+                return self.SetAgreedCells(speculationTarget, range(i, candidatesCount), result)
+            result.ExhaustedBranches += 1
+        return SolveStatus.CONTRADICTION
+
+    # Sets the cells of the line that all of the given candidates agree on, and propagates them. Returns the SolveStatus afterwards.
+    def SetAgreedCells(self, line, candidates, result):
+        filledMask = -1
+        voidMask = -1
+        for i in candidates:
+            candidateFilled, candidateVoid = line.GetCandidate(i).getMasks()
+            filledMask &= candidateFilled
+            voidMask &= candidateVoid
+        lineFilled, lineVoid = line.getMasks()
+        filledMask &= ~lineFilled
+        voidMask &= ~lineVoid
+        if(filledMask | voidMask == 0):
+            return SolveStatus.PARTIAL
+
+        knownBefore = self.KnownCellCount()
+        for mask, state in [(filledMask, CellState.FILLED), (voidMask, CellState.VOID)]:
+            while(mask):
+                lowest = mask & -mask
+                line.SetCell(lowest.bit_length() - 1, state)
+                mask ^= lowest
+        consistent = self.PropagateWorklist([line] + self.board.CrossingLines(line, filledMask | voidMask))
+        result.BranchCells = self.KnownCellCount() - knownBefore
+        if(not consistent):
+            return SolveStatus.CONTRADICTION
+        return self.BoardStatus()
+
+    def KnownCellCount(self):
+        states = self.board.Serialize()[4]
+        return len(states) - states.count(CellState.UNKNOWN.value)
+
+    # The async entry point, for running the solver inside an asyncio service. The SolveInPlace() search runs as a loop with its own
+    # stack (IterateSearch()), and control goes back to the event loop every yieldEvery nodes or yieldSeconds seconds, whichever
+    # comes first, so many puzzles can be solved on one loop without starving everything else. The time is also checked between
+    # the lines a node propagates or reviews, so a large board does not hold the loop for a whole pass over its lines. The work
+    # on a single line is never split, so yieldSeconds is only how long the loop is held for on average. Cancelling the task,
+    # or asyncio.wait_for() timing it out, stops the search at the next yield and undoes the board to where it was before the call.
+    # With an executor the search is run there instead, on a serialized copy of the board, and the solution is loaded into the
+    # board when it comes back. A search that is already running in the executor cannot be stopped: if the task is cancelled,
+    # the search keeps going in the background and its result is thrown away.
+    # Returns SOLVED or CONTRADICTION.
+    async def solve_async(self, yieldEvery = 64, yieldSeconds = 0.01, executor = None):
+        if(executor != None):
+            solved, states, nodes = await asyncio.get_running_loop().run_in_executor(executor, SolveSerializedBoard, self.board.Serialize(), 0)
+            self.Nodes += nodes
+            if(not solved):
+                return SolveStatus.CONTRADICTION
+            self.board.LoadStates(states)
+            return SolveStatus.SOLVED
+
+        ownTrail = self.board.Trail == None
+        if(ownTrail):
+            self.board.AttachTrail(Trail())
+        search = self.IterateSearch()
+        try:
+            nodes = 0
+            lastYield = time.perf_counter()
+            while(True):
+                try:
+                    if(next(search)):
+                        nodes += 1
+                except StopIteration as finished:
+                    return SolveStatus.SOLVED if finished.value else SolveStatus.CONTRADICTION
+                if(nodes >= yieldEvery or time.perf_counter() - lastYield >= yieldSeconds):
+                    await asyncio.sleep(0)
+                    nodes = 0
+                    lastYield = time.perf_counter()
+        finally:
+            search.close()
+            if(ownTrail):
+                self.board.AttachTrail(None)
+
+    # SearchInPlace() as a generator with an explicit stack instead of recursion. It yields True after every node, and False
+    # between the lines a node propagates or reviews, and returns whether it found a solution. It tries the candidates in the same
+    # order, so it finds the same solution. Closing it before it finishes undoes everything it did, the root propagation included.
+    def IterateSearch(self):
+        trail = self.board.Trail
+        rootMark = trail.Mark()
+        # Every frame is [speculation target, index of the next candidate to try, Trail mark from before the current one]
+        stack = []
+        dirtyLines = self.board.ActiveLines
+        try:
+            while(True):
+                self.Nodes += 1
+                if(self.Stats != None):
+                    self.Stats.CountNode(len(stack))
+                    start = time.perf_counter()
+                for consistent in self.PropagateSteps(dirtyLines):
+                    if(consistent != None):
+                        break
+                    yield False
+                if(self.Stats != None):
+                    self.Stats.AddTime("propagation", start)
+                if(consistent and self.IsValid()):
+                    if(self.IsSolved()):
+                        return True
+                    speculationTarget = self.SelectSpeculationTarget()
+                    if(speculationTarget != None):
+                        speculationTarget.EnumerateCandidates()
+                        stack.append([speculationTarget, 0, None])
+                yield True
+
+                # Backs up to the deepest frame with a candidate left, undoing the branches that failed on the way
+                while(True):
+                    if(len(stack) == 0):
+                        return False
+                    frame = stack[-1]
+                    if(frame[2] != None):
+                        trail.Undo(frame[2])
+                    if(frame[1] < frame[0].CandidateCount()):
+                        break
+                    stack.pop()
+
+                speculationTarget = frame[0]
+                frame[2] = trail.Mark()
+                for line in self.board.ActiveLines:
+                    line.ReviewCandidates()
+                    yield False
+                dirtyLines = self.board.SetLineSolution(speculationTarget.Type, speculationTarget.Index, speculationTarget.GetCandidate(frame[1]))
+                frame[1] += 1
+        except GeneratorExit:
+            trail.Undo(rootMark)
+            raise
+
+    # Counts the solutions of the board and stops as soon as `limit` of them are found, so count_solutions(2) tells a puzzle with
+    # a unique solution (1) from one with several (2). It runs the SolveInPlace() search from the Presolve() fixpoint, with the
+    # same propagation, Trail and candidate caching, but keeps going after a solution. The first solution found is left on the
+    # board. Returns the number of solutions found, which is at most limit, and fewer if the StopCheck stopped the search.
+    def count_solutions(self, limit = 2):
+        status = self.Presolve()
+        if(status == SolveStatus.CONTRADICTION or limit <= 0):
+            return 0
+        if(status == SolveStatus.SOLVED):
+            return 1
 
-                    for cells in activeLines.Cells:
-                        if cells.getState() == CellState.FILLED:
-                            filledCount += 1
+        ownTrail = self.board.Trail == None
+        if(ownTrail):
+            self.board.AttachTrail(Trail())
+        solutions = []
+        rootContext = SpeculativeCallContext()
+        rootContext.depth = 0
+        rootContext.dirtyLines = []
+        self.CountInPlace(rootContext, limit, solutions)
+        if(ownTrail):
+            self.board.AttachTrail(None)
+
+        if(len(solutions) > 0):
+            self.board.LoadStates(solutions[0])
+        return len(solutions)
+
+    # The search of count_solutions(). Each solution is added to the list as the bytes of its cell states, and every branch is
+    # undone before the next one, so the board is back where it started when this returns.
+    def CountInPlace(self, context, limit, solutions):
+        if(self.StopCheck != None and self.StopCheck()):
+            return
+        self.Nodes += 1
+        if(self.Stats != None):
+            self.Stats.CountNode(context.depth)
+            start = time.perf_counter()
+        consistent = self.PropagateWorklist(context.dirtyLines)
+        if(self.Stats != None):
+            self.Stats.AddTime("propagation", start)
+        if(not consistent or not self.IsValid()):
+            return
+        if(self.IsSolved()):
+            solutions.append(self.board.Serialize()[4])
+            return
+
+        speculationTarget = self.SelectSpeculationTarget()
+        if(speculationTarget == None):
+            return
+        speculationTarget.EnumerateCandidates()
+        trail = self.board.Trail
+        for i in range(speculationTarget.CandidateCount()):
+            mark = trail.Mark()
+            speculativeContext = SpeculativeCallContext()
+            speculativeContext.depth = context.depth + 1
+            speculativeContext.dirtyLines = self.board.SetLineSolution(speculationTarget.Type, speculationTarget.Index, speculationTarget.GetCandidate(i))
+            self.CountInPlace(speculativeContext, limit, solutions)
+            trail.Undo(mark)
+            if(len(solutions) >= limit or (self.StopCheck != None and self.StopCheck())):
+                return
 
-                    cellIndex = -1
+    # Worklist propagation. Only the lines in the queue are reviewed and asked for their determinable cells. When a line
+    # deduces new cells, only the lines crossing those cells are queued, so the work done follows what actually changed.
+    # Runs until the queue is empty, and returns False as soon as a line is left with no candidate solution.
+    # With reasons given, every deduced cell is recorded in the last of them along with the cells its line knew when it was deduced,
+    # and a contradiction is explained and learned as a nogood.
+    def PropagateWorklist(self, dirtyLines, reasons = None):
+        for consistent in self.PropagateSteps(dirtyLines, reasons):
+            if(consistent != None):
+                return consistent
+
+    # The work of PropagateWorklist() as a generator, so it can be paused between lines. It yields None after every line and
+    # then the result, True or False. The StopCheck is also checked between lines, so a long propagation can be stopped.
+    # A stopped propagation gives True, since every cell it set is still a sound deduction, and leaves the rest of the queue.
+    def PropagateSteps(self, dirtyLines, reasons = None):
+        queue = deque(dirtyLines)
+        queued = set(queue)
+        while(len(queue) > 0):
+            if(self.StopCheck != None and self.StopCheck()):
+                break
+            line = queue.popleft()
+            queued.discard(line)
+
+            line.ReviewCandidates()
+            if(not line.isValid()):
+                if(reasons != None):
+                    self.LearnConflict(line, reasons)
+                yield False
+                return
 
+            filledBefore, voidBefore = line.getMasks()
+            determinableCells = line.GetDeterminableCells()
+            newMask = (determinableCells.getMasks()[0] & ~filledBefore) | (determinableCells.getMasks()[1] & ~voidBefore)
+            if(newMask == 0):
+                yield None
+                continue
+
+            if(reasons != None):
+                reason = (line, filledBefore | voidBefore)
+                mask = newMask
+                while(mask):
+                    lowest = mask & -mask
+                    reasons[-1][self.board.CellIndex(line, lowest.bit_length() - 1)] = reason
+                    mask ^= lowest
+            line.ApplyLine(determinableCells)
+            if(self.Stats != None):
+                self.Stats.CellsDeduced["propagation"] += bin(newMask).count("1")
+            if(not line.isValid()):
+                if(reasons != None):
+                    self.LearnConflict(line, reasons)
+                yield False
+                return
+            for crossingLine in self.board.CrossingLines(line, newMask):
+                if(crossingLine not in queued):
+                    queue.append(crossingLine)
+                    queued.add(crossingLine)
+            yield None
+        yield True
+
+    # Nogood learning. A cell that propagation deduces only follows from the cells its line knew at the time, and a line left with
+    # no candidates only contradicts the cells it knows, so a failed branch can be traced back to the few speculated cells that
+    # caused it. Those make a nogood that also cuts off any other branch, sibling or cousin, that sets them the same way.
+
+    # The reasons a node records into: the ones of the nodes above it, and a new level of its own. None unless nogoods are learned.
+    def NodeReasons(self, context):
+        if(self.Nogoods == None):
+            return None
+        if(context == None or context.reasons == None):
+            return [{}]
+        return context.reasons + [{}]
+
+    # Follows the reasons back from the cells of the board mask. A deduced cell is replaced by the cells its line knew when it was
+    # deduced, until only cells with no reason are left: speculated cells, and cells set before the search. Returns those as a nogood.
+    def ExplainCells(self, boardMask, reasons):
+        pending = []
+        while(boardMask):
+            lowest = boardMask & -boardMask
+            pending.append(lowest.bit_length() - 1)
+            boardMask ^= lowest
+        seen = set(pending)
+        givenMask = 0
+        while(len(pending) > 0):
+            cell = pending.pop()
+            reason = None
+            for level in reversed(reasons):
+                reason = level.get(cell)
+                if(reason != None):
+                    break
+            if(reason == None):
+                givenMask |= 1 << cell
+                continue
+            line, knownMask = reason
+            while(knownMask):
+                lowest = knownMask & -knownMask
+                index = self.board.CellIndex(line, lowest.bit_length() - 1)
+                if(index not in seen):
+                    seen.add(index)
+                    pending.append(index)
+                knownMask ^= lowest
+        filledMask, voidMask = self.board.BoardMasks()
+        return (givenMask & filledMask, givenMask & voidMask)
+
+    def LearnConflict(self, line, reasons):
+        filledMask, voidMask = line.getMasks()
+        self.Conflict = self.ExplainCells(self.board.BoardMask(line, filledMask | voidMask), reasons)
+        self.Nogoods.Add(self.Conflict)
+
+    # When every branch of a node failed with a nogood the node fails too, since the speculation target has to take one of the
+    # candidates tried. Its nogood is the branches' nogoods without the cells of the target, along with the explanation of the
+    # target's cells that were already known, as those are what limited the candidates.
+    def LearnFromBranches(self, target, conflicts, reasons):
+        if(None in conflicts):
+            self.Conflict = None
+            return
+        filledMask, voidMask = target.getMasks()
+        filledMask, voidMask = self.ExplainCells(self.board.BoardMask(target, filledMask | voidMask), reasons)
+        targetMask = self.board.BoardMask(target, (1 << target.Length()) - 1)
+        for conflict in conflicts:
+            filledMask |= conflict[0] & ~targetMask
+            voidMask |= conflict[1] & ~targetMask
+        self.Conflict = (filledMask, voidMask)
+        self.Nogoods.Add(self.Conflict)
+
+    # The board masks the board would have after setting the target to the candidate
+    def CandidateMasks(self, boardMasks, target, candidate):
+        candidateFilled, candidateVoid = candidate.getMasks()
+        return (boardMasks[0] | self.board.BoardMask(target, candidateFilled), boardMasks[1] | self.board.BoardMask(target, candidateVoid))
+
+    # Returns a nogood held by a board with these masks, or None
+    def FindNogood(self, masks):
+        if(self.Stats != None):
+            start = time.perf_counter()
+        nogood = self.Nogoods.Find(masks[0], masks[1])
+        if(self.Stats != None):
+            self.Stats.AddTime("nogoods", start)
+        return nogood
+
+    # The TranspositionTable works on (Zobrist hash, board masks) states. The root hashes its whole board. Every other node gets the
+    # state it starts from from its parent, and the hash is brought up to date by XORing in only the cells set since.
+
+    def isRoot(self, context):
+        return context == None or context.tableState == None
+
+    def EntryState(self, context):
+        if(not self.isRoot(context)):
+            return context.tableState
+        masks = self.board.BoardMasks()
+        return (self.Transpositions.Keys.Hash(masks), masks)
+
+    def StateAfter(self, state, masks):
+        newCells = (masks[0] & ~state[1][0], masks[1] & ~state[1][1])
+        return (state[0] ^ self.Transpositions.Keys.Hash(newCells), masks)
+
+    # Looks the state up in the table, and loads the solution into the board if it has a known one. Returns the SolveStatus
+    # stored for the state, or None.
+    def LookUp(self, state):
+        if(self.Stats != None):
+            start = time.perf_counter()
+        entry = self.Transpositions.Find(state[0], state[1])
+        if(entry != None and entry[0] == SolveStatus.SOLVED):
+            self.board.LoadStates(entry[1])
+        if(self.Stats != None):
+            self.Stats.AddTime("transpositions", start)
+        return None if entry == None else entry[0]
+
+    # Stores how the search from the state ended: SOLVED along with the cells if the board is solved, and CONTRADICTION otherwise
+    def StoreOutcome(self, state, depth):
+        if(self.Stats != None):
+            start = time.perf_counter()
+        if(self.IsValid() and self.IsSolved()):
+            self.Transpositions.Store(state[0], state[1], SolveStatus.SOLVED, self.board.Serialize()[4], depth)
+        else:
+            self.Transpositions.Store(state[0], state[1], SolveStatus.CONTRADICTION, None, depth)
+        if(self.Stats != None):
+            self.Stats.AddTime("transpositions", start)
+
+    # Runs ApplyTechniques() with a worklist the way PropagateWorklist() runs the candidates: when a line deduces new cells, the lines
+    # crossing them are queued. No candidates are enumerated or reviewed, so the lines are left to be reviewed by the search.
+    # Returns False as soon as a line contradicts its rules.
+    def TechniquePropagate(self, dirtyLines):
+        queue = deque(dirtyLines)
+        queued = set(queue)
+        while(len(queue) > 0):
+            line = queue.popleft()
+            queued.discard(line)
+
+            newMask = line.ApplyTechniques()
+            if(newMask == None):
+                return False
+            if(newMask == 0):
+                continue
+            if(self.Stats != None):
+                self.Stats.CellsDeduced["techniques"] += bin(newMask).count("1")
+            for crossingLine in self.board.CrossingLines(line, newMask):
+                if(crossingLine not in queued):
+                    queue.append(crossingLine)
+                    queued.add(crossingLine)
+        return True
 
-                    for rule in rules:
+    # Line logic alone: rows are deduced first, then the columns they changed, then the rows those changed and so on,
+    # until a whole round changes nothing. Returns the SolveStatus of the board at that fixpoint.
+    def Presolve(self):
+        if(not self.PropagateWorklist(self.board.Rows + self.board.Columns)):
+            return SolveStatus.CONTRADICTION
+        return self.BoardStatus()
 
-                        if rule in candidateRules:
-                    
-                            fillAmount = rule - difference
+    # The SolveStatus of the board as it is, without deducing anything
+    def BoardStatus(self):
+        if(not self.IsValid()):
+            return SolveStatus.CONTRADICTION
+        if(self.IsSet()):
+            if(self.IsSolved()):
+                return SolveStatus.SOLVED
+            return SolveStatus.CONTRADICTION
+        return SolveStatus.PARTIAL
+
+    # Runs Presolve() and only starts Solve() if the fixpoint left the board partially solved, so the search starts from the
+    # fixpoint instead of deducing the root again. With probe set, Probe() runs on the fixpoint before the search.
+    # Returns the status found before the search.
+    def SolveFromFixpoint(self, verboseLevel, probe = False):
+        if(self.Stats != None):
+            start = time.perf_counter()
+        status = self.Presolve()
+        if(self.Stats != None):
+            self.Stats.AddTime("propagation", start)
+        if(status == SolveStatus.PARTIAL and probe):
+            status = self.Probe()
+        if(status == SolveStatus.PARTIAL):
+            rootContext = SpeculativeCallContext()
+            rootContext.depth = 0
+            rootContext.dirtyLines = []
+            self.Solve(verboseLevel, rootContext)
+        return status
+
+    # Solves the board with the SAT backend of SatSolver.py instead of the line search. The cells already known on the board are
+    # added as unit clauses, so it can also finish a board after Presolve(), and the solution is loaded into the board.
+    # Nodes counts the decisions of the SAT solver. Returns SOLVED, CONTRADICTION, or PARTIAL if the StopCheck stopped it.
+    def SolveSat(self):
+        if(self.Stats != None):
+            start = time.perf_counter()
+        cnf = SatSolver.NonogramCnf(self.board.Puzzle.ColumnRules, self.board.Puzzle.RowRules, self.StopCheck)
+        states = self.board.Serialize()[4]
+        for cell in range(len(states)):
+            if(states[cell] != CellState.UNKNOWN.value):
+                cnf.SetCell(cell // self.board.ColumnCount, cell % self.board.ColumnCount, states[cell] == CellState.FILLED.value)
+        rows = cnf.Solve(self.StopCheck)
+        self.Nodes += cnf.Solver.Decisions
+        if(self.Stats != None):
+            self.Stats.Sat = cnf.Solver.Stats()
+            self.Stats.AddTime("sat", start)
+        if(rows == None):
+            return SolveStatus.PARTIAL
+        if(rows == False):
+            return SolveStatus.CONTRADICTION
+        self.board.LoadStates(bytes(CellState.FILLED.value if cell else CellState.VOID.value for row in rows for cell in row))
+        return SolveStatus.SOLVED
+
+    # Probing: every UNKNOWN cell is tried as FILLED and as VOID, and each try is propagated and then undone with the Trail.
+    # If one value leads to a contradiction the cell takes the other one along with everything it propagates to, and otherwise
+    # the cells both tries agree on are set. Passes repeat until one sets nothing. A cell whose tries found nothing is not tried
+    # again until its row or column changes. Meant for a board at its line logic fixpoint, like after Presolve().
+    # It stops between cells once the StopCheck fires. Returns the SolveStatus of the board afterwards.
+    def Probe(self):
+        stats = self.Stats
+        # The tries would count their propagation as if it were kept, so the stats only get the cells probing fixed
+        if(stats != None):
+            start = time.perf_counter()
+            self.Stats = None
+            self.board.AttachStats(None)
+        unknownBefore = self.board.Serialize()[4].count(CellState.UNKNOWN.value)
+        ownTrail = self.board.Trail == None
+        if(ownTrail):
+            self.board.AttachTrail(Trail())
+
+        status = self.ProbePasses()
+
+        if(ownTrail):
+            self.board.AttachTrail(None)
+        if(stats != None):
+            self.Stats = stats
+            self.board.AttachStats(stats)
+            stats.CellsDeduced["probing"] += unknownBefore - self.board.Serialize()[4].count(CellState.UNKNOWN.value)
+            stats.AddTime("probing", start)
+        return status
+
+    def ProbePasses(self):
+        unknown = CellState.UNKNOWN.value
+        columnCount = self.board.ColumnCount
+        quietCells = {}
+        changed = True
+        while(changed):
+            changed = False
+            states = self.board.Serialize()[4]
+            for cell in range(len(states)):
+                if(states[cell] != unknown):
+                    continue
+                if(self.StopCheck != None and self.StopCheck()):
+                    return self.BoardStatus()
+                row = self.board.Rows[cell // columnCount]
+                column = self.board.Columns[cell % columnCount]
+                lineMasks = (row.getMasks(), column.getMasks())
+                if(quietCells.get(cell) == lineMasks):
+                    continue
+
+                filledStates = self.TryCell(row, cell % columnCount, CellState.FILLED)
+                voidStates = self.TryCell(row, cell % columnCount, CellState.VOID)
+                if(filledStates == None and voidStates == None):
+                    return SolveStatus.CONTRADICTION
+                if(filledStates == None):
+                    newCells = [i for i in range(len(states)) if states[i] == unknown and voidStates[i] != unknown]
+                    outcome = voidStates
+                elif(voidStates == None):
+                    newCells = [i for i in range(len(states)) if states[i] == unknown and filledStates[i] != unknown]
+                    outcome = filledStates
+                else:
+                    newCells = [i for i in range(len(states)) if states[i] == unknown and filledStates[i] == voidStates[i] != unknown]
+                    outcome = filledStates
+                if(len(newCells) == 0):
+                    quietCells[cell] = lineMasks
+                    continue
+
+                dirtyLines = []
+                for i in newCells:
+                    self.board.Rows[i // columnCount].SetCell(i % columnCount, CellState(outcome[i]))
+                    for line in [self.board.Rows[i // columnCount], self.board.Columns[i % columnCount]]:
+                        if(line not in dirtyLines):
+                            dirtyLines.append(line)
+                if(not self.PropagateWorklist(dirtyLines)):
+                    return SolveStatus.CONTRADICTION
+                states = self.board.Serialize()[4]
+                changed = True
+
+        if(self.IsSet()):
+            if(self.IsSolved()):
+                return SolveStatus.SOLVED
+            return SolveStatus.CONTRADICTION
+        return SolveStatus.PARTIAL
+
+    # Sets one cell of the row and propagates it. Returns the states of the board if no line contradicts it, or None.
+    # Everything it changed is undone with the Trail before it returns.
+    def TryCell(self, row, index, state):
+        trail = self.board.Trail
+        mark = trail.Mark()
+        row.SetCell(index, state)
+        consistent = self.PropagateWorklist([row, self.board.Columns[index]])
+        states = self.board.Serialize()[4] if consistent else None
+        trail.Undo(mark)
+        return states
 
-                            cellIndex += rule
+    #Print out the board
+    def Print(self):
+        for row in self.board.Rows:
+            row.Print()
 
-                            cellIndexFilledTo = cellIndex - fillAmount
-                    
-                            for i in range(cellIndex, cellIndexFilledTo, -1):
-                                activeLines.Cells[i].setState(CellState.FILLED)
 
-                            cellIndex += 1
-                        else:
-                            cellIndex += rule + 1
+    # Our Algorithm using the mathematical approach. The overlap and fill count rules are run on every line until they stop finding
+    # new cells, with the cells already known narrowing where each block can go. With NumPy the whole board is handed to an
+    # OverlapEngine, and without it OverlapPass() does the same overlap line by line. The LineTechniques then finish what
+    # the overlap left. Returns False if the rules show the board has no solution.
+    def ourAlgorithm(self):
+        if(numpy == None):
+            if(not self.OverlapPass()):
+                return False
+        else:
+            states = numpy.frombuffer(self.board.Serialize()[4], dtype = numpy.uint8).reshape(self.board.RowCount, self.board.ColumnCount).copy()
+            if(not OverlapEngine(self.board.Puzzle.ColumnRules, self.board.Puzzle.RowRules).Run(states)):
+                return False
+            self.board.LoadStates(states.tobytes())
+        return self.TechniquePropagate(self.board.ActiveLines)
+
+    # The per line overlap: a block that is longer than the slack of its line always covers its last (length - slack) cells
+    # counted from its leftmost place. Once a line has all of its FILLED cells, the rest of it is VOID.
+    def OverlapPass(self):
+        changed = True
+        while(changed):
+            changed = False
+            for activeLine in self.board.ActiveLines:
+                rules = activeLine.Rules.Rules
+                masksBefore = activeLine.getMasks()
+                difference = activeLine.Length() - (sum(rules) + len(rules) - 1)
+
+                states = activeLine.GetStates()
+                cellIndex = 0
+                for rule in rules:
+                    for i in range(cellIndex + difference, cellIndex + rule):
+                        if(states[i] == CellState.VOID):
+                            return False
+                        activeLine.SetCell(i, CellState.FILLED)
+                    cellIndex += rule + 1
+
+                if(bin(activeLine.getMasks()[0]).count("1") == sum(rules)):
+                    states = activeLine.GetStates()
+                    for i in range(activeLine.Length()):
+                        if(states[i] == CellState.UNKNOWN):
+                            activeLine.SetCell(i, CellState.VOID)
+
+                if(activeLine.getMasks() != masksBefore):
+                    changed = True
+        return True
 
-            #After running through the mathematical approach on the rows and columns, it will see if there's any spaces in the rows
-            #or columns that it can definitively say are going to be FILLED or VOID based on the rules.
-            for activeLines in self.board.Columns:
-                
-                fillAmount = 0
+#
+# Helpers for BoardLogic.ParallelSolve(). They have to live at the top of the module so the worker processes can find them.
+#
 
-                for cells in activeLines.Cells:
-                    if cells.getState() == CellState.FILLED:
-                        fillAmount += 1
-                
-                addedRule = 0
+# Rebuilds a BoardStructure from the data made by BoardStructure.Serialize()
+def DeserializeBoard(data):
+    columnRules, rowRules, encoding, enumerationLimit, states, storage, tieBreak = data
+    puzzle = BoardPuzzle(len(rowRules), len(columnRules))
+    puzzle.setColumns(columnRules)
+    puzzle.setRows(rowRules)
+    board = BoardStructure(puzzle, None, LineEncoding(encoding), enumerationLimit, BoardStorage(storage), TieBreak(tieBreak))
+    board.LoadStates(states)
+    return board
+
+parallelStopEvent = None
+
+def InitParallelWorker(stopEvent):
+    global parallelStopEvent
+    parallelStopEvent = stopEvent
+
+# Solves one branch sent by ParallelSolve(), giving up early if the stop event is set. Returns (solved, cell states, nodes).
+def SolveSerializedBoard(data, depth):
+    solver = BoardLogic(DeserializeBoard(data))
+    if(parallelStopEvent != None):
+        solver.StopCheck = parallelStopEvent.is_set
+    context = SpeculativeCallContext()
+    context.depth = depth
+    solver.Solve(VerboseLevel.SILENT, context)
+    return (solver.IsValid() and solver.IsSolved(), solver.board.Serialize()[4], solver.Nodes)
 
-                for rule in activeLines.Rules.Rules:
-                    addedRule += rule
-                
-                if fillAmount == addedRule:
-                    for cell in activeLines.Cells:
-                        if cell.getState() == CellState.UNKNOWN:
-                            cell.setState(CellState.VOID)
-            
-            for activeLines in self.board.Rows:
-                
-                fillAmount = 0
+#
+# solve_many() is the batch entry point. It spreads the puzzles over worker processes and yields a SolveResult for each one as
+# soon as it is done, so the results come back in the order they finish and not the order they were given. The puzzles can
+# come from a generator: only maxInFlight of them are handed to the pool at a time, which keeps memory bounded however
+# many puzzles there are. A timeout (in seconds) is checked at every search node, between the lines propagation reviews, between
+# the cells probing tries, and between the lines and decisions of the SAT backend, and a puzzle that runs over it comes back as PARTIAL with timedOut set
+# instead of stalling the batch. A puzzle that is solved is never reported as timed out. Generating one line's candidates cannot
+# be stopped, so the timeout only holds for large boards while an enumerationLimit keeps every line small. With SolveStrategy.ANYTIME the states of such a result hold only
+# the cells solve_anytime() proved, instead of wherever the search stopped.
+# With collectStats set, every result also carries the SolveStats of its search, which is None otherwise.
+#
+class SolveResult:
+
+    def __init__(self, index, status, timedOut, states, nodes, buildTime, solveTime, stats = None):
+        self.Index = index
+        self.Status = status
+        self.TimedOut = timedOut
+        self.States = states
+        self.Nodes = nodes
+        self.BuildTime = buildTime
+        self.SolveTime = solveTime
+        self.Stats = stats
 
-                for cells in activeLines.Cells:
-                    if cells.getState() == CellState.FILLED:
-                        fillAmount += 1
-                
-                addedRule = 0
+    def isSolved(self):
+        return self.Status == SolveStatus.SOLVED
+
+def solve_many(puzzles, workers = None, strategy = SolveStrategy.INPLACE, timeout = None, maxInFlight = None, encoding = LineEncoding.BITMASK, enumerationLimit = DefaultEnumerationLimit,
+               storage = BoardStorage.CELLS, collectStats = False):
+    if(workers == None):
+        workers = multiprocessing.cpu_count()
+    if(maxInFlight == None):
+        maxInFlight = 2 * workers
+
+    puzzleIterator = iter(enumerate(puzzles))
+    with ProcessPoolExecutor(max_workers = workers) as executor:
+        inFlight = set()
+        exhausted = False
+        while(True):
+            while(not exhausted and len(inFlight) < maxInFlight):
+                nextPuzzle = next(puzzleIterator, None)
+                if(nextPuzzle == None):
+                    exhausted = True
+                    break
+                index, puzzle = nextPuzzle
+                inFlight.add(executor.submit(SolvePuzzleJob, index, puzzle.ColumnRules, puzzle.RowRules, strategy, encoding, enumerationLimit, timeout, storage, collectStats))
 
-                for rule in activeLines.Rules.Rules:
-                    addedRule += rule
-                
-                if fillAmount == addedRule:
-                    for cell in activeLines.Cells:
-                        if cell.getState() == CellState.UNKNOWN:
-                            cell.setState(CellState.VOID)
+            if(len(inFlight) == 0):
+                return
+            done, inFlight = wait(inFlight, return_when = FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+# Builds and solves one puzzle for solve_many(), timing the board construction and the search separately
+def SolvePuzzleJob(index, columnRules, rowRules, strategy, encoding, enumerationLimit, timeout, storage = BoardStorage.CELLS, collectStats = False):
+    puzzle = BoardPuzzle(len(rowRules), len(columnRules))
+    puzzle.setColumns(columnRules)
+    puzzle.setRows(rowRules)
+
+    t0 = time.perf_counter()
+    solver = BoardLogic(BoardStructure(puzzle, None, encoding, enumerationLimit, storage))
+    t1 = time.perf_counter()
+
+    if(timeout != None):
+        deadline = t0 + timeout
+        solver.StopCheck = lambda: time.perf_counter() > deadline
+    if(collectStats):
+        solver.EnableStats()
+
+    if(strategy == SolveStrategy.BACKTRACK):
+        solver.Solve(VerboseLevel.SILENT, None)
+    elif(strategy == SolveStrategy.FIXPOINT):
+        solver.SolveFromFixpoint(VerboseLevel.SILENT)
+    elif(strategy == SolveStrategy.PROBING):
+        solver.SolveFromFixpoint(VerboseLevel.SILENT, True)
+    elif(strategy == SolveStrategy.SAT):
+        solver.SolveSat()
+    elif(strategy == SolveStrategy.ANYTIME):
+        solver.solve_anytime()
+    else:
+        solver.SolveInPlace(VerboseLevel.SILENT, None)
+    t2 = time.perf_counter()
+
+    timedOut = False
+    if(solver.IsValid() and solver.IsSolved()):
+        status = SolveStatus.SOLVED
+    elif(solver.StopCheck != None and solver.StopCheck()):
+        status = SolveStatus.PARTIAL
+        timedOut = True
+    else:
+        status = SolveStatus.CONTRADICTION
+    return SolveResult(index, status, timedOut, solver.board.Serialize()[4], solver.Nodes, t1 - t0, t2 - t1, solver.Stats)
 
 #Main Function where we run the whole program.
 if __name__ == "__main__":
-    puzzle5 = BoardPuzzle(5)
-    puzzle10 = BoardPuzzle(10)
-    puzzle15 = BoardPuzzle(15)
-
-    #Creation of all the rules that are pushed into the boards
-    columnRules1 = [[1],[1,1],[1,1,1],[1,3],[4]]
-    rowRules1 = [[2],[1,1],[3],[1,2],[4]]
-    columnRules2 = [[],[3],[3],[3],[]]
-    rowRules2 = [[],[3],[3],[3],[]]
-    columnRules3 = [[1,1],[1,3],[1],[3],[1,2]]
-    rowRules3 = [[2,2],[1],[5],[1,1],[1]]
-    columnRules4 = [[0],[1,2],[2],[2],[4]]
-    rowRules4 = [[1,1],[1,1],[2,1],[1,2],[1]]
-    columnRules5 = [[2],[1,1],[1,1],[3,1],[1]]
-    rowRules5 = [[1,1],[4],[1],[1,1],[1,1]]
-    columnRules6 = [[3],[1],[3],[1],[3,1]]
-    rowRules6 = [[3],[2,1],[1,1,1],[1],[1,1]]
-    columnRules7 = [[1,1],[1,1],[3],[2],[1,2]]
-    rowRules7 = [[1],[2],[3],[1,1,1],[2,1]]
-    columnRules8 = [[4],[],[2,2],[1,1],[1,3]]
-    rowRules8 = [[1,1,1],[1,2],[1,1],[1,3],[1,1]]
-    columnRules9 = [[1,1,1],[1,1],[1,1,1],[3],[1]]
-    rowRules9 = [[4],[2],[4],[],[1,1]]
-    columnRules10 = [[2,1],[1,1],[3],[2],[1,1]]
-    rowRules10 = [[2],[2,1],[1,1,1],[1],[3]]
-
-    columnRules11 = [[1,1],[1,1],[2,2,2],[2,3,1],[2,1,3],[1,1,1,1],[3,1],[4,1],[1,1,1,1],[1,3]]
-    rowRules11 = [[3,1],[5,2],[2],[4,2],[1,2,2],[1,1,1,2],[],[4,1],[1,1,1,3],[2,1]]
-    columnRules12 = [[3,1,2],[1,1,2],[1,2,2,2],[2,1,1],[1,1,3],[2,1,1],[3,1],[1,2,1],[1,2,1,1],[1,3,1]]
-    rowRules12 = [[2,1],[1,1],[1,1,2],[1,2,2,2],[1,2,3],[1,1,2,1],[2,1],[1,2,2],[3,1],[1,8]]
-    columnRules13 = [[3,1,1],[2,2,2],[1,1,3],[7],[1,1,1],[3,1],[1,3],[1,1,1],[2,1],[2,1,1]]
-    rowRules13 = [[1],[1,3],[3,2],[2,1,1,1],[3,1],[4,2],[1,1,1],[1,2,3],[3,1],[4,1,1]]
-    columnRules14 = [[3],[1,2,2],[2,1,1],[1,2,1],[1,4,1],[2,1,1],[2,2,4],[1,1,2,1],[1,2],[2,3,1]]
-    rowRules14 = [[1,1,2],[1,1,1],[2,1,3],[1,3,1,1],[1,3],[1,2,3],[1,4],[1,4,1],[2,2],[1,2,1]]
-    columnRules15 = [[1,1,1],[2,1,3],[1,1,3],[1,1,4],[1,4,1],[1,2,2],[2,1,1],[1,2,4],[1,1,1],[3,1,2]]
-    rowRules15 = [[1,1,1],[3,1,3],[1,1,1],[1,4,1],[2,1,2],[4,1],[5,1,1],[4,2],[1,2,1,1],[4]]
-    columnRules16 = [[1,1,2],[1,1,1],[3,2,1],[1,1,1,1],[1,3,1],[1,1,3],[1,3,2],[1,3,1],[1,1,1],[1,2,1]]
-    rowRules16 = [[1,1,1],[3],[1,4],[1,2,1,1],[1,5],[2,1,1],[1,1,5],[1,2,1],[2,3,1],[1,1]]
-    columnRules17 = [[1,3,2],[3,2],[1,2,2],[4,1],[2,1,1],[1,2,1],[1,3,3],[1,2],[1,3,1,2],[6,1]]
-    rowRules17 = [[1,1,3],[4,1],[1,1,2],[2,4,2],[4,5],[2,2,1],[2],[1,1,1],[7,2],[1,1,1]]
-    columnRules18 = [[2,4,2],[1,3],[1,4],[1,1,1,1],[1,3,1],[7,1],[1,5],[2,1,1],[1,1,1,1],[6]]
-    rowRules18 = [[1,2,2],[1,2,2],[1,1],[2,2,1],[1,4,1],[3,6],[3,2,1],[4,4],[1,1,2,1],[1,1,1]]
-    columnRules19 = [[2,3,1],[1,2],[3,2],[2,2,1,1],[1,4,1],[2,2],[2,1,1],[1,3,1],[1,3,1],[3,2,1]]
-    rowRules19 = [[1,1,1],[1,4,2],[2,1,1,1],[1],[5,2],[5,3],[1,1,5],[1,1,1,1],[1,1,1,1,1],[2,1]]
-    columnRules20 = [[1,1,2,2,],[1,1,1,1],[1,1,1,1],[2,1],[2,3,1],[1,2,1],[1,2],[2,3],[3,1],[10]]
-    rowRules20 = [[1,1,1,1],[1,2,2],[1,1,1,2],[1,3],[3,1,1],[1,2,1],[6,1],[1,1,2,1],[1,1,3],[2,1,1,1]]
-
-    columnRules21 = [[1,1,1,2],[3,3,1,1,1],[1,2,6,1],[2,2,1,1],[1,1,2,1,3],[1,1,3,1],[1,4,1,1],[1,1,1,1,1,2],[3,2,2,2],[2,2,1,1],[1,1,2,1,1],[1,1,4,2,1],[2,3,1],[4,1,3,1],[1,2,3,4]]
-    rowRules21 = [[2,3,1,1,1],[1,1,3,2],[3,1,1,2,1],[1,6,3],[2,1,2,1,1],[1,1,3,1,1],[6,1,1],[2,1,1,6],[2,2,1,5],[1,2,2,3],[2,2],[1,1,1,1,1,1],[1,3,2,1,1],[1,3,2,1,1],[1,1,2,1,2],[1,2,1,1]]
-    columnRules22 = [[3,1,2,4],[4,1,3,1,1],[1,3,3,1],[1,2,4,1],[1,2,1,1,2,1],[2,1,1,3,1],[2,1,1,3],[4,1,1,2],[1,2,2,3],[1,2,2,3],[5,3,2],[7,3,2],[2,1,1,1],[2,4,3],[1,6,1,2]]
-    rowRules22 = [[3,3,1,1],[2,1,3,2],[2,1,1,2,2],[1,5,3,2],[1,2,2,3,1],[2,1,7],[1,1,1,1,2],[2,3,4],[2,2,1],[5,6],[1,5,2,2],[4,2,5],[1,1,4,2],[2,1,5,1],[2,1,1,2]]
-    columnRules23 = [[2,5,1,1],[2,1,2],[1,1,3,2,1],[1,1,2,1,1],[1,2,1],[4,2,1,1],[2,3,1,2],[5,1,1,1,2],[2,1,1,1,1],[1,2,2],[2,1,1,1,1,1],[1,3,1,2],[1,1,5,1],[3,2,1,1],[1,3,1,5,1]]
-    rowRules23 = [[3,1,2,5],[2,1,2,1,1],[1,1,3,3],[2,8,1],[1,1,1,1,2],[1,2,1,1,1],[1,1,2,1,1],[3,2,1,1],[2,1,1,1,1,1],[1,2,3],[1,1,1,1],[1,2,2,1],[1,2,3,1],[1,2,1,1],[1,6,5]]
-    columnRules24 = [[1,1,1,2,1],[3,1,1],[1,1,1,1],[2,1,4,1,1],[1,2,1,1,1],[2,3,2,1,2],[1,1,3,1,1,1],[4,7,2],[6,2,1],[1,2],[1,1,1,2,1,1],[1,2,1,1,1],[2,1,3,2],[1,3,1,3],[1,1]]
-    rowRules24 = [[1,3,1,1],[2,3,1,1],[3,1,1,1],[1,4,2],[1,1,2,3],[1,1,2,1,1],[1,1,3,3],[1,6,1],[1,4,2],[4,1,1,2],[1,1,4,1,1],[1,1,2,1],[1,2,3,1],[1,1,1,3,2],[2,2,1,1]]
-    columnRules25 = [[2,3,1],[1,1,3],[2,2,3],[1,1,4,2],[1,1,2,1,1,2,1],[1,4],[5,1,1,1],[4,2],[2,2,2,4],[1,2,1,2,1,1],[1,1,1,3],[1,1,3,2],[8,1,3],[1,1,1,1,4],[4,9]]
-    rowRules25 = [[3,2,2],[2,1,1,1],[1,1,1,6],[1,2,1,1,1],[1,1,3,2],[3,3,2],[3,2,1,1],[2,1,3],[1,1,1,1,3,1],[1,3,1,1,1],[1,2,2,1,2,1],[1,1,2,2,1,2],[2,11],[1,1,1,5],[2,2,2,3]]
-    columnRules26 = [[1,1,2,1],[4,1,6],[1,2,4,1],[4,1,2,1],[1,1,1,2,2],[1,3,2,1,1],[1,1,3,4],[1,1,1,1,1,3],[5,4,1],[1,1,3,1,1],[4,2],[1,2,2,2,1],[3,2,2,3],[3,5,1,1],[1,1,1,2,2]]
-    rowRules26 = [[1,5,1,2],[2,4],[1,1,3,2],[1,3,2,1],[3,1,1,4],[3,4,4],[1,1,1,1,1,1],[2,1,3,3,2],[4,2,3],[2,1,1,2,1,1],[2,3,2,1],[2,1,1,2,1],[2,4,1,1],[4,2,1,1],[1,1,1,1,4]]
-    columnRules27 = [[2,1,1,2],[5,3],[1,1,1,1,5],[1,1,1,1,3],[3,1,1],[2,2,4,2],[1,1,3,1],[2,1,2,1],[3,5,1],[1,2,1,2],[1,3,3],[1,2],[2,2,1,5],[1,1,5],[1,1,1,1]]
-    rowRules27 = [[1,3,2,1],[1,2,1,1,1],[1,2,1,1,1],[2,1,1,3,1],[1,4,1],[2,1,2],[1,1,5],[2,3,2],[1,2,3],[1,1,5,1],[4,1,1,2],[2,2,4],[4,1,3],[3,1,3],[3,1,2]]
-    columnRules28 = [[2,1,1,1,1,1],[3,2,1,1,2],[3,1,1,1,2],[1,3,1,1,1],[5,1,1,1],[1,2,1,4],[5,2,2,1],[1,1,3,1],[4,3,2],[1,1,1,1,2],[2,1,6,1],[2,1,3,3],[1,1,2,2],[1,1,1],[3,1,1,2]]
-    rowRules28 = [[2,1,6],[2,3,1,2,2],[2,1,4,1],[1,3,1,1,1,1],[2,3,2],[1,4,1],[1,2,2,1,1],[3,1,2,3],[2,1,5],[3,6],[1,1,1,1],[1,3,2,1,1],[1,1,2,2,1],[2,1,3],[4,1,1,1]]
-    columnRules29 = [[1,4,1],[2,1,2,1,1,1],[1,1,1,3],[2,3,6],[1,1,2,1],[2,1,1,3],[1,4,1,1,3],[2,8],[1,5,2,1],[3,1,3,2],[2,1,1,1,2,1],[3,4,4],[2,2,1,2],[1,2,2,2,1],[2,2,1]]
-    rowRules29 = [[2,2,1,2,2],[3,2,3,1],[2,1,3],[1,5,1],[1,1,5,1,1],[2,2,1,4,2],[2,6,1,1],[1,1,1,1,2],[1,2,1,1],[3,3],[4,6,1],[1,1,1,3,1],[3,2,1,1],[2,2,1,2],[2,1,7]]
-    columnRules30 = [[1,1,1,1,1,2],[2,1,4,3],[1,3],[1,3,2,2],[1,2,2,1],[1,3,1,1],[2,1,3,2],[1,4,1,1,2],[1,1,1,1],[1,9,1],[3,2,1,3],[2,2,2],[1,1,1,1],[3,2],[2,1,1,1]]
-    rowRules30 = [[1,1,3,2],[2,1,1,4],[2,1,1,1],[1,1,1,1,1],[1,3,5],[1,2,1,2,1,1],[1,1,1,2,1],[1,1,2,2,2],[2,1,1,1],[2,1,1,1,1,1],[1,1,2,2],[2,2,3,1],[1,3,3,1],[2,2,1],[2,4,1]]
-
-    #How we track the total sum of time for the backtracking algorithm vs ours
-    backtrackSum = 0
-    ourSum = 0
-
-    #Set the columns and rows equal to the correct set of rules
-    #Create and BoardStructure then a BoardLogic object
-    #Grab the current time
-    #Solve with backtracking or ouralgorithm
-    #Grab the current time
-    #Subtract the two times and add it to our sum for the correct algorithm
-    #Print the time
-    #Print the completed board
-
-    #
-    # TESTING FOR 5x5
-    #
-
-    print("BackTracking Algoritm")
-    puzzle5.setColumns(columnRules1)
-    puzzle5.setRows(rowRules1)
-    board = BoardStructure(puzzle5, None)
-    boardSolver = BoardLogic(board)
-    t0 = time.perf_counter_ns()
-    boardSolver.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    backtrackSum += t1-t0
-    print(t1-t0)
-    boardSolver.Print()
-
-    print("Our Algorithm")
-    puzzle5.setColumns(columnRules1)
-    puzzle5.setRows(rowRules1)
-    board1 = BoardStructure(puzzle5, None)
-    boardSolver1 = BoardLogic(board1)
-    t0 = time.perf_counter_ns()
-    boardSolver1.ourAlgorithm()
-    boardSolver1.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    ourSum += t1-t0
-    print(t1 - t0)
-    boardSolver1.Print()
-
-    print("BackTracking Algoritm")
-    puzzle5.setColumns(columnRules2)
-    puzzle5.setRows(rowRules2)
-    board = BoardStructure(puzzle5, None)
-    boardSolver = BoardLogic(board)
-    t0 = time.perf_counter_ns()
-    boardSolver.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    backtrackSum += t1-t0
-    print(t1-t0)
-    boardSolver.Print()
-
-    print("Our Algorithm")
-    puzzle5.setColumns(columnRules2)
-    puzzle5.setRows(rowRules2)
-    board1 = BoardStructure(puzzle5, None)
-    boardSolver1 = BoardLogic(board1)
-    t0 = time.perf_counter_ns()
-    boardSolver1.ourAlgorithm()
-    boardSolver1.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    ourSum += t1-t0
-    print(t1 - t0)
-    boardSolver1.Print()
-
-    print("BackTracking Algoritm")
-    puzzle5.setColumns(columnRules3)
-    puzzle5.setRows(rowRules3)
-    board = BoardStructure(puzzle5, None)
-    boardSolver = BoardLogic(board)
-    t0 = time.perf_counter_ns()
-    boardSolver.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    backtrackSum += t1-t0
-    print(t1-t0)
-    boardSolver.Print()
-
-    print("Our Algorithm")
-    puzzle5.setColumns(columnRules3)
-    puzzle5.setRows(rowRules3)
-    board1 = BoardStructure(puzzle5, None)
-    boardSolver1 = BoardLogic(board1)
-    t0 = time.perf_counter_ns()
-    boardSolver1.ourAlgorithm()
-    boardSolver1.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    ourSum += t1-t0
-    print(t1 - t0)
-    boardSolver1.Print()
-
-    print("BackTracking Algoritm")
-    puzzle5.setColumns(columnRules4)
-    puzzle5.setRows(rowRules4)
-    board = BoardStructure(puzzle5, None)
-    boardSolver = BoardLogic(board)
-    t0 = time.perf_counter_ns()
-    boardSolver.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    backtrackSum += t1-t0
-    print(t1-t0)
-    boardSolver.Print()
-
-    print("Our Algorithm")
-    puzzle5.setColumns(columnRules4)
-    puzzle5.setRows(rowRules4)
-    board1 = BoardStructure(puzzle5, None)
-    boardSolver1 = BoardLogic(board1)
-    t0 = time.perf_counter_ns()
-    boardSolver1.ourAlgorithm()
-    boardSolver1.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    ourSum += t1-t0
-    print(t1 - t0)
-    boardSolver1.Print()
-
-    print("BackTracking Algoritm")
-    puzzle5.setColumns(columnRules5)
-    puzzle5.setRows(rowRules5)
-    board = BoardStructure(puzzle5, None)
-    boardSolver = BoardLogic(board)
-    t0 = time.perf_counter_ns()
-    boardSolver.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    backtrackSum += t1-t0
-    print(t1-t0)
-    boardSolver.Print()
-
-    print("Our Algorithm")
-    puzzle5.setColumns(columnRules5)
-    puzzle5.setRows(rowRules5)
-    board1 = BoardStructure(puzzle5, None)
-    boardSolver1 = BoardLogic(board1)
-    t0 = time.perf_counter_ns()
-    boardSolver1.ourAlgorithm()
-    boardSolver1.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    ourSum += t1-t0
-    print(t1 - t0)
-    boardSolver1.Print()
-
-    print("BackTracking Algoritm")
-    puzzle5.setColumns(columnRules6)
-    puzzle5.setRows(rowRules6)
-    board = BoardStructure(puzzle5, None)
-    boardSolver = BoardLogic(board)
-    t0 = time.perf_counter_ns()
-    boardSolver.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    backtrackSum += t1-t0
-    print(t1-t0)
-    boardSolver.Print()
-
-    print("Our Algorithm")
-    puzzle5.setColumns(columnRules6)
-    puzzle5.setRows(rowRules6)
-    board1 = BoardStructure(puzzle5, None)
-    boardSolver1 = BoardLogic(board1)
-    t0 = time.perf_counter_ns()
-    boardSolver1.ourAlgorithm()
-    boardSolver1.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    ourSum += t1-t0
-    print(t1 - t0)
-    boardSolver1.Print()
-
-    print("BackTracking Algoritm")
-    puzzle5.setColumns(columnRules7)
-    puzzle5.setRows(rowRules7)
-    board = BoardStructure(puzzle5, None)
-    boardSolver = BoardLogic(board)
-    t0 = time.perf_counter_ns()
-    boardSolver.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    backtrackSum += t1-t0
-    print(t1-t0)
-    boardSolver.Print()
-
-    print("Our Algorithm")
-    puzzle5.setColumns(columnRules7)
-    puzzle5.setRows(rowRules7)
-    board1 = BoardStructure(puzzle5, None)
-    boardSolver1 = BoardLogic(board1)
-    t0 = time.perf_counter_ns()
-    boardSolver1.ourAlgorithm()
-    boardSolver1.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    ourSum += t1-t0
-    print(t1 - t0)
-    boardSolver1.Print()
-
-    print("BackTracking Algoritm")
-    puzzle5.setColumns(columnRules8)
-    puzzle5.setRows(rowRules8)
-    board = BoardStructure(puzzle5, None)
-    boardSolver = BoardLogic(board)
-    t0 = time.perf_counter_ns()
-    boardSolver.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    backtrackSum += t1-t0
-    print(t1-t0)
-    boardSolver.Print()
-
-    print("Our Algorithm")
-    puzzle5.setColumns(columnRules8)
-    puzzle5.setRows(rowRules8)
-    board1 = BoardStructure(puzzle5, None)
-    boardSolver1 = BoardLogic(board1)
-    t0 = time.perf_counter_ns()
-    boardSolver1.ourAlgorithm()
-    boardSolver1.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    ourSum += t1-t0
-    print(t1 - t0)
-    boardSolver1.Print()
-
-    print("BackTracking Algoritm")
-    puzzle5.setColumns(columnRules9)
-    puzzle5.setRows(rowRules9)
-    board = BoardStructure(puzzle5, None)
-    boardSolver = BoardLogic(board)
-    t0 = time.perf_counter_ns()
-    boardSolver.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    backtrackSum += t1-t0
-    print(t1-t0)
-    boardSolver.Print()
-
-    print("Our Algorithm")
-    puzzle5.setColumns(columnRules9)
-    puzzle5.setRows(rowRules9)
-    board1 = BoardStructure(puzzle5, None)
-    boardSolver1 = BoardLogic(board1)
-    t0 = time.perf_counter_ns()
-    boardSolver1.ourAlgorithm()
-    boardSolver1.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    ourSum += t1-t0
-    print(t1 - t0)
-    boardSolver1.Print()
-
-    print("BackTracking Algoritm")
-    puzzle5.setColumns(columnRules10)
-    puzzle5.setRows(rowRules10)
-    board = BoardStructure(puzzle5, None)
-    boardSolver = BoardLogic(board)
-    t0 = time.perf_counter_ns()
-    boardSolver.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    backtrackSum += t1-t0
-    print(t1-t0)
-    boardSolver.Print()
-
-    print("Our Algorithm")
-    puzzle5.setColumns(columnRules10)
-    puzzle5.setRows(rowRules10)
-    board1 = BoardStructure(puzzle5, None)
-    boardSolver1 = BoardLogic(board1)
-    t0 = time.perf_counter_ns()
-    boardSolver1.ourAlgorithm()
-    boardSolver1.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    ourSum += t1-t0
-    print(t1 - t0)
-    boardSolver1.Print()
-    
-    #Grab the average of both run times by dividing by 10
-    #Print out their average times
-    #Reset the sums
-    backtrackSum = backtrackSum/10
-    ourSum = ourSum/10
-    print("The average of Backtracking was:")
-    print(backtrackSum)
-    print("The average of our algorithm was:")
-    print(ourSum)
-    backtrackSum = 0
-    ourSum = 0
-
-    #
-    # NEXT LINE OF TESTING FOR 10x10
-    #
-
-    print("BackTracking Algoritm")
-    puzzle10.setColumns(columnRules11)
-    puzzle10.setRows(rowRules11)
-    board = BoardStructure(puzzle10, None)
-    boardSolver = BoardLogic(board)
-    t0 = time.perf_counter_ns()
-    boardSolver.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    backtrackSum += t1-t0
-    print(t1-t0)
-    boardSolver.Print()
-
-    print("Our Algorithm")
-    puzzle10.setColumns(columnRules11)
-    puzzle10.setRows(rowRules11)
-    board1 = BoardStructure(puzzle10, None)
-    boardSolver1 = BoardLogic(board1)
-    t0 = time.perf_counter_ns()
-    boardSolver1.ourAlgorithm()
-    boardSolver1.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    ourSum += t1-t0
-    print(t1 - t0)
-    boardSolver1.Print()
-
-    print("BackTracking Algoritm")
-    puzzle10.setColumns(columnRules12)
-    puzzle10.setRows(rowRules12)
-    board = BoardStructure(puzzle10, None)
-    boardSolver = BoardLogic(board)
-    t0 = time.perf_counter_ns()
-    boardSolver.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    backtrackSum += t1-t0
-    print(t1-t0)
-    boardSolver.Print()
-
-    print("Our Algorithm")
-    puzzle10.setColumns(columnRules12)
-    puzzle10.setRows(rowRules12)
-    board1 = BoardStructure(puzzle10, None)
-    boardSolver1 = BoardLogic(board1)
-    t0 = time.perf_counter_ns()
-    boardSolver1.ourAlgorithm()
-    boardSolver1.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    ourSum += t1-t0
-    print(t1 - t0)
-    boardSolver1.Print()
-
-    print("BackTracking Algoritm")
-    puzzle10.setColumns(columnRules13)
-    puzzle10.setRows(rowRules13)
-    board = BoardStructure(puzzle10, None)
-    boardSolver = BoardLogic(board)
-    t0 = time.perf_counter_ns()
-    boardSolver.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    backtrackSum += t1-t0
-    print(t1-t0)
-    boardSolver.Print()
-
-    print("Our Algorithm")
-    puzzle10.setColumns(columnRules13)
-    puzzle10.setRows(rowRules13)
-    board1 = BoardStructure(puzzle10, None)
-    boardSolver1 = BoardLogic(board1)
-    t0 = time.perf_counter_ns()
-    boardSolver1.ourAlgorithm()
-    boardSolver1.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    ourSum += t1-t0
-    print(t1 - t0)
-    boardSolver1.Print()
-
-    print("BackTracking Algoritm")
-    puzzle10.setColumns(columnRules14)
-    puzzle10.setRows(rowRules14)
-    board = BoardStructure(puzzle10, None)
-    boardSolver = BoardLogic(board)
-    t0 = time.perf_counter_ns()
-    boardSolver.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    backtrackSum += t1-t0
-    print(t1-t0)
-    boardSolver.Print()
-
-    print("Our Algorithm")
-    puzzle10.setColumns(columnRules14)
-    puzzle10.setRows(rowRules14)
-    board1 = BoardStructure(puzzle10, None)
-    boardSolver1 = BoardLogic(board1)
-    t0 = time.perf_counter_ns()
-    boardSolver1.ourAlgorithm()
-    boardSolver1.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    ourSum += t1-t0
-    print(t1 - t0)
-    boardSolver1.Print()
-
-    print("BackTracking Algoritm")
-    puzzle10.setColumns(columnRules15)
-    puzzle10.setRows(rowRules15)
-    board = BoardStructure(puzzle10, None)
-    boardSolver = BoardLogic(board)
-    t0 = time.perf_counter_ns()
-    boardSolver.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    backtrackSum += t1-t0
-    print(t1-t0)
-    boardSolver.Print()
-
-    print("Our Algorithm")
-    puzzle10.setColumns(columnRules15)
-    puzzle10.setRows(rowRules15)
-    board1 = BoardStructure(puzzle10, None)
-    boardSolver1 = BoardLogic(board1)
-    t0 = time.perf_counter_ns()
-    boardSolver1.ourAlgorithm()
-    boardSolver1.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    ourSum += t1-t0
-    print(t1 - t0)
-    boardSolver1.Print()
-
-    print("BackTracking Algoritm")
-    puzzle10.setColumns(columnRules16)
-    puzzle10.setRows(rowRules16)
-    board = BoardStructure(puzzle10, None)
-    boardSolver = BoardLogic(board)
-    t0 = time.perf_counter_ns()
-    boardSolver.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    backtrackSum += t1-t0
-    print(t1-t0)
-    boardSolver.Print()
-
-    print("Our Algorithm")
-    puzzle10.setColumns(columnRules16)
-    puzzle10.setRows(rowRules16)
-    board1 = BoardStructure(puzzle10, None)
-    boardSolver1 = BoardLogic(board1)
-    t0 = time.perf_counter_ns()
-    boardSolver1.ourAlgorithm()
-    boardSolver1.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    ourSum += t1-t0
-    print(t1 - t0)
-    boardSolver1.Print()
-
-    print("BackTracking Algoritm")
-    puzzle10.setColumns(columnRules17)
-    puzzle10.setRows(rowRules17)
-    board = BoardStructure(puzzle10, None)
-    boardSolver = BoardLogic(board)
-    t0 = time.perf_counter_ns()
-    boardSolver.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    backtrackSum += t1-t0
-    print(t1-t0)
-    boardSolver.Print()
-
-    print("Our Algorithm")
-    puzzle10.setColumns(columnRules17)
-    puzzle10.setRows(rowRules17)
-    board1 = BoardStructure(puzzle10, None)
-    boardSolver1 = BoardLogic(board1)
-    t0 = time.perf_counter_ns()
-    boardSolver1.ourAlgorithm()
-    boardSolver1.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    ourSum += t1-t0
-    print(t1 - t0)
-    boardSolver1.Print()
-
-    print("BackTracking Algoritm")
-    puzzle10.setColumns(columnRules18)
-    puzzle10.setRows(rowRules18)
-    board = BoardStructure(puzzle10, None)
-    boardSolver = BoardLogic(board)
-    t0 = time.perf_counter_ns()
-    boardSolver.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    backtrackSum += t1-t0
-    print(t1-t0)
-    boardSolver.Print()
-
-    print("Our Algorithm")
-    puzzle10.setColumns(columnRules18)
-    puzzle10.setRows(rowRules18)
-    board1 = BoardStructure(puzzle10, None)
-    boardSolver1 = BoardLogic(board1)
-    t0 = time.perf_counter_ns()
-    boardSolver1.ourAlgorithm()
-    boardSolver1.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    ourSum += t1-t0
-    print(t1 - t0)
-    boardSolver1.Print()
-
-    print("BackTracking Algoritm")
-    puzzle10.setColumns(columnRules19)
-    puzzle10.setRows(rowRules19)
-    board = BoardStructure(puzzle10, None)
-    boardSolver = BoardLogic(board)
-    t0 = time.perf_counter_ns()
-    boardSolver.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    backtrackSum += t1-t0
-    print(t1-t0)
-    boardSolver.Print()
-
-    print("Our Algorithm")
-    puzzle10.setColumns(columnRules19)
-    puzzle10.setRows(rowRules19)
-    board1 = BoardStructure(puzzle10, None)
-    boardSolver1 = BoardLogic(board1)
-    t0 = time.perf_counter_ns()
-    boardSolver1.ourAlgorithm()
-    boardSolver1.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    ourSum += t1-t0
-    print(t1 - t0)
-    boardSolver1.Print()
-
-    print("BackTracking Algoritm")
-    puzzle10.setColumns(columnRules20)
-    puzzle10.setRows(rowRules20)
-    board = BoardStructure(puzzle10, None)
-    boardSolver = BoardLogic(board)
-    t0 = time.perf_counter_ns()
-    boardSolver.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    backtrackSum += t1-t0
-    print(t1-t0)
-    boardSolver.Print()
-
-    print("Our Algorithm")
-    puzzle10.setColumns(columnRules20)
-    puzzle10.setRows(rowRules20)
-    board1 = BoardStructure(puzzle10, None)
-    boardSolver1 = BoardLogic(board1)
-    t0 = time.perf_counter_ns()
-    boardSolver1.ourAlgorithm()
-    boardSolver1.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    ourSum += t1-t0
-    print(t1 - t0)
-    boardSolver1.Print()
-    
-    #Grab the average of both run times by dividing by 10
-    #Print out their average times
-    #Reset the sums
-    backtrackSum = backtrackSum/10
-    ourSum = ourSum/10
-    print("The average of Backtracking was:")
-    print(backtrackSum)
-    print("The average of our algorithm was:")
-    print(ourSum)
-    backtrackSum = 0
-    ourSum = 0
-
-    #
-    # NEXT LINE OF TESTING FOR 15x15
-    #
-
-    print("BackTracking Algoritm")
-    puzzle15.setColumns(columnRules22)
-    puzzle15.setRows(rowRules22)
-    board = BoardStructure(puzzle15, None)
-    boardSolver = BoardLogic(board)
-    t0 = time.perf_counter_ns()
-    boardSolver.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    backtrackSum += t1-t0
-    print(t1-t0)
-    boardSolver.Print()
-
-    print("Our Algorithm")
-    puzzle15.setColumns(columnRules22)
-    puzzle15.setRows(rowRules22)
-    board1 = BoardStructure(puzzle15, None)
-    boardSolver1 = BoardLogic(board1)
-    t0 = time.perf_counter_ns()
-    boardSolver1.ourAlgorithm()
-    boardSolver1.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    ourSum += t1-t0
-    print(t1 - t0)
-    boardSolver1.Print()
-
-    print("BackTracking Algoritm")
-    puzzle15.setColumns(columnRules25)
-    puzzle15.setRows(rowRules25)
-    board = BoardStructure(puzzle15, None)
-    boardSolver = BoardLogic(board)
-    t0 = time.perf_counter_ns()
-    boardSolver.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    backtrackSum += t1-t0
-    print(t1-t0)
-    boardSolver.Print()
-
-    print("Our Algorithm")
-    puzzle15.setColumns(columnRules25)
-    puzzle15.setRows(rowRules25)
-    board1 = BoardStructure(puzzle15, None)
-    boardSolver1 = BoardLogic(board1)
-    t0 = time.perf_counter_ns()
-    boardSolver1.ourAlgorithm()
-    boardSolver1.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    ourSum += t1-t0
-    print(t1 - t0)
-    boardSolver1.Print()
-
-    print("BackTracking Algoritm")
-    puzzle15.setColumns(columnRules26)
-    puzzle15.setRows(rowRules26)
-    board = BoardStructure(puzzle15, None)
-    boardSolver = BoardLogic(board)
-    t0 = time.perf_counter_ns()
-    boardSolver.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    backtrackSum += t1-t0
-    print(t1-t0)
-    boardSolver.Print()
-
-    print("Our Algorithm")
-    puzzle15.setColumns(columnRules26)
-    puzzle15.setRows(rowRules26)
-    board1 = BoardStructure(puzzle15, None)
-    boardSolver1 = BoardLogic(board1)
-    t0 = time.perf_counter_ns()
-    boardSolver1.ourAlgorithm()
-    boardSolver1.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    ourSum += t1-t0
-    print(t1 - t0)
-    boardSolver1.Print()
-
-    print("BackTracking Algoritm")
-    puzzle15.setColumns(columnRules29)
-    puzzle15.setRows(rowRules29)
-    board = BoardStructure(puzzle15, None)
-    boardSolver = BoardLogic(board)
-    t0 = time.perf_counter_ns()
-    boardSolver.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    backtrackSum += t1-t0
-    print(t1-t0)
-    boardSolver.Print()
-
-    print("Our Algorithm")
-    puzzle15.setColumns(columnRules29)
-    puzzle15.setRows(rowRules29)
-    board1 = BoardStructure(puzzle15, None)
-    boardSolver1 = BoardLogic(board1)
-    t0 = time.perf_counter_ns()
-    boardSolver1.ourAlgorithm()
-    boardSolver1.Solve(VerboseLevel.SILENT, None)
-    t1 = time.perf_counter_ns()
-    ourSum += t1-t0
-    print(t1 - t0)
-    boardSolver1.Print()
-    
-    #Grab the average of both run times by dividing by 10
-    #Print out their average times
-    #Reset the sums
-    backtrackSum = backtrackSum/4
-    ourSum = ourSum/4
-    print("The average of Backtracking was:")
-    print(backtrackSum)
-    print("The average of our algorithm was:")
-    print(ourSum)
\ No newline at end of file
+    # The timings live in Benchmark.py now, which runs every puzzle in Puzzles.py. Running this file runs its defaults.
+    import Benchmark
+    sys.exit(Benchmark.main())
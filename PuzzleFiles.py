@@ -0,0 +1,272 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+from Board import BoardPuzzle
+
+#
+# Loaders for puzzle files. Every loader gives back the same (columnRules, rowRules) pair that Puzzles.py uses,
+# and BuildPuzzle() turns a pair into a BoardPuzzle.
+#
+# Two common text formats are read:
+#   .non  - "width"/"height" lines, then a "rows" and a "columns" section with one comma separated clue per line (0 for an empty line)
+#   .cwd  - the row count, the column count, then one space separated clue per row, a blank line, and one per column
+#
+# Large collections are kept as a JSON lines corpus, one puzzle per line such as {"id": "a1", "columns": [[1],[2]], "rows": [[2],[1]]}.
+# PuzzleCorpus writes a sidecar offset index next to the corpus the first time it is opened, so a single puzzle can be
+# read by id or by position through a memory mapped read without parsing the rest of the file.
+#
+
+def BuildPuzzle(columnRules, rowRules):
+    puzzle = BoardPuzzle(len(rowRules), len(columnRules))
+    puzzle.setColumns(columnRules)
+    puzzle.setRows(rowRules)
+    puzzle.Validate()
+    return puzzle
+
+# A clue of 0 or an empty clue is a line with no filled cells, which the boards write as []
+def ParseClue(text, separator):
+    clue = [int(i) for i in text.replace(separator, " ").split()]
+    return [i for i in clue if i != 0]
+
+def LoadNon(text):
+    width = None
+    height = None
+    sections = {"rows": [], "columns": []}
+    section = None
+    for rawLine in text.splitlines():
+        line = rawLine.strip()
+        words = line.split()
+        if(section != None):
+            if(line == ""):
+                continue
+            if(line[0].isdigit()):
+                sections[section].append(ParseClue(line, ","))
+                if(len(sections[section]) == (height if section == "rows" else width)):
+                    section = None
+                continue
+            section = None
+        if(len(words) == 0):
+            continue
+        if(words[0] == "width"):
+            width = int(words[1])
+        elif(words[0] == "height"):
+            height = int(words[1])
+        elif(words[0] in sections):
+            section = words[0]
+    if(width == None or height == None):
+        raise ValueError(".non puzzle is missing its width or height")
+    if(len(sections["columns"]) != width or len(sections["rows"]) != height):
+        raise ValueError(".non puzzle has " + str(len(sections["columns"])) + " column clues and " + str(len(sections["rows"]))
+                         + " row clues for a " + str(width) + "x" + str(height) + " board")
+    return (sections["columns"], sections["rows"])
+
+def LoadCwd(text):
+    lines = text.splitlines()
+    height = int(lines[0])
+    width = int(lines[1])
+    clues = lines[2:]
+    # The blank line between the row and column clues is only a separator, but a blank clue is also an empty line,
+    # so the separator is found by position instead of by looking for blank lines
+    rowRules = [ParseClue(line, " ") for line in clues[:height]]
+    rest = clues[height:]
+    if(len(rest) > width and rest[0].strip() == ""):
+        rest = rest[1:]
+    columnRules = [ParseClue(line, " ") for line in rest[:width]]
+    if(len(rowRules) != height or len(columnRules) != width):
+        raise ValueError(".cwd puzzle is missing clues for a " + str(width) + "x" + str(height) + " board")
+    return (columnRules, rowRules)
+
+def LoadJsonRecord(text):
+    record = json.loads(text)
+    return (record["columns"], record["rows"])
+
+LOADERS = {
+    ".non": LoadNon,
+    ".cwd": LoadCwd,
+    ".json": LoadJsonRecord,
+}
+
+# Loads a single puzzle file, picking the format from the file extension
+def LoadPuzzleFile(path):
+    extension = os.path.splitext(path)[1].lower()
+    if(extension not in LOADERS):
+        raise ValueError("No loader for " + extension + " files, expected one of " + ", ".join(LOADERS))
+    with open(path) as puzzleFile:
+        return LOADERS[extension](puzzleFile.read())
+
+#
+# A JSON lines corpus with a sidecar index at <corpus>.idx. The index is a header, then one record per puzzle sorted by the
+# hash of its id (for lookups by id), then one record per puzzle in file order (for lookups by position).
+# The header keeps the corpus size and modification time so a stale index is rebuilt instead of read.
+#
+class PuzzleCorpus:
+
+    IndexMagic = b"NGRAMIX1"
+    HeaderFormat = "<8sQQQ"
+    IdRecordFormat = "<QQQ"
+    PositionRecordFormat = "<QQ"
+
+    def __init__(self, path, indexPath = None):
+        self.Path = path
+        self.IndexPath = indexPath if indexPath != None else path + ".idx"
+        self.CorpusFile = open(path, "rb")
+        self.CorpusMap = None
+        self.IndexFile = None
+        self.IndexMap = None
+        self.Count = 0
+        if(not self.isIndexCurrent()):
+            self.BuildIndex()
+        self.OpenMaps()
+
+    def __len__(self):
+        return self.Count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.Close()
+
+    def Close(self):
+        for i in [self.IndexMap, self.CorpusMap, self.IndexFile, self.CorpusFile]:
+            if(i != None):
+                i.close()
+        self.IndexMap = None
+        self.CorpusMap = None
+        self.IndexFile = None
+        self.CorpusFile = None
+
+    # Records without an id are named by their line number, starting at 0
+    @staticmethod
+    def RecordId(record, lineNumber):
+        if("id" in record):
+            return str(record["id"])
+        return str(lineNumber)
+
+    @staticmethod
+    def HashId(puzzleId):
+        return int.from_bytes(hashlib.blake2b(puzzleId.encode("utf-8"), digest_size = 8).digest(), "little")
+
+    def CorpusStamp(self):
+        status = os.stat(self.Path)
+        return (status.st_size, status.st_mtime_ns)
+
+    def isIndexCurrent(self):
+        if(not os.path.exists(self.IndexPath)):
+            return False
+        with open(self.IndexPath, "rb") as indexFile:
+            header = indexFile.read(struct.calcsize(self.HeaderFormat))
+        if(len(header) != struct.calcsize(self.HeaderFormat)):
+            return False
+        magic, count, size, modified = struct.unpack(self.HeaderFormat, header)
+        return magic == self.IndexMagic and (size, modified) == self.CorpusStamp()
+
+    # Streams the corpus once, line by line, and writes the sidecar index. Blank lines are skipped.
+    def BuildIndex(self):
+        idRecords = []
+        positionRecords = []
+        offset = 0
+        lineNumber = 0
+        self.CorpusFile.seek(0)
+        for line in self.CorpusFile:
+            if(line.strip() != b""):
+                puzzleId = self.RecordId(json.loads(line), lineNumber)
+                idRecords.append((self.HashId(puzzleId), offset, len(line)))
+                positionRecords.append((offset, len(line)))
+                lineNumber += 1
+            offset += len(line)
+        idRecords.sort()
+
+        size, modified = self.CorpusStamp()
+        temporaryPath = self.IndexPath + ".tmp"
+        with open(temporaryPath, "wb") as indexFile:
+            indexFile.write(struct.pack(self.HeaderFormat, self.IndexMagic, len(positionRecords), size, modified))
+            for i in idRecords:
+                indexFile.write(struct.pack(self.IdRecordFormat, *i))
+            for i in positionRecords:
+                indexFile.write(struct.pack(self.PositionRecordFormat, *i))
+        os.replace(temporaryPath, self.IndexPath)
+
+    def OpenMaps(self):
+        self.IndexFile = open(self.IndexPath, "rb")
+        self.IndexMap = mmap.mmap(self.IndexFile.fileno(), 0, access = mmap.ACCESS_READ)
+        self.Count = struct.unpack_from(self.HeaderFormat, self.IndexMap, 0)[1]
+        # mmap cannot map an empty file, and an empty corpus never needs to be read
+        if(self.Count > 0):
+            self.CorpusMap = mmap.mmap(self.CorpusFile.fileno(), 0, access = mmap.ACCESS_READ)
+
+    def ReadRecord(self, offset, length):
+        return json.loads(self.CorpusMap[offset:offset + length])
+
+    def IdRecordAt(self, i):
+        start = struct.calcsize(self.HeaderFormat) + i * struct.calcsize(self.IdRecordFormat)
+        return struct.unpack_from(self.IdRecordFormat, self.IndexMap, start)
+
+    # Returns the full JSON record of the puzzle with this id. The id records are binary searched by hash,
+    # and every record with a matching hash is read until the id itself matches.
+    def GetRecord(self, puzzleId):
+        puzzleId = str(puzzleId)
+        target = self.HashId(puzzleId)
+        low = 0
+        high = self.Count
+        while(low < high):
+            middle = (low + high) // 2
+            if(self.IdRecordAt(middle)[0] < target):
+                low = middle + 1
+            else:
+                high = middle
+        while(low < self.Count):
+            hashValue, offset, length = self.IdRecordAt(low)
+            if(hashValue != target):
+                break
+            record = self.ReadRecord(offset, length)
+            if(("id" in record and str(record["id"]) == puzzleId) or ("id" not in record and str(self.PositionOf(offset)) == puzzleId)):
+                return record
+            low += 1
+        raise KeyError(puzzleId)
+
+    # Only needed for records without an id, whose id is their position in the corpus
+    def PositionOf(self, offset):
+        low = 0
+        high = self.Count
+        while(low < high):
+            middle = (low + high) // 2
+            if(self.PositionRecordAt(middle)[0] < offset):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def PositionRecordAt(self, i):
+        start = (struct.calcsize(self.HeaderFormat) + self.Count * struct.calcsize(self.IdRecordFormat)
+                 + i * struct.calcsize(self.PositionRecordFormat))
+        return struct.unpack_from(self.PositionRecordFormat, self.IndexMap, start)
+
+    def GetRecordAt(self, position):
+        if(position < 0 or position >= self.Count):
+            raise IndexError(position)
+        return self.ReadRecord(*self.PositionRecordAt(position))
+
+    # Get() and GetAt() return the (columnRules, rowRules) pair for the puzzle
+    def Get(self, puzzleId):
+        record = self.GetRecord(puzzleId)
+        return (record["columns"], record["rows"])
+
+    def GetAt(self, position):
+        record = self.GetRecordAt(position)
+        return (record["columns"], record["rows"])
+
+    # Yields (id, columnRules, rowRules) for every puzzle in file order, reading one record at a time
+    def Iterate(self):
+        for i in range(self.Count):
+            record = self.GetRecordAt(i)
+            yield (self.RecordId(record, i), record["columns"], record["rows"])
+
+# Writes puzzles to a JSON lines corpus. puzzles is an iterable of (id, columnRules, rowRules).
+def WriteCorpus(path, puzzles):
+    with open(path, "w") as corpusFile:
+        for puzzleId, columnRules, rowRules in puzzles:
+            corpusFile.write(json.dumps({"id": puzzleId, "columns": columnRules, "rows": rowRules}, separators = (",", ":")) + "\n")
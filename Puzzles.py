@@ -0,0 +1,107 @@
+#
+# Every puzzle that used to be written out in the __main__ of Board.py. Each one is a list of column rules and a list of row rules,
+# and PUZZLES is the registry the benchmark runner and the other tools look them up in by name.
+# The names are <columns>x<rows>-<number>. The large boards are made by GeneratePuzzle() from a seeded random picture,
+# so they are the same every run without having to write out hundreds of rules, and are named with a g before their seed.
+#
+
+import random
+
+#Creation of all the rules that are pushed into the boards
+columnRules1 = [[1],[1,1],[1,1,1],[1,3],[4]]
+rowRules1 = [[2],[1,1],[3],[1,2],[4]]
+columnRules2 = [[],[3],[3],[3],[]]
+rowRules2 = [[],[3],[3],[3],[]]
+columnRules3 = [[1,1],[1,3],[1],[3],[1,2]]
+rowRules3 = [[2,2],[1],[5],[1,1],[1]]
+columnRules4 = [[0],[1,2],[2],[2],[4]]
+rowRules4 = [[1,1],[1,1],[2,1],[1,2],[1]]
+columnRules5 = [[2],[1,1],[1,1],[3,1],[1]]
+rowRules5 = [[1,1],[4],[1],[1,1],[1,1]]
+columnRules6 = [[3],[1],[3],[1],[3,1]]
+rowRules6 = [[3],[2,1],[1,1,1],[1],[1,1]]
+columnRules7 = [[1,1],[1,1],[3],[2],[1,2]]
+rowRules7 = [[1],[2],[3],[1,1,1],[2,1]]
+columnRules8 = [[4],[],[2,2],[1,1],[1,3]]
+rowRules8 = [[1,1,1],[1,2],[1,1],[1,3],[1,1]]
+columnRules9 = [[1,1,1],[1,1],[1,1,1],[3],[1]]
+rowRules9 = [[4],[2],[4],[],[1,1]]
+columnRules10 = [[2,1],[1,1],[3],[2],[1,1]]
+rowRules10 = [[2],[2,1],[1,1,1],[1],[3]]
+
+columnRules11 = [[1,1],[1,1],[2,2,2],[2,3,1],[2,1,3],[1,1,1,1],[3,1],[4,1],[1,1,1,1],[1,3]]
+rowRules11 = [[3,1],[5,2],[2],[4,2],[1,2,2],[1,1,1,2],[],[4,1],[1,1,1,3],[2,1]]
+columnRules12 = [[3,1,2],[1,1,2],[1,2,2,2],[2,1,1],[1,1,3],[2,1,1],[3,1],[1,2,1],[1,2,1,1],[1,3,1]]
+rowRules12 = [[2,1],[1,1],[1,1,2],[1,2,2,2],[1,2,3],[1,1,2,1],[2,1],[1,2,2],[3,1],[1,8]]
+columnRules13 = [[3,1,1],[2,2,2],[1,1,3],[7],[1,1,1],[3,1],[1,3],[1,1,1],[2,1],[2,1,1]]
+rowRules13 = [[1],[1,3],[3,2],[2,1,1,1],[3,1],[4,2],[1,1,1],[1,2,3],[3,1],[4,1,1]]
+columnRules14 = [[3],[1,2,2],[2,1,1],[1,2,1],[1,4,1],[2,1,1],[2,2,4],[1,1,2,1],[1,2],[2,3,1]]
+rowRules14 = [[1,1,2],[1,1,1],[2,1,3],[1,3,1,1],[1,3],[1,2,3],[1,4],[1,4,1],[2,2],[1,2,1]]
+columnRules15 = [[1,1,1],[2,1,3],[1,1,3],[1,1,4],[1,4,1],[1,2,2],[2,1,1],[1,2,4],[1,1,1],[3,1,2]]
+rowRules15 = [[1,1,1],[3,1,3],[1,1,1],[1,4,1],[2,1,2],[4,1],[5,1,1],[4,2],[1,2,1,1],[4]]
+columnRules16 = [[1,1,2],[1,1,1],[3,2,1],[1,1,1,1],[1,3,1],[1,1,3],[1,3,2],[1,3,1],[1,1,1],[1,2,1]]
+rowRules16 = [[1,1,1],[3],[1,4],[1,2,1,1],[1,5],[2,1,1],[1,1,5],[1,2,1],[2,3,1],[1,1]]
+columnRules17 = [[1,3,2],[3,2],[1,2,2],[4,1],[2,1,1],[1,2,1],[1,3,3],[1,2],[1,3,1,2],[6,1]]
+rowRules17 = [[1,1,3],[4,1],[1,1,2],[2,4,2],[4,5],[2,2,1],[2],[1,1,1],[7,2],[1,1,1]]
+columnRules18 = [[2,4,2],[1,3],[1,4],[1,1,1,1],[1,3,1],[7,1],[1,5],[2,1,1],[1,1,1,1],[6]]
+rowRules18 = [[1,2,2],[1,2,2],[1,1],[2,2,1],[1,4,1],[3,6],[3,2,1],[4,4],[1,1,2,1],[1,1,1]]
+columnRules19 = [[2,3,1],[1,2],[3,2],[2,2,1,1],[1,4,1],[2,2],[2,1,1],[1,3,1],[1,3,1],[3,2,1]]
+rowRules19 = [[1,1,1],[1,4,2],[2,1,1,1],[1],[5,2],[5,3],[1,1,5],[1,1,1,1],[1,1,1,1,1],[2,1]]
+columnRules20 = [[1,1,2,2,],[1,1,1,1],[1,1,1,1],[2,1],[2,3,1],[1,2,1],[1,2],[2,3],[3,1],[10]]
+rowRules20 = [[1,1,1,1],[1,2,2],[1,1,1,2],[1,3],[3,1,1],[1,2,1],[6,1],[1,1,2,1],[1,1,3],[2,1,1,1]]
+
+columnRules21 = [[1,1,1,2],[3,3,1,1,1],[1,2,6,1],[2,2,1,1],[1,1,2,1,3],[1,1,3,1],[1,4,1,1],[1,1,1,1,1,2],[3,2,2,2],[2,2,1,1],[1,1,2,1,1],[1,1,4,2,1],[2,3,1],[4,1,3,1],[1,2,3,4]]
+rowRules21 = [[2,3,1,1,1],[1,1,3,2],[3,1,1,2,1],[1,6,3],[2,1,2,1,1],[1,1,3,1,1],[6,1,1],[2,1,1,6],[2,2,1,5],[1,2,2,3],[2,2],[1,1,1,1,1,1],[1,3,2,1,1],[1,3,2,1,1],[1,1,2,1,2],[1,2,1,1]]
+columnRules22 = [[3,1,2,4],[4,1,3,1,1],[1,3,3,1],[1,2,4,1],[1,2,1,1,2,1],[2,1,1,3,1],[2,1,1,3],[4,1,1,2],[1,2,2,3],[1,2,2,3],[5,3,2],[7,3,2],[2,1,1,1],[2,4,3],[1,6,1,2]]
+rowRules22 = [[3,3,1,1],[2,1,3,2],[2,1,1,2,2],[1,5,3,2],[1,2,2,3,1],[2,1,7],[1,1,1,1,2],[2,3,4],[2,2,1],[5,6],[1,5,2,2],[4,2,5],[1,1,4,2],[2,1,5,1],[2,1,1,2]]
+columnRules23 = [[2,5,1,1],[2,1,2],[1,1,3,2,1],[1,1,2,1,1],[1,2,1],[4,2,1,1],[2,3,1,2],[5,1,1,1,2],[2,1,1,1,1],[1,2,2],[2,1,1,1,1,1],[1,3,1,2],[1,1,5,1],[3,2,1,1],[1,3,1,5,1]]
+rowRules23 = [[3,1,2,5],[2,1,2,1,1],[1,1,3,3],[2,8,1],[1,1,1,1,2],[1,2,1,1,1],[1,1,2,1,1],[3,2,1,1],[2,1,1,1,1,1],[1,2,3],[1,1,1,1],[1,2,2,1],[1,2,3,1],[1,2,1,1],[1,6,5]]
+columnRules24 = [[1,1,1,2,1],[3,1,1],[1,1,1,1],[2,1,4,1,1],[1,2,1,1,1],[2,3,2,1,2],[1,1,3,1,1,1],[4,7,2],[6,2,1],[1,2],[1,1,1,2,1,1],[1,2,1,1,1],[2,1,3,2],[1,3,1,3],[1,1]]
+rowRules24 = [[1,3,1,1],[2,3,1,1],[3,1,1,1],[1,4,2],[1,1,2,3],[1,1,2,1,1],[1,1,3,3],[1,6,1],[1,4,2],[4,1,1,2],[1,1,4,1,1],[1,1,2,1],[1,2,3,1],[1,1,1,3,2],[2,2,1,1]]
+columnRules25 = [[2,3,1],[1,1,3],[2,2,3],[1,1,4,2],[1,1,2,1,1,2,1],[1,4],[5,1,1,1],[4,2],[2,2,2,4],[1,2,1,2,1,1],[1,1,1,3],[1,1,3,2],[8,1,3],[1,1,1,1,4],[4,9]]
+rowRules25 = [[3,2,2],[2,1,1,1],[1,1,1,6],[1,2,1,1,1],[1,1,3,2],[3,3,2],[3,2,1,1],[2,1,3],[1,1,1,1,3,1],[1,3,1,1,1],[1,2,2,1,2,1],[1,1,2,2,1,2],[2,11],[1,1,1,5],[2,2,2,3]]
+columnRules26 = [[1,1,2,1],[4,1,6],[1,2,4,1],[4,1,2,1],[1,1,1,2,2],[1,3,2,1,1],[1,1,3,4],[1,1,1,1,1,3],[5,4,1],[1,1,3,1,1],[4,2],[1,2,2,2,1],[3,2,2,3],[3,5,1,1],[1,1,1,2,2]]
+rowRules26 = [[1,5,1,2],[2,4],[1,1,3,2],[1,3,2,1],[3,1,1,4],[3,4,4],[1,1,1,1,1,1],[2,1,3,3,2],[4,2,3],[2,1,1,2,1,1],[2,3,2,1],[2,1,1,2,1],[2,4,1,1],[4,2,1,1],[1,1,1,1,4]]
+columnRules27 = [[2,1,1,2],[5,3],[1,1,1,1,5],[1,1,1,1,3],[3,1,1],[2,2,4,2],[1,1,3,1],[2,1,2,1],[3,5,1],[1,2,1,2],[1,3,3],[1,2],[2,2,1,5],[1,1,5],[1,1,1,1]]
+rowRules27 = [[1,3,2,1],[1,2,1,1,1],[1,2,1,1,1],[2,1,1,3,1],[1,4,1],[2,1,2],[1,1,5],[2,3,2],[1,2,3],[1,1,5,1],[4,1,1,2],[2,2,4],[4,1,3],[3,1,3],[3,1,2]]
+columnRules28 = [[2,1,1,1,1,1],[3,2,1,1,2],[3,1,1,1,2],[1,3,1,1,1],[5,1,1,1],[1,2,1,4],[5,2,2,1],[1,1,3,1],[4,3,2],[1,1,1,1,2],[2,1,6,1],[2,1,3,3],[1,1,2,2],[1,1,1],[3,1,1,2]]
+rowRules28 = [[2,1,6],[2,3,1,2,2],[2,1,4,1],[1,3,1,1,1,1],[2,3,2],[1,4,1],[1,2,2,1,1],[3,1,2,3],[2,1,5],[3,6],[1,1,1,1],[1,3,2,1,1],[1,1,2,2,1],[2,1,3],[4,1,1,1]]
+columnRules29 = [[1,4,1],[2,1,2,1,1,1],[1,1,1,3],[2,3,6],[1,1,2,1],[2,1,1,3],[1,4,1,1,3],[2,8],[1,5,2,1],[3,1,3,2],[2,1,1,1,2,1],[3,4,4],[2,2,1,2],[1,2,2,2,1],[2,2,1]]
+rowRules29 = [[2,2,1,2,2],[3,2,3,1],[2,1,3],[1,5,1],[1,1,5,1,1],[2,2,1,4,2],[2,6,1,1],[1,1,1,1,2],[1,2,1,1],[3,3],[4,6,1],[1,1,1,3,1],[3,2,1,1],[2,2,1,2],[2,1,7]]
+columnRules30 = [[1,1,1,1,1,2],[2,1,4,3],[1,3],[1,3,2,2],[1,2,2,1],[1,3,1,1],[2,1,3,2],[1,4,1,1,2],[1,1,1,1],[1,9,1],[3,2,1,3],[2,2,2],[1,1,1,1],[3,2],[2,1,1,1]]
+rowRules30 = [[1,1,3,2],[2,1,1,4],[2,1,1,1],[1,1,1,1,1],[1,3,5],[1,2,1,2,1,1],[1,1,1,2,1],[1,1,2,2,2],[2,1,1,1],[2,1,1,1,1,1],[1,1,2,2],[2,2,3,1],[1,3,3,1],[2,2,1],[2,4,1]]
+
+# rowRules21 has 16 rules for 15 columns, and its rows fill 121 cells while its columns fill 113, so puzzle 21 has no solution
+# and is left out of the registry.
+PUZZLES = {}
+for puzzleNumber in range(1, 31):
+    if(puzzleNumber == 21):
+        continue
+    columnRules = globals()["columnRules" + str(puzzleNumber)]
+    rowRules = globals()["rowRules" + str(puzzleNumber)]
+    PUZZLES[str(len(columnRules)) + "x" + str(len(rowRules)) + "-" + str(puzzleNumber)] = (columnRules, rowRules)
+
+# Returns the rules of a line of True/False cells
+def RulesOfLine(cells):
+    rules = []
+    blockLength = 0
+    for cell in cells:
+        if(cell):
+            blockLength += 1
+        elif(blockLength > 0):
+            rules.append(blockLength)
+            blockLength = 0
+    if(blockLength > 0):
+        rules.append(blockLength)
+    return rules
+
+# Makes the column and row rules of a rowCount x columnCount picture where each cell is FILLED with the given probability
+def GeneratePuzzle(rowCount, columnCount, density, seed):
+    generator = random.Random(seed)
+    picture = [[generator.random() < density for columnIndex in range(columnCount)] for rowIndex in range(rowCount)]
+    rowRules = [RulesOfLine(row) for row in picture]
+    columnRules = [RulesOfLine([picture[rowIndex][columnIndex] for rowIndex in range(rowCount)]) for columnIndex in range(columnCount)]
+    return (columnRules, rowRules)
+
+for rowCount, columnCount, density, seed in [(30, 45, 0.6, 1), (50, 50, 0.6, 1), (50, 50, 0.6, 2), (100, 100, 0.7, 1), (100, 100, 0.7, 2)]:
+    PUZZLES[str(columnCount) + "x" + str(rowCount) + "-g" + str(seed)] = GeneratePuzzle(rowCount, columnCount, density, seed)
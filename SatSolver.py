@@ -0,0 +1,423 @@
+import heapq
+
+#
+# A SAT backend for nonograms. NonogramCnf turns the clues of a puzzle into CNF, and CdclSolver solves it.
+# Nothing here imports Board.py, so the solver can be used on any CNF. BoardLogic.SolveSat() is what loads its answer into a board.
+#
+# The encoding has one variable per cell, true for FILLED, and one variable for every place a block of a line can start. Each
+# block starts exactly once, with a sequential counter for the "at most once" part, each block starts after the one before it
+# ends, the cells a block covers are FILLED, the cells right before and after it are VOID, and a FILLED cell is covered by
+# some block.
+#
+# The solver is a conflict driven clause learning solver: two watched literals per clause, first UIP learning with the learned
+# clause minimized, VSIDS activities with a heap, saved phases, Luby restarts, and learned clauses thrown away by their LBD (the
+# number of decision levels in them) once too many have been kept.
+#
+
+# The Luby sequence 1, 1, 2, 1, 1, 2, 4, 1, 1, 2, ... that spaces out the restarts
+def Luby(i):
+    size = 1
+    sequence = 0
+    while(size < i + 1):
+        sequence += 1
+        size = 2 * size + 1
+    while(size - 1 != i):
+        size = (size - 1) >> 1
+        sequence -= 1
+        i = i % size
+    return 1 << sequence
+
+#
+# Variables are numbered from 1, and clauses are given in the DIMACS way: v for the variable being true and -v for it being false.
+# Inside, literal v is 2v and -v is 2v + 1, so the negation of a literal is literal ^ 1 and Values can be indexed by literal.
+#
+class CdclSolver:
+
+    RestartBase = 64
+    VariableDecay = 0.95
+
+    def __init__(self):
+        self.VariableCount = 0
+        # 1 for a true literal, -1 for a false one, 0 while its variable is unassigned
+        self.Values = [0, 0]
+        self.Levels = [0]
+        self.Reasons = [None]
+        self.Activity = [0.0]
+        self.Phases = [False]
+        self.Seen = [False]
+        self.Watches = [[], []]
+        self.Clauses = []
+        self.Learned = []
+        self.LearnedLbd = {}
+        self.MaxLearned = 2000
+        self.Trail = []
+        self.TrailLimits = []
+        self.Head = 0
+        self.Heap = []
+        self.ActivityIncrement = 1.0
+        self.Unsatisfiable = False
+        self.Decisions = 0
+        self.Conflicts = 0
+        self.Propagations = 0
+        self.Restarts = 0
+
+    def NewVariable(self):
+        self.VariableCount += 1
+        self.Values += [0, 0]
+        self.Levels.append(0)
+        self.Reasons.append(None)
+        self.Activity.append(0.0)
+        self.Phases.append(False)
+        self.Seen.append(False)
+        self.Watches += [[], []]
+        heapq.heappush(self.Heap, (0.0, self.VariableCount))
+        return self.VariableCount
+
+    # Adds a clause before the search. Returns False once the clauses are known to be unsatisfiable.
+    def AddClause(self, literals):
+        if(self.Unsatisfiable):
+            return False
+        clause = []
+        for literal in literals:
+            internal = 2 * literal if literal > 0 else 2 * -literal + 1
+            if(self.Values[internal] == 1 or internal ^ 1 in clause):
+                return True
+            if(self.Values[internal] == 0 and internal not in clause):
+                clause.append(internal)
+        if(len(clause) == 0):
+            self.Unsatisfiable = True
+            return False
+        if(len(clause) == 1):
+            self.Assign(clause[0], None)
+            if(self.Propagate() != None):
+                self.Unsatisfiable = True
+                return False
+            return True
+        self.Clauses.append(clause)
+        self.Watches[clause[0]].append(clause)
+        self.Watches[clause[1]].append(clause)
+        return True
+
+    # The value of a variable in the model found by Solve()
+    def Value(self, variable):
+        return self.Values[2 * variable] == 1
+
+    def Assign(self, literal, reason):
+        self.Values[literal] = 1
+        self.Values[literal ^ 1] = -1
+        variable = literal >> 1
+        self.Levels[variable] = len(self.TrailLimits)
+        self.Reasons[variable] = reason
+        self.Trail.append(literal)
+
+    # Unit propagation with two watched literals. The literal a clause implies is moved to its front, so a reason clause always
+    # starts with the literal it was the reason for. Returns the clause that became false, or None.
+    def Propagate(self):
+        values = self.Values
+        watches = self.Watches
+        trail = self.Trail
+        while(self.Head < len(trail)):
+            falseLiteral = trail[self.Head] ^ 1
+            self.Head += 1
+            self.Propagations += 1
+            watchList = watches[falseLiteral]
+            count = len(watchList)
+            i = 0
+            j = 0
+            while(i < count):
+                clause = watchList[i]
+                i += 1
+                # Clauses thrown away by ReduceLearned() are emptied, and leave the watch lists here
+                if(len(clause) == 0):
+                    continue
+                if(clause[0] == falseLiteral):
+                    clause[0] = clause[1]
+                    clause[1] = falseLiteral
+                first = clause[0]
+                if(values[first] == 1):
+                    watchList[j] = clause
+                    j += 1
+                    continue
+                for k in range(2, len(clause)):
+                    other = clause[k]
+                    if(values[other] != -1):
+                        clause[1] = other
+                        clause[k] = falseLiteral
+                        watches[other].append(clause)
+                        break
+                else:
+                    watchList[j] = clause
+                    j += 1
+                    if(values[first] == -1):
+                        while(i < count):
+                            watchList[j] = watchList[i]
+                            j += 1
+                            i += 1
+                        del watchList[j:]
+                        return clause
+                    self.Assign(first, clause)
+            del watchList[j:]
+        return None
+
+    def Bump(self, variable):
+        self.Activity[variable] += self.ActivityIncrement
+        if(self.Activity[variable] > 1e100):
+            for i in range(1, self.VariableCount + 1):
+                self.Activity[i] *= 1e-100
+            self.ActivityIncrement *= 1e-100
+            self.Heap = [(-self.Activity[i], i) for i in range(1, self.VariableCount + 1) if self.Values[2 * i] == 0]
+            heapq.heapify(self.Heap)
+        elif(self.Values[2 * variable] == 0):
+            heapq.heappush(self.Heap, (-self.Activity[variable], variable))
+
+    # First UIP conflict analysis. Returns the learned clause with the literal it asserts first and the literal of the highest
+    # remaining level second, along with the level to jump back to.
+    def Analyze(self, conflict):
+        seen = self.Seen
+        levels = self.Levels
+        level = len(self.TrailLimits)
+        learned = [0]
+        pending = 0
+        index = len(self.Trail) - 1
+        clause = conflict
+        start = 0
+        while(True):
+            for k in range(start, len(clause)):
+                literal = clause[k]
+                variable = literal >> 1
+                if(not seen[variable] and levels[variable] > 0):
+                    seen[variable] = True
+                    self.Bump(variable)
+                    if(levels[variable] == level):
+                        pending += 1
+                    else:
+                        learned.append(literal)
+            while(not seen[self.Trail[index] >> 1]):
+                index -= 1
+            literal = self.Trail[index]
+            index -= 1
+            variable = literal >> 1
+            seen[variable] = False
+            pending -= 1
+            if(pending == 0):
+                break
+            clause = self.Reasons[variable]
+            start = 1
+        learned[0] = literal ^ 1
+
+        # A literal is left out if everything that implied it is already in the clause
+        kept = [learned[0]]
+        for literal in learned[1:]:
+            reason = self.Reasons[literal >> 1]
+            if(reason == None or any(not seen[other >> 1] and levels[other >> 1] > 0 for other in reason[1:])):
+                kept.append(literal)
+        for literal in learned[1:]:
+            seen[literal >> 1] = False
+
+        backLevel = 0
+        if(len(kept) > 1):
+            highest = 1
+            for k in range(2, len(kept)):
+                if(levels[kept[k] >> 1] > levels[kept[highest] >> 1]):
+                    highest = k
+            kept[1], kept[highest] = kept[highest], kept[1]
+            backLevel = levels[kept[1] >> 1]
+        return (kept, backLevel)
+
+    def Backtrack(self, level):
+        if(len(self.TrailLimits) <= level):
+            return
+        values = self.Values
+        limit = self.TrailLimits[level]
+        for literal in self.Trail[limit:]:
+            variable = literal >> 1
+            values[literal] = 0
+            values[literal ^ 1] = 0
+            self.Reasons[variable] = None
+            self.Phases[variable] = (literal & 1) == 0
+            heapq.heappush(self.Heap, (-self.Activity[variable], variable))
+        del self.Trail[limit:]
+        del self.TrailLimits[level:]
+        self.Head = limit
+        # Entries of assigned variables and outdated activities are only dropped when popped, so rebuild before they pile up
+        if(len(self.Heap) > 4 * self.VariableCount):
+            self.Heap = [(-self.Activity[i], i) for i in range(1, self.VariableCount + 1) if values[2 * i] == 0]
+            heapq.heapify(self.Heap)
+
+    # The unassigned variable with the highest activity, set to its saved phase, or None once every variable is assigned
+    def PickBranch(self):
+        heap = self.Heap
+        values = self.Values
+        while(len(heap) > 0):
+            activity, variable = heapq.heappop(heap)
+            if(values[2 * variable] == 0):
+                return 2 * variable if self.Phases[variable] else 2 * variable + 1
+        return None
+
+    def Learn(self, clause):
+        levels = set(self.Levels[literal >> 1] for literal in clause)
+        self.Learned.append(clause)
+        self.LearnedLbd[id(clause)] = len(levels)
+        self.Watches[clause[0]].append(clause)
+        self.Watches[clause[1]].append(clause)
+
+    # Throws away the worse half of the learned clauses by LBD and then length. Clauses with an LBD of 2 or less are kept,
+    # and so is any clause that is the reason for a literal on the trail.
+    def ReduceLearned(self):
+        def isLocked(clause):
+            return self.Values[clause[0]] == 1 and self.Reasons[clause[0] >> 1] is clause
+        ranked = sorted(self.Learned, key = lambda clause: (self.LearnedLbd[id(clause)], len(clause)))
+        kept = ranked[:len(ranked) // 2]
+        for clause in ranked[len(ranked) // 2:]:
+            if(self.LearnedLbd[id(clause)] <= 2 or isLocked(clause)):
+                kept.append(clause)
+            else:
+                del self.LearnedLbd[id(clause)]
+                clause.clear()
+        self.Learned = kept
+        self.MaxLearned = int(self.MaxLearned * 1.1)
+
+    # Searches for a model. Returns True if one was found, False if the clauses are unsatisfiable, and None if stopCheck
+    # returned True first. stopCheck is called at every restart and before every decision.
+    def Solve(self, stopCheck = None):
+        if(self.Unsatisfiable):
+            return False
+        restartCount = 0
+        conflictsUntilRestart = self.RestartBase * Luby(restartCount)
+        while(True):
+            conflict = self.Propagate()
+            if(conflict != None):
+                self.Conflicts += 1
+                conflictsUntilRestart -= 1
+                if(len(self.TrailLimits) == 0):
+                    self.Unsatisfiable = True
+                    return False
+                clause, backLevel = self.Analyze(conflict)
+                self.Backtrack(backLevel)
+                if(len(clause) == 1):
+                    self.Assign(clause[0], None)
+                else:
+                    self.Learn(clause)
+                    self.Assign(clause[0], clause)
+                self.ActivityIncrement /= self.VariableDecay
+                continue
+
+            if(conflictsUntilRestart <= 0):
+                self.Restarts += 1
+                restartCount += 1
+                conflictsUntilRestart = self.RestartBase * Luby(restartCount)
+                self.Backtrack(0)
+                if(stopCheck != None and stopCheck()):
+                    return None
+            if(len(self.Learned) >= self.MaxLearned):
+                self.ReduceLearned()
+            if(stopCheck != None and stopCheck()):
+                return None
+
+            literal = self.PickBranch()
+            if(literal == None):
+                return True
+            self.Decisions += 1
+            self.TrailLimits.append(len(self.Trail))
+            self.Assign(literal, None)
+
+    def Stats(self):
+        return {"variables": self.VariableCount, "clauses": len(self.Clauses), "learned": len(self.Learned), "decisions": self.Decisions,
+                "conflicts": self.Conflicts, "propagations": self.Propagations, "restarts": self.Restarts}
+
+#
+# NonogramCnf builds the CNF of a puzzle in a CdclSolver. Cell (rowIndex, columnIndex) is variable rowIndex * columnCount + columnIndex + 1,
+# and the block start variables come after the cells.
+#
+class NonogramCnf:
+
+    # Building the clauses of a large board takes a while, so stopCheck is also called between lines. If it stops the build,
+    # Complete stays False and Solve() returns None.
+    def __init__(self, columnRules, rowRules, stopCheck = None):
+        self.RowCount = len(rowRules)
+        self.ColumnCount = len(columnRules)
+        self.Solver = CdclSolver()
+        self.Complete = False
+        for i in range(self.RowCount * self.ColumnCount):
+            self.Solver.NewVariable()
+        lines = [(rowRules[rowIndex], [self.CellVariable(rowIndex, i) for i in range(self.ColumnCount)]) for rowIndex in range(self.RowCount)]
+        lines += [(columnRules[columnIndex], [self.CellVariable(i, columnIndex) for i in range(self.RowCount)]) for columnIndex in range(self.ColumnCount)]
+        for rules, cells in lines:
+            if(stopCheck != None and stopCheck()):
+                return
+            self.AddLine(rules, cells)
+        self.Complete = True
+
+    def CellVariable(self, rowIndex, columnIndex):
+        return rowIndex * self.ColumnCount + columnIndex + 1
+
+    def AddLine(self, rules, cells):
+        solver = self.Solver
+        length = len(cells)
+        if(len(rules) == 0):
+            for cell in cells:
+                solver.AddClause([-cell])
+            return
+        if(sum(rules) + len(rules) - 1 > length):
+            solver.AddClause([])
+            return
+
+        # starts[j] maps every cell block j can start at to its variable
+        starts = []
+        earliest = 0
+        for j in range(len(rules)):
+            latest = length - sum(rules[j:]) - (len(rules) - j - 1)
+            starts.append({})
+            for position in range(earliest, latest + 1):
+                starts[j][position] = solver.NewVariable()
+            earliest += rules[j] + 1
+
+        covering = [[] for i in range(length)]
+        for j in range(len(rules)):
+            block = rules[j]
+            solver.AddClause(list(starts[j].values()))
+            self.AddAtMostOne(list(starts[j].values()))
+            for position, start in starts[j].items():
+                for cell in range(position, position + block):
+                    solver.AddClause([-start, cells[cell]])
+                    covering[cell].append(start)
+                if(position > 0):
+                    solver.AddClause([-start, -cells[position - 1]])
+                if(position + block < length):
+                    solver.AddClause([-start, -cells[position + block]])
+                # The next block starts after this one ends, and the one before ends before this one starts
+                if(j + 1 < len(rules)):
+                    solver.AddClause([-start] + [later for nextPosition, later in starts[j + 1].items() if nextPosition > position + block])
+                if(j > 0):
+                    solver.AddClause([-start] + [earlier for previousPosition, earlier in starts[j - 1].items() if previousPosition + rules[j - 1] < position])
+        for cell in range(length):
+            solver.AddClause([-cells[cell]] + covering[cell])
+
+    # The sequential counter: counter i is true once one of the first i + 1 variables is, and no variable may be true after it
+    def AddAtMostOne(self, variables):
+        solver = self.Solver
+        if(len(variables) <= 1):
+            return
+        counters = [solver.NewVariable() for i in range(len(variables) - 1)]
+        solver.AddClause([-variables[0], counters[0]])
+        for i in range(1, len(variables) - 1):
+            solver.AddClause([-variables[i], counters[i]])
+            solver.AddClause([-counters[i - 1], counters[i]])
+            solver.AddClause([-variables[i], -counters[i - 1]])
+        solver.AddClause([-variables[-1], -counters[-1]])
+
+    # Fixes a cell before solving, for cells already known on a board
+    def SetCell(self, rowIndex, columnIndex, filled):
+        variable = self.CellVariable(rowIndex, columnIndex)
+        return self.Solver.AddClause([variable if filled else -variable])
+
+    # Returns the rows of the solution as lists of booleans (True for FILLED), False if the puzzle has no solution, or None if
+    # stopCheck stopped the search
+    def Solve(self, stopCheck = None):
+        if(not self.Complete):
+            return None
+        result = self.Solver.Solve(stopCheck)
+        if(result != True):
+            return result
+        return [[self.Solver.Value(self.CellVariable(rowIndex, columnIndex)) for columnIndex in range(self.ColumnCount)]
+                for rowIndex in range(self.RowCount)]
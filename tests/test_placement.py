@@ -0,0 +1,113 @@
+import itertools
+import random
+import unittest
+
+from Board import Cell, CellState, Line, LineEncoding, LineRule
+
+#
+# Checks the placement solver (PlacementTables(), CountCandidatesFor(), SolveLine() and GenerateCandidatesFor()) and the closed form
+# CandidateCount() against brute force: every line of a length is built, grouped by its blocks, and filtered by the known cells.
+#
+
+MaxLength = 10
+
+def Blocks(states):
+    blocks = []
+    run = 0
+    for state in states:
+        if(state == CellState.FILLED):
+            run += 1
+        elif(run > 0):
+            blocks.append(run)
+            run = 0
+    if(run > 0):
+        blocks.append(run)
+    return tuple(blocks)
+
+def Masks(states):
+    filledMask = 0
+    voidMask = 0
+    for i in range(len(states)):
+        if(states[i] == CellState.FILLED):
+            filledMask |= 1 << i
+        elif(states[i] == CellState.VOID):
+            voidMask |= 1 << i
+    return (filledMask, voidMask)
+
+# For every length, the (filled mask, void mask) of every full line, keyed by its blocks
+LinesByBlocks = {}
+for length in range(1, MaxLength + 1):
+    LinesByBlocks[length] = {}
+    for states in itertools.product([CellState.VOID, CellState.FILLED], repeat = length):
+        LinesByBlocks[length].setdefault(Blocks(states), []).append(Masks(states))
+
+def Agrees(masks, known):
+    return (masks[0] & known[1]) == 0 and (masks[1] & known[0]) == 0
+
+class PlacementTest(unittest.TestCase):
+
+    def RandomCase(self, generator):
+        length = generator.randint(1, MaxLength)
+        # Most rules come from a real line so they fit, and a few are made up so they may not
+        if(generator.random() < 0.8):
+            rules = list(generator.choice(list(LinesByBlocks[length])))
+        else:
+            rules = [generator.randint(1, length) for i in range(generator.randint(1, 3))]
+        states = [CellState.UNKNOWN] * length
+        # Known cells come from some line, which may or may not have these rules
+        source = generator.choice([masks for group in LinesByBlocks[length].values() for masks in group])
+        for i in range(length):
+            if(generator.random() < 0.35):
+                states[i] = CellState.FILLED if source[0] >> i & 1 else CellState.VOID
+        return (rules, states)
+
+    def Expected(self, rules, states):
+        known = Masks(states)
+        return [masks for masks in LinesByBlocks[len(states)].get(tuple(rules), []) if Agrees(masks, known)]
+
+    def testCountCandidatesFor(self):
+        generator = random.Random(3)
+        for case in range(3000):
+            rules, states = self.RandomCase(generator)
+            rule = LineRule(rules, len(states))
+            line = Line(1, [Cell(state) for state in states], None)
+            self.assertEqual(rule.CountCandidatesFor(line), len(self.Expected(rules, states)), (rules, states))
+
+    def testSolveLine(self):
+        generator = random.Random(5)
+        for case in range(3000):
+            rules, states = self.RandomCase(generator)
+            expected = self.Expected(rules, states)
+            forced = LineRule(rules, len(states)).SolveLine(Line(1, [Cell(state) for state in states], None))
+            if(len(expected) == 0):
+                self.assertEqual(forced, None, (rules, states))
+                continue
+            fullMask = (1 << len(states)) - 1
+            filledMask = fullMask
+            voidMask = fullMask
+            for masks in expected:
+                filledMask &= masks[0]
+                voidMask &= masks[1]
+            self.assertEqual(forced.getMasks(), (filledMask, voidMask), (rules, states))
+
+    def testGenerateCandidatesFor(self):
+        generator = random.Random(7)
+        for case in range(3000):
+            rules, states = self.RandomCase(generator)
+            expected = sorted(self.Expected(rules, states))
+            rule = LineRule(rules, len(states))
+            for encoding in [LineEncoding.BITMASK, LineEncoding.CELLS]:
+                candidates = rule.GenerateCandidatesFor(Line(1, [Cell(state) for state in states], None), encoding)
+                self.assertEqual(sorted(candidate.getMasks() for candidate in candidates), expected, (rules, states, encoding))
+
+    def testCandidateCount(self):
+        for length in range(1, MaxLength + 1):
+            for blocks, lines in LinesByBlocks[length].items():
+                rule = LineRule(list(blocks), length)
+                self.assertEqual(rule.CandidateCount(), len(lines), (blocks, length))
+                self.assertEqual(sorted(candidate.getMasks() for candidate in rule.GenerateCandidates(LineEncoding.BITMASK)), sorted(lines))
+        # Rules too long for the line have no candidates
+        self.assertEqual(LineRule([3, 3], 6).CandidateCount(), 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import PuzzleFiles
+from Puzzles import PUZZLES
+
+#
+# Checks the .non and .cwd loaders on the fixture files next to this module, and PuzzleCorpus lookups and index rebuilding
+# on corpora written to a temporary directory.
+#
+
+Fixtures = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+def Fixture(name):
+    return os.path.join(Fixtures, name)
+
+# Turns the [0] that Puzzles.py uses for an empty line into the [] the loaders give back
+def Normalized(rules):
+    return [[i for i in clue if i != 0] for clue in rules]
+
+class LoaderTest(unittest.TestCase):
+
+    def testNon(self):
+        columnRules, rowRules = PUZZLES["5x5-4"]
+        self.assertEqual(PuzzleFiles.LoadPuzzleFile(Fixture("5x5-4.non")), (Normalized(columnRules), Normalized(rowRules)))
+
+    def testCwd(self):
+        columnRules, rowRules = PUZZLES["5x5-4"]
+        self.assertEqual(PuzzleFiles.LoadPuzzleFile(Fixture("5x5-4.cwd")), (Normalized(columnRules), Normalized(rowRules)))
+
+    def testBuildPuzzle(self):
+        puzzle = PuzzleFiles.BuildPuzzle(*PuzzleFiles.LoadPuzzleFile(Fixture("5x5-4.cwd")))
+        self.assertEqual((puzzle.RowCount, puzzle.ColumnCount), (5, 5))
+
+    def testBadNon(self):
+        for name in ["missing-height.non", "short-rows.non"]:
+            with self.assertRaises(ValueError, msg = name):
+                PuzzleFiles.LoadPuzzleFile(Fixture(name))
+
+    def testBadCwd(self):
+        for name in ["short-columns.cwd", "bad-clue.cwd"]:
+            with self.assertRaises(ValueError, msg = name):
+                PuzzleFiles.LoadPuzzleFile(Fixture(name))
+
+    # With the separator there, a missing last column reads the same as an empty first one,
+    # so it is only caught when BuildPuzzle() finds the row and column totals differ
+    def testMissingColumnCwd(self):
+        self.assertEqual(PuzzleFiles.LoadPuzzleFile(Fixture("missing-column.cwd")), ([[], [1], [1]], [[1], [2]]))
+        with self.assertRaises(ValueError):
+            PuzzleFiles.BuildPuzzle(*PuzzleFiles.LoadPuzzleFile(Fixture("missing-column.cwd")))
+
+    def testUnknownExtension(self):
+        with self.assertRaises(ValueError):
+            PuzzleFiles.LoadPuzzleFile(Fixture("5x5-4.txt"))
+
+#
+# Counts the index builds, so a test can tell a rebuilt index from one that was read back
+#
+class CountingCorpus(PuzzleFiles.PuzzleCorpus):
+
+    Builds = 0
+
+    def BuildIndex(self):
+        CountingCorpus.Builds += 1
+        PuzzleFiles.PuzzleCorpus.BuildIndex(self)
+
+class PuzzleCorpusTest(unittest.TestCase):
+
+    def setUp(self):
+        self.Directory = tempfile.mkdtemp()
+        self.Path = os.path.join(self.Directory, "corpus.jsonl")
+        self.Puzzles = [(name, columnRules, rowRules) for name, (columnRules, rowRules) in PUZZLES.items() if name.startswith("5x5")]
+        PuzzleFiles.WriteCorpus(self.Path, self.Puzzles)
+        CountingCorpus.Builds = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.Directory)
+
+    def testLoadById(self):
+        with CountingCorpus(self.Path) as corpus:
+            self.assertEqual(len(corpus), len(self.Puzzles))
+            for name, columnRules, rowRules in self.Puzzles:
+                self.assertEqual(corpus.Get(name), (columnRules, rowRules))
+            with self.assertRaises(KeyError):
+                corpus.Get("missing")
+
+    def testLoadByPosition(self):
+        with CountingCorpus(self.Path) as corpus:
+            for i in range(len(self.Puzzles)):
+                self.assertEqual(corpus.GetAt(i), self.Puzzles[i][1:])
+            self.assertEqual(list(corpus.Iterate()), self.Puzzles)
+            with self.assertRaises(IndexError):
+                corpus.GetAt(len(self.Puzzles))
+
+    # Records without an id are named by their position, and blank lines do not count as positions
+    def testRecordsWithoutId(self):
+        with open(self.Path, "w") as corpusFile:
+            corpusFile.write(json.dumps({"columns": [[1]], "rows": [[1]]}) + "\n\n")
+            corpusFile.write(json.dumps({"columns": [[], [1]], "rows": [[1]]}) + "\n")
+        with CountingCorpus(self.Path) as corpus:
+            self.assertEqual(len(corpus), 2)
+            self.assertEqual(corpus.Get("0"), ([[1]], [[1]]))
+            self.assertEqual(corpus.Get(1), ([[], [1]], [[1]]))
+
+    def testIndexIsReused(self):
+        CountingCorpus(self.Path).Close()
+        with CountingCorpus(self.Path) as corpus:
+            self.assertEqual(corpus.Get("5x5-2"), self.Puzzles[1][1:])
+        self.assertEqual(CountingCorpus.Builds, 1)
+
+    def testIndexRebuiltWhenCorpusGrows(self):
+        CountingCorpus(self.Path).Close()
+        added = ("added", [[1], [1]], [[2]])
+        PuzzleFiles.WriteCorpus(self.Path, self.Puzzles + [added])
+        with CountingCorpus(self.Path) as corpus:
+            self.assertEqual(CountingCorpus.Builds, 2)
+            self.assertEqual(len(corpus), len(self.Puzzles) + 1)
+            self.assertEqual(corpus.Get("added"), added[1:])
+
+    # A corpus rewritten to the same size is only told apart by its modification time
+    def testIndexRebuiltWhenCorpusChangesInPlace(self):
+        CountingCorpus(self.Path).Close()
+        status = os.stat(self.Path)
+        renamed = [(name.replace("5x5", "5X5"), columnRules, rowRules) for name, columnRules, rowRules in self.Puzzles]
+        PuzzleFiles.WriteCorpus(self.Path, renamed)
+        os.utime(self.Path, ns = (status.st_atime_ns, status.st_mtime_ns + 1000000000))
+        self.assertEqual(os.path.getsize(self.Path), status.st_size)
+        with CountingCorpus(self.Path) as corpus:
+            self.assertEqual(CountingCorpus.Builds, 2)
+            self.assertEqual(corpus.Get("5X5-3"), renamed[2][1:])
+            with self.assertRaises(KeyError):
+                corpus.Get("5x5-3")
+
+    def testEmptyCorpus(self):
+        PuzzleFiles.WriteCorpus(self.Path, [])
+        with CountingCorpus(self.Path) as corpus:
+            self.assertEqual(len(corpus), 0)
+            self.assertEqual(list(corpus.Iterate()), [])
+
+if __name__ == "__main__":
+    unittest.main()
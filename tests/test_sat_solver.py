@@ -0,0 +1,163 @@
+import itertools
+import random
+import unittest
+
+import SatSolver
+from Board import BoardLogic, BoardPuzzle, BoardStructure, LineEncoding, SolveStatus
+from Puzzles import PUZZLES
+
+#
+# Checks CdclSolver against brute force on small random CNFs, and NonogramCnf end to end through BoardLogic.SolveSat().
+#
+
+def Satisfies(assignment, clause):
+    for literal in clause:
+        if((literal > 0) == bool(assignment >> (abs(literal) - 1) & 1)):
+            return True
+    return False
+
+def BruteForce(variableCount, clauses):
+    for assignment in range(1 << variableCount):
+        if(all(Satisfies(assignment, clause) for clause in clauses)):
+            return True
+    return False
+
+def RandomCnf(generator, variableCount, clauseCount):
+    clauses = []
+    for i in range(clauseCount):
+        size = generator.randint(1, 4) if generator.random() < 0.2 else 3
+        clauses.append([generator.randint(1, variableCount) * generator.choice([1, -1]) for j in range(size)])
+    return clauses
+
+def RulesOfLine(cells):
+    return [len(run) for run in "".join("1" if cell else "0" for cell in cells).split("0") if run != ""]
+
+def BuildPuzzle(columnRules, rowRules):
+    puzzle = BoardPuzzle(len(rowRules), len(columnRules))
+    puzzle.setColumns(columnRules)
+    puzzle.setRows(rowRules)
+    return puzzle
+
+# Whether any grid has these rules, trying only the rows that fit their own rules
+def Solvable(columnRules, rowRules):
+    width = len(columnRules)
+    rowOptions = []
+    for rules in rowRules:
+        rowOptions.append([row for row in itertools.product([False, True], repeat = width) if RulesOfLine(row) == list(rules)])
+    for rows in itertools.product(*rowOptions):
+        if(all(RulesOfLine([row[i] for row in rows]) == list(columnRules[i]) for i in range(width))):
+            return True
+    return False
+
+class CdclSolverTest(unittest.TestCase):
+
+    def Check(self, variableCount, clauses, restartBase = None, maxLearned = None):
+        solver = SatSolver.CdclSolver()
+        if(restartBase != None):
+            solver.RestartBase = restartBase
+        if(maxLearned != None):
+            solver.MaxLearned = maxLearned
+        for i in range(variableCount):
+            solver.NewVariable()
+        for clause in clauses:
+            solver.AddClause(clause)
+        result = solver.Solve()
+        self.assertEqual(result, BruteForce(variableCount, clauses), clauses)
+        if(result):
+            assignment = sum(1 << (variable - 1) for variable in range(1, variableCount + 1) if solver.Value(variable))
+            for clause in clauses:
+                self.assertTrue(Satisfies(assignment, clause), (clauses, clause))
+
+    def testLuby(self):
+        self.assertEqual([SatSolver.Luby(i) for i in range(15)], [1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8])
+
+    # Around 4.3 clauses per variable half of the random 3-SAT formulas are satisfiable, so both answers come up often
+    def testRandomCnfs(self):
+        generator = random.Random(11)
+        results = set()
+        for case in range(600):
+            variableCount = generator.randint(1, 10)
+            clauses = RandomCnf(generator, variableCount, int(variableCount * generator.uniform(2.0, 6.5)))
+            self.Check(variableCount, clauses)
+            results.add(BruteForce(variableCount, clauses))
+        self.assertEqual(results, {True, False})
+
+    # Restarting after every conflict and keeping almost no learned clauses runs the restart and clause deletion code all the time
+    def testRestartsAndClauseDeletion(self):
+        generator = random.Random(13)
+        for case in range(60):
+            variableCount = generator.randint(10, 14)
+            self.Check(variableCount, RandomCnf(generator, variableCount, int(variableCount * 4.3)), restartBase = 1, maxLearned = 2)
+
+    def testPigeonhole(self):
+        # Four pigeons in three holes: every pigeon is in a hole and no two pigeons share one
+        holes = 3
+        variable = lambda pigeon, hole: pigeon * holes + hole + 1
+        clauses = [[variable(pigeon, hole) for hole in range(holes)] for pigeon in range(holes + 1)]
+        for hole in range(holes):
+            for first, second in itertools.combinations(range(holes + 1), 2):
+                clauses.append([-variable(first, hole), -variable(second, hole)])
+        self.Check((holes + 1) * holes, clauses)
+
+    def testEmptyClause(self):
+        solver = SatSolver.CdclSolver()
+        solver.NewVariable()
+        self.assertFalse(solver.AddClause([]))
+        self.assertFalse(solver.Solve())
+
+    def testStopCheck(self):
+        solver = SatSolver.CdclSolver()
+        for i in range(3):
+            solver.NewVariable()
+        solver.AddClause([1, 2, 3])
+        self.assertEqual(solver.Solve(lambda: True), None)
+
+class NonogramCnfTest(unittest.TestCase):
+
+    def Solve(self, columnRules, rowRules):
+        solver = BoardLogic(BoardStructure(BuildPuzzle(columnRules, rowRules), None, LineEncoding.BITMASK))
+        return (solver.SolveSat(), solver)
+
+    def testPuzzles(self):
+        for name, (columnRules, rowRules) in PUZZLES.items():
+            status, solver = self.Solve(columnRules, rowRules)
+            self.assertEqual(status, SolveStatus.SOLVED, name)
+            self.assertTrue(solver.IsValid() and solver.IsSolved(), name)
+
+    def testNoSolution(self):
+        # Swapping the first two rows and the first two columns of 15x15-27 leaves no solution
+        columnRules, rowRules = PUZZLES["15x15-27"]
+        columnRules = [columnRules[1], columnRules[0]] + list(columnRules[2:])
+        rowRules = [rowRules[1], rowRules[0]] + list(rowRules[2:])
+        status, solver = self.Solve(columnRules, rowRules)
+        self.assertEqual(status, SolveStatus.CONTRADICTION)
+        # The totals of the rows and columns agree here, so only the placement rules out a solution
+        status, solver = self.Solve([[1, 1], [], [1, 1]], [[3], [], [1]])
+        self.assertFalse(Solvable([[1, 1], [], [1, 1]], [[3], [], [1]]))
+        self.assertEqual(status, SolveStatus.CONTRADICTION)
+
+    # Small random puzzles, half of them with a rule changed so some have no solution, against brute force
+    def testRandomPuzzles(self):
+        generator = random.Random(17)
+        results = set()
+        for case in range(150):
+            rowCount = generator.randint(1, 4)
+            columnCount = generator.randint(1, 4)
+            grid = [[generator.random() < 0.5 for column in range(columnCount)] for row in range(rowCount)]
+            rowRules = [RulesOfLine(row) for row in grid]
+            columnRules = [RulesOfLine([row[column] for row in grid]) for column in range(columnCount)]
+            if(generator.random() < 0.5):
+                row = generator.randrange(rowCount)
+                rowRules[row] = RulesOfLine([generator.random() < 0.5 for column in range(columnCount)])
+            cnf = SatSolver.NonogramCnf(columnRules, rowRules)
+            rows = cnf.Solve()
+            solvable = Solvable(columnRules, rowRules)
+            results.add(solvable)
+            self.assertEqual(rows != False, solvable, (columnRules, rowRules))
+            if(solvable):
+                self.assertEqual([RulesOfLine(row) for row in rows], rowRules)
+                self.assertEqual([RulesOfLine([row[column] for row in rows]) for column in range(columnCount)], columnRules)
+        self.assertEqual(results, {True, False})
+
+if __name__ == "__main__":
+    unittest.main()